@@ -1,6 +1,8 @@
 """
 Test data for SauceDemo application tests.
 """
+from utils.test_utils import EnvironmentUtils
+
 
 # Valid user credentials
 VALID_USERS = {
@@ -65,32 +67,44 @@ EXPECTED_PRODUCTS = [
     {
         "name": "Sauce Labs Backpack",
         "price": "$29.99",
-        "id": "sauce-labs-backpack"
+        "id": "sauce-labs-backpack",
+        "item_id": 4,
+        "description": "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."
     },
     {
         "name": "Sauce Labs Bike Light",
         "price": "$9.99", 
-        "id": "sauce-labs-bike-light"
+        "id": "sauce-labs-bike-light",
+        "item_id": 0,
+        "description": "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."
     },
     {
         "name": "Sauce Labs Bolt T-Shirt",
         "price": "$15.99",
-        "id": "sauce-labs-bolt-t-shirt"
+        "id": "sauce-labs-bolt-t-shirt",
+        "item_id": 1,
+        "description": "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."
     },
     {
         "name": "Sauce Labs Fleece Jacket",
         "price": "$49.99",
-        "id": "sauce-labs-fleece-jacket"
+        "id": "sauce-labs-fleece-jacket",
+        "item_id": 5,
+        "description": "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."
     },
     {
         "name": "Sauce Labs Onesie",
         "price": "$7.99",
-        "id": "sauce-labs-onesie"
+        "id": "sauce-labs-onesie",
+        "item_id": 2,
+        "description": "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."
     },
     {
         "name": "Test.allTheThings() T-Shirt (Red)",
         "price": "$15.99",
-        "id": "test.allthethings()-t-shirt-(red)"
+        "id": "test.allthethings()-t-shirt-(red)",
+        "item_id": 3,
+        "description": "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton."
     }
 ]
 
@@ -110,15 +124,17 @@ ERROR_MESSAGES = {
     "empty_password": "Password is required"
 }
 
-# URLs
+# URLs (resolved through EnvironmentUtils so BASE_URL / LOCAL_SERVER apply)
+BASE_URL = EnvironmentUtils.get_base_url()
+
 URLS = {
-    "base_url": "https://www.saucedemo.com",
-    "login": "https://www.saucedemo.com/",
-    "inventory": "https://www.saucedemo.com/inventory.html",
-    "cart": "https://www.saucedemo.com/cart.html",
-    "checkout_step_one": "https://www.saucedemo.com/checkout-step-one.html",
-    "checkout_step_two": "https://www.saucedemo.com/checkout-step-two.html",
-    "checkout_complete": "https://www.saucedemo.com/checkout-complete.html"
+    "base_url": BASE_URL,
+    "login": f"{BASE_URL}/",
+    "inventory": f"{BASE_URL}/inventory.html",
+    "cart": f"{BASE_URL}/cart.html",
+    "checkout_step_one": f"{BASE_URL}/checkout-step-one.html",
+    "checkout_step_two": f"{BASE_URL}/checkout-step-two.html",
+    "checkout_complete": f"{BASE_URL}/checkout-complete.html"
 }
 
 # Test timeouts (in milliseconds)
@@ -4,6 +4,7 @@ Simple smoke test to verify the project setup.
 import asyncio
 from playwright.async_api import async_playwright
 from pages import LoginPage, InventoryPage
+from utils.network_profiles import NetworkRouter
 
 
 async def test_basic_login():
@@ -11,6 +12,7 @@ async def test_basic_login():
     async with async_playwright() as playwright:
         browser = await playwright.chromium.launch(headless=True)
         context = await browser.new_context()
+        await NetworkRouter.from_environment().install(context)
         page = await context.new_page()
         
         # Initialize page objects
@@ -30,8 +32,8 @@ async def test_basic_login():
             await login_page.login("standard_user", "secret_sauce")
             print("✅ Login attempt completed")
             
-            # Wait a moment for redirect
-            await page.wait_for_timeout(2000)
+            # Wait for the redirect to the inventory page to settle
+            await inventory_page.wait_for_url_settled("**/inventory.html")
             
             # Check if we're on inventory page
             is_inventory_loaded = await inventory_page.is_inventory_page_loaded()
@@ -0,0 +1,7 @@
+"""
+Load driver package.
+
+Import the driver from loadtest.driver and the journeys from
+loadtest.journeys. This file stays import-free so that `python -m loadtest`
+can set LOCAL_SERVER before data and pages read the base URL.
+"""
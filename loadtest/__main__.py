@@ -0,0 +1,62 @@
+"""
+Run the multi-user load driver from the command line.
+
+Usage:
+    python -m loadtest --users 10 --ramp-up 20 --steady 60 --journey shop
+    python -m loadtest --local-server --users 20
+"""
+import argparse
+import asyncio
+import os
+
+from utils.test_utils import EnvironmentUtils, TestUtils
+
+
+def main() -> None:
+    """Parse arguments, run the load test and print the report."""
+    parser = argparse.ArgumentParser(description="Concurrent multi-user load driver")
+    parser.add_argument("--users", type=int, default=5, help="Concurrent virtual users")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Ramp-up phase in seconds")
+    parser.add_argument("--steady", type=float, default=30.0, help="Steady-state phase in seconds")
+    parser.add_argument("--journey", default="shop", help="Journey to repeat (login, browse, shop)")
+    parser.add_argument("--user", default="standard_user", help="Key of VALID_USERS to log in as")
+    parser.add_argument("--think-time-ms", type=int, default=0, help="Pause between journeys")
+    parser.add_argument("--window", type=float, default=5.0, help="Reporting window in seconds")
+    parser.add_argument(
+        "--local-server", action="store_true",
+        help="Start the stand-in server and run against it"
+    )
+    args = parser.parse_args()
+
+    if args.local_server:
+        # Before the imports below: data.test_data computes its URLS on import
+        os.environ["LOCAL_SERVER"] = "true"
+
+    from server import StandInServer
+    from .driver import LoadConfig, LoadDriver, format_report
+
+    config = LoadConfig(
+        users=args.users,
+        ramp_up_s=args.ramp_up,
+        steady_s=args.steady,
+        journey=args.journey,
+        username=args.user,
+        think_time_ms=args.think_time_ms,
+        window_s=args.window
+    )
+    server = StandInServer.from_environment().start() if args.local_server else None
+    try:
+        print(f"🚀 {config.users} users on {EnvironmentUtils.get_base_url()} ({config.journey})")
+        report = asyncio.run(LoadDriver(config).run())
+    finally:
+        if server:
+            server.stop()
+
+    for line in format_report(report):
+        print(line)
+    path = TestUtils.save_test_results(report, f"load_report_{TestUtils.get_timestamp()}.json")
+    print(f"📄 Report saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Concurrent multi-user load driver built on the async page objects.
+
+Virtual users share one browser, each with its own context, and repeat a
+journey until the run ends. Users start evenly spread over the ramp-up
+phase; the steady-state phase follows. Step latencies, completed journeys
+and errors are bucketed per time window and per phase.
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from playwright.async_api import Browser, async_playwright
+
+from data.test_data import VALID_USERS
+from pages import InventoryPage, LoginPage
+from utils.action_timing import LatencyHistogram, set_tags
+from utils.network_profiles import NetworkRouter
+from utils.test_utils import EnvironmentUtils
+
+from .journeys import JOURNEYS, STEPS, Session
+
+PERCENTILES = (50, 95, 99)
+
+
+class LoadConfig(NamedTuple):
+    """Shape of a load run."""
+
+    users: int = 5
+    ramp_up_s: float = 10.0
+    steady_s: float = 30.0
+    journey: str = "shop"
+    username: str = "standard_user"
+    think_time_ms: int = 0
+    window_s: float = 5.0
+
+
+class LoadStats:
+    """Step latencies and outcomes bucketed by time window and phase."""
+
+    def __init__(self, ramp_up_s: float, window_s: float):
+        """
+        Initialize the statistics.
+
+        Args:
+            ramp_up_s: Length of the ramp-up phase in seconds
+            window_s: Length of a reporting window in seconds
+        """
+        self.ramp_up_s = ramp_up_s
+        self.window_s = window_s
+        self.started = time.perf_counter()
+        self.windows: Dict[int, Dict[str, Any]] = {}
+        self.phases: Dict[str, Dict[str, Any]] = {}
+
+    def _bucket(self, table: Dict, key: Any) -> Dict[str, Any]:
+        if key not in table:
+            table[key] = {"journeys": 0, "steps": 0, "errors": 0,
+                          "latency": LatencyHistogram(), "by_step": {}}
+        return table[key]
+
+    def record_step(self, step: str, ms: float, ok: bool) -> None:
+        """
+        Record one finished step.
+
+        Args:
+            step: Step name
+            ms: Step duration in milliseconds
+            ok: False if the step raised
+        """
+        offset = time.perf_counter() - self.started
+        phase = "ramp-up" if offset < self.ramp_up_s else "steady"
+        for bucket in (self._bucket(self.windows, int(offset // self.window_s)),
+                       self._bucket(self.phases, phase)):
+            bucket["steps"] += 1
+            if not ok:
+                bucket["errors"] += 1
+                continue
+            bucket["latency"].add(ms)
+            bucket["by_step"].setdefault(step, LatencyHistogram()).add(ms)
+
+    def record_journey(self) -> None:
+        """Record one completed journey."""
+        offset = time.perf_counter() - self.started
+        phase = "ramp-up" if offset < self.ramp_up_s else "steady"
+        self._bucket(self.windows, int(offset // self.window_s))["journeys"] += 1
+        self._bucket(self.phases, phase)["journeys"] += 1
+
+    def report(self, steady_s: float) -> Dict[str, Any]:
+        """
+        Build the run report.
+
+        Args:
+            steady_s: Length of the steady-state phase in seconds
+
+        Returns:
+            Per-window timeline and per-phase summaries
+        """
+        def summary(bucket: Dict[str, Any], seconds: float) -> Dict[str, Any]:
+            return {
+                "journeys": bucket["journeys"],
+                "throughput_per_s": round(bucket["journeys"] / seconds, 3) if seconds else 0.0,
+                "steps": bucket["steps"],
+                "error_rate": round(bucket["errors"] / bucket["steps"], 4) if bucket["steps"] else 0.0,
+                **{f"p{p}_ms": round(bucket["latency"].percentile(p), 1) for p in PERCENTILES},
+                "by_step": {
+                    step: {f"p{p}_ms": round(h.percentile(p), 1) for p in PERCENTILES}
+                    for step, h in sorted(bucket["by_step"].items())
+                },
+            }
+
+        durations = {"ramp-up": self.ramp_up_s, "steady": steady_s}
+        return {
+            "timeline": [
+                {"start_s": index * self.window_s, **summary(bucket, self.window_s)}
+                for index, bucket in sorted(self.windows.items())
+            ],
+            "phases": {
+                phase: summary(bucket, durations[phase])
+                for phase, bucket in self.phases.items()
+            },
+        }
+
+
+class LoadDriver:
+    """Runs virtual users through a journey on a shared browser."""
+
+    def __init__(self, config: LoadConfig):
+        """
+        Initialize the driver.
+
+        Args:
+            config: Shape of the run
+
+        Raises:
+            ValueError: If the journey or user is unknown
+        """
+        if config.journey not in JOURNEYS:
+            raise ValueError(f"Unknown journey '{config.journey}', expected one of {list(JOURNEYS)}")
+        if config.username not in VALID_USERS:
+            raise ValueError(f"Unknown user '{config.username}', expected one of {list(VALID_USERS)}")
+        self.config = config
+        self.stats = LoadStats(config.ramp_up_s, config.window_s)
+        self.router = NetworkRouter.from_environment()
+        self._deadline = 0.0
+
+    async def run(self, browser: Optional[Browser] = None) -> Dict[str, Any]:
+        """
+        Run the load test.
+
+        Args:
+            browser: Browser to share, launched from the environment if omitted
+
+        Returns:
+            The run report
+        """
+        if browser is None:
+            async with async_playwright() as playwright:
+                launcher = getattr(playwright, EnvironmentUtils.get_browser_name())
+                browser = await launcher.launch(headless=EnvironmentUtils.is_headless_mode())
+                try:
+                    return await self.run(browser)
+                finally:
+                    await browser.close()
+
+        config = self.config
+        self.stats = LoadStats(config.ramp_up_s, config.window_s)
+        self._deadline = self.stats.started + config.ramp_up_s + config.steady_s
+        spacing = config.ramp_up_s / config.users if config.users else 0
+        await asyncio.gather(*(
+            self._virtual_user(browser, index, index * spacing) for index in range(config.users)
+        ))
+        return {"config": config._asdict(), **self.stats.report(config.steady_s)}
+
+    async def _virtual_user(self, browser: Browser, index: int, delay_s: float) -> None:
+        """Start after the ramp-up delay and repeat the journey until the deadline."""
+        await asyncio.sleep(delay_s)
+        set_tags(test_id=f"load/vu{index}", browser=browser.browser_type.name,
+                 user=self.config.username)
+        credentials = VALID_USERS[self.config.username]
+        context = await browser.new_context()
+        await self.router.install(context)
+        page = await context.new_page()
+        session = Session(
+            LoginPage(page), InventoryPage(page),
+            credentials["username"], credentials["password"]
+        )
+        try:
+            while time.perf_counter() < self._deadline:
+                if await self._run_journey(session):
+                    self.stats.record_journey()
+                else:
+                    await context.clear_cookies()
+                if self.config.think_time_ms:
+                    await asyncio.sleep(self.config.think_time_ms / 1000)
+        finally:
+            await context.close()
+
+    async def _run_journey(self, session: Session) -> bool:
+        """Run every step of the journey, stopping at the first failure."""
+        for step in JOURNEYS[self.config.journey]:
+            start = time.perf_counter()
+            try:
+                await STEPS[step](session)
+            except Exception:
+                self.stats.record_step(step, (time.perf_counter() - start) * 1000, ok=False)
+                session.inventory_page.invalidate_snapshot()
+                return False
+            self.stats.record_step(step, (time.perf_counter() - start) * 1000, ok=True)
+        return True
+
+
+def format_report(report: Dict[str, Any]) -> List[str]:
+    """
+    Format a run report as printable lines.
+
+    Args:
+        report: Result of LoadDriver.run()
+
+    Returns:
+        Timeline and phase summary lines
+    """
+    lines = [f"{'window':>8}{'journeys/s':>12}{'errors':>9}{'p50':>9}{'p95':>9}{'p99':>9}"]
+    for window in report["timeline"]:
+        lines.append(
+            f"{window['start_s']:>7.0f}s{window['throughput_per_s']:>12}"
+            f"{window['error_rate']:>9.1%}{window['p50_ms']:>9}{window['p95_ms']:>9}{window['p99_ms']:>9}"
+        )
+    for phase, summary in report["phases"].items():
+        lines.append(
+            f"{phase}: {summary['journeys']} journeys, {summary['throughput_per_s']}/s, "
+            f"error rate {summary['error_rate']:.1%}"
+        )
+        for step, percentiles in summary["by_step"].items():
+            lines.append(
+                f"  {step:<8} " + "  ".join(f"{k[:-3]}={v}ms" for k, v in percentiles.items())
+            )
+    return lines
@@ -0,0 +1,77 @@
+"""
+Journeys run by the load driver's virtual users.
+
+A journey is a list of step names; each step is a coroutine driving the
+async page objects of one virtual user.
+"""
+from typing import Awaitable, Callable, Dict, List
+
+from data.test_data import EXPECTED_PRODUCTS, SORT_OPTIONS, TIMEOUTS
+from pages import InventoryPage, LoginPage
+
+
+class Session:
+    """Page objects and credentials of one virtual user."""
+
+    def __init__(self, login_page: LoginPage, inventory_page: InventoryPage,
+                 username: str, password: str):
+        """
+        Initialize the session.
+
+        Args:
+            login_page: Login page object of the user's page
+            inventory_page: Inventory page object of the user's page
+            username: Username to log in with
+            password: Password to log in with
+        """
+        self.login_page = login_page
+        self.inventory_page = inventory_page
+        self.username = username
+        self.password = password
+
+
+async def login(session: Session) -> None:
+    """Open the login page and log in until products are shown."""
+    await session.login_page.navigate_to_login()
+    await session.login_page.login(session.username, session.password)
+    await session.inventory_page.wait_for_element(
+        session.inventory_page.inventory_list, timeout=TIMEOUTS["performance_glitch"]
+    )
+
+
+async def browse(session: Session) -> None:
+    """Read every product on the inventory page."""
+    await session.inventory_page.snapshot(refresh=True)
+
+
+async def sort(session: Session) -> None:
+    """Sort by price and back to name."""
+    await session.inventory_page.sort_products(SORT_OPTIONS["price_low_high"])
+    await session.inventory_page.sort_products(SORT_OPTIONS["name_az"])
+
+
+async def cart(session: Session) -> None:
+    """Add a product to the cart and remove it again."""
+    product = EXPECTED_PRODUCTS[0]["name"]
+    await session.inventory_page.add_product_to_cart_by_name(product)
+    await session.inventory_page.remove_product_from_cart_by_name(product)
+
+
+async def logout(session: Session) -> None:
+    """Log out through the menu."""
+    await session.inventory_page.logout()
+
+
+STEPS: Dict[str, Callable[[Session], Awaitable[None]]] = {
+    "login": login,
+    "browse": browse,
+    "sort": sort,
+    "cart": cart,
+    "logout": logout,
+}
+
+JOURNEYS: Dict[str, List[str]] = {
+    "login": ["login", "logout"],
+    "browse": ["login", "browse", "logout"],
+    "shop": ["login", "browse", "sort", "cart", "logout"],
+}
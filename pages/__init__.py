@@ -2,11 +2,16 @@
 Page objects initialization file.
 """
 from .base_page import BasePage
+from .locators import Element, registry
 from .login_page import LoginPage
-from .inventory_page import InventoryPage
+from .inventory_page import InventoryPage, InventorySnapshot, ProductSnapshot
 
 __all__ = [
     "BasePage",
+    "Element",
+    "registry",
     "LoginPage",
     "InventoryPage",
+    "InventorySnapshot",
+    "ProductSnapshot",
 ]
\ No newline at end of file
@@ -1,13 +1,29 @@
 """
 Base page class containing common functionality for all page objects.
 """
-from typing import Optional
+import os
+from typing import Any, Dict, List, Optional
 from playwright.async_api import Page, Locator
+from utils.action_timing import instrument_class
+from utils.har_replay import get_har_archive
+from utils.page_metrics import recorder as page_metrics
+from utils.screenshots import EXTENSIONS, SCREENSHOT_DIR
+from utils.test_utils import EnvironmentUtils
+from . import performance, waits
+from .locators import Element, collect_elements
 
 
 class BasePage:
     """Base page class with common methods and properties."""
     
+    # Element declarations of this page class, name -> Element
+    _elements: Dict[str, Element] = {}
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._elements = collect_elements(cls)
+        instrument_class(cls)
+    
     def __init__(self, page: Page) -> None:
         """
         Initialize the base page.
@@ -16,16 +32,88 @@ class BasePage:
             page: Playwright page object
         """
         self.page = page
-        self.base_url = "https://www.saucedemo.com"
+        self.base_url = EnvironmentUtils.get_base_url()
+        self._locators: Dict[str, Locator] = {}
+    
+    @classmethod
+    def elements(cls) -> Dict[str, str]:
+        """
+        Get the elements declared on this page class.
+        
+        Returns:
+            Mapping of element name to selector
+        """
+        return {name: element.selector for name, element in cls._elements.items()}
+    
+    def locator(self, selector: str) -> Locator:
+        """
+        Get the cached Locator for a selector, building it on first use.
+        
+        Locators are lazy in Playwright, so one instance stays valid across
+        navigations and can be shared by every helper call.
+        
+        Args:
+            selector: Element selector
+            
+        Returns:
+            Playwright Locator object
+        """
+        cached = self._locators.get(selector)
+        if cached is None:
+            cached = self._locators[selector] = self.page.locator(selector)
+        return cached
+    
+    def element(self, name: str) -> Locator:
+        """
+        Get the Locator of a declared element by name.
+        
+        Args:
+            name: Element name as declared on the page class
+            
+        Returns:
+            Playwright Locator object
+            
+        Raises:
+            KeyError: If the page declares no such element
+        """
+        if name not in self._elements:
+            raise KeyError(f"{type(self).__name__} declares no element '{name}'")
+        return self.locator(self._elements[name].selector)
     
     async def navigate_to(self, url: str) -> None:
         """
         Navigate to a specific URL.
         
+        When HAR_MODE is enabled and the page does not route from an archive
+        yet, the archive of this page object class is installed first. With
+        PAGE_METRICS enabled the load's performance metrics are recorded.
+        
         Args:
             url: The URL to navigate to
         """
+        har = get_har_archive()
+        if har.is_active and not har.is_installed(self.page):
+            options = har.options(type(self).__name__)
+            if options:
+                await self.page.route_from_har(**options)
+            har.mark_installed(self.page)
         await self.page.goto(url)
+        if page_metrics.enabled:
+            await self.record_page_metrics("navigate_to")
+    
+    async def record_page_metrics(self, action: str, **extra) -> dict:
+        """
+        Record the performance metrics of the current document.
+        
+        Args:
+            action: Page object method that caused the load
+            **extra: Additional fields to store with the metrics
+            
+        Returns:
+            The stored metrics record
+        """
+        metrics = await performance.collect(self.page)
+        return page_metrics.record(f"{type(self).__name__}.{action}", metrics, **extra)
     
     async def get_title(self) -> str:
         """
@@ -47,7 +135,7 @@ class BasePage:
         Returns:
             Playwright Locator object
         """
-        element = self.page.locator(locator)
+        element = self.locator(locator)
         await element.wait_for(state="visible", timeout=timeout)
         return element
     
@@ -58,7 +146,7 @@ class BasePage:
         Args:
             locator: Element selector
         """
-        await self.page.locator(locator).click()
+        await self.locator(locator).click()
     
     async def fill_input(self, locator: str, text: str) -> None:
         """
@@ -68,7 +156,7 @@ class BasePage:
             locator: Element selector
             text: Text to fill
         """
-        await self.page.locator(locator).fill(text)
+        await self.locator(locator).fill(text)
     
     async def get_text(self, locator: str) -> str:
         """
@@ -80,11 +168,14 @@ class BasePage:
         Returns:
             Text content
         """
-        return await self.page.locator(locator).text_content() or ""
+        return await self.locator(locator).text_content() or ""
     
     async def is_element_visible(self, locator: str) -> bool:
         """
-        Check if an element is visible.
+        Check if an element is visible, waiting up to 3 seconds for it.
+        
+        Use for positive checks; negative checks should use is_visible_now
+        or expect_hidden instead of waiting out the timeout.
         
         Args:
             locator: Element selector
@@ -93,21 +184,169 @@ class BasePage:
             True if element is visible, False otherwise
         """
         try:
-            await self.page.locator(locator).wait_for(state="visible", timeout=3000)
+            await self.locator(locator).wait_for(state="visible", timeout=3000)
             return True
         except Exception:
             return False
     
-    async def take_screenshot(self, name: str) -> str:
+    async def wait_for_list_order_change(
+        self, locator: str, previous: List[str], timeout: int = waits.DEFAULT_TIMEOUT
+    ) -> List[str]:
+        """
+        Wait until the order (or texts) of a list of elements changes.
+        
+        Args:
+            locator: Element selector of the list entries
+            previous: Entry texts read before the action
+            timeout: Timeout in milliseconds
+            
+        Returns:
+            The new entry texts
+        """
+        return await waits.list_order_changed(self.page, locator, previous, timeout)
+    
+    async def wait_for_badge_count(
+        self, locator: str, count: int, timeout: int = waits.DEFAULT_TIMEOUT
+    ) -> None:
+        """
+        Wait until a badge shows a count, treating a missing badge as 0.
+        
+        Args:
+            locator: Element selector of the badge
+            count: Expected count
+            timeout: Timeout in milliseconds
+        """
+        await waits.badge_count(self.page, locator, count, timeout)
+    
+    async def wait_for_url_settled(
+        self,
+        url: Optional[str] = None,
+        quiet_ms: int = waits.DEFAULT_QUIET_MS,
+        timeout: int = waits.DEFAULT_TIMEOUT
+    ) -> str:
+        """
+        Wait until navigation finishes and client-side routing stops.
+        
+        Args:
+            url: Optional URL or glob pattern the page must reach first
+            quiet_ms: Navigation-free period that counts as settled
+            timeout: Timeout in milliseconds
+            
+        Returns:
+            The settled URL
+        """
+        if url:
+            await self.page.wait_for_url(url, timeout=timeout)
+        await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        return await waits.url_settled(self.page, quiet_ms, timeout)
+    
+    async def wait_for_dom_quiescent(
+        self,
+        root: str = "body",
+        quiet_ms: int = waits.DEFAULT_QUIET_MS,
+        timeout: int = waits.DEFAULT_TIMEOUT
+    ) -> None:
+        """
+        Wait until a DOM subtree stops changing.
+        
+        Args:
+            root: Element selector of the subtree to observe
+            quiet_ms: Mutation-free period that counts as settled
+            timeout: Timeout in milliseconds
+        """
+        await waits.dom_quiescent(self.page, root, quiet_ms, timeout)
+    
+    async def is_visible_now(self, locator: str) -> bool:
+        """
+        Check if an element is visible right now, without waiting.
+        
+        Use for negative checks where waiting would only burn the timeout.
+        
+        Args:
+            locator: Element selector
+            
+        Returns:
+            True if the first matching element is visible, False otherwise
+        """
+        return await self.locator(locator).first.is_visible()
+    
+    async def count_now(self, locator: str) -> int:
+        """
+        Count matching elements right now, without waiting.
+        
+        Args:
+            locator: Element selector
+            
+        Returns:
+            Number of matching elements
+        """
+        return await self.locator(locator).count()
+    
+    async def text_now(self, locator: str) -> str:
+        """
+        Get text content of an element right now, without waiting.
+        
+        Args:
+            locator: Element selector
+            
+        Returns:
+            Text content of the first match, empty string if none exists
+        """
+        texts = await self.locator(locator).all_text_contents()
+        return texts[0] if texts else ""
+    
+    async def expect_hidden(self, locator: str, timeout: int = 3000) -> None:
+        """
+        Wait until an element is hidden or absent.
+        
+        Args:
+            locator: Element selector
+            timeout: Timeout in milliseconds
+            
+        Raises:
+            TimeoutError: If the element is still visible after the timeout
+        """
+        await self.locator(locator).first.wait_for(state="hidden", timeout=timeout)
+    
+    async def expect_absent(self, locator: str, timeout: int = 3000) -> None:
+        """
+        Wait until an element is removed from the DOM.
+        
+        Args:
+            locator: Element selector
+            timeout: Timeout in milliseconds
+            
+        Raises:
+            TimeoutError: If the element is still attached after the timeout
+        """
+        await self.locator(locator).first.wait_for(state="detached", timeout=timeout)
+    
+    async def take_screenshot(self, name: str, image_type: str = "png",
+                              quality: Optional[int] = None, full_page: bool = False,
+                              clip: Optional[Dict[str, float]] = None) -> str:
         """
         Take a screenshot of the current page.
         
+        Unlike failure screenshots, the file is named after the caller's
+        name and is on disk when the call returns.
+        
         Args:
             name: Name for the screenshot file
+            image_type: "png" or "jpeg"
+            quality: JPEG quality 0-100, ignored for PNG
+            full_page: Capture the full scrollable page
+            clip: Region to capture, {"x", "y", "width", "height"}
             
         Returns:
-            Path to the screenshot file
+            Path to the screenshot file, test-results/screenshots/<name>.<ext>
         """
-        screenshot_path = f"test-results/screenshots/{name}.png"
-        await self.page.screenshot(path=screenshot_path)
-        return screenshot_path
\ No newline at end of file
+        path = os.path.join(SCREENSHOT_DIR, f"{name}.{EXTENSIONS[image_type]}")
+        options: Dict[str, Any] = {"type": image_type, "full_page": full_page}
+        if image_type == "jpeg" and quality is not None:
+            options["quality"] = quality
+        if clip is not None:
+            options["clip"] = clip
+        await self.page.screenshot(path=path, **options)
+        return path
+
+instrument_class(BasePage)
@@ -1,14 +1,92 @@
 """
 Inventory page object for SauceDemo application.
 """
-from typing import List, Optional
-from playwright.async_api import Page
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Union
+from playwright.async_api import Error as PlaywrightError, Page
+from . import state
 from .base_page import BasePage
+from .locators import Element
+
+# Reads every product, the cart badge and the sort selection in one evaluate.
+# Products are returned as compact [item_id, name, description, price, in_cart] rows.
+_SNAPSHOT_SCRIPT = """
+(s) => {
+    const text = (root, selector) => {
+        const el = root.querySelector(selector);
+        return el ? el.textContent : '';
+    };
+    const products = Array.from(document.querySelectorAll(s.item), (item) => {
+        const link = item.querySelector("a[id$='_title_link']");
+        const button = item.querySelector('button');
+        return [
+            link ? parseInt(link.id.split('_')[1], 10) : -1,
+            text(item, s.name),
+            text(item, s.description),
+            text(item, s.price),
+            !!button && button.matches(s.remove)
+        ];
+    });
+    const badge = document.querySelector(s.badge);
+    const sort = document.querySelector(s.sort);
+    return {
+        products,
+        badge: badge ? (parseInt(badge.textContent, 10) || 0) : 0,
+        sort: sort ? sort.value : ''
+    };
+}
+"""
+
+
+class ProductSnapshot(NamedTuple):
+    """State of one inventory item."""
+    
+    item_id: int
+    name: str
+    description: str
+    price_text: str
+    price: float
+    in_cart: bool
+
+
+class InventorySnapshot(NamedTuple):
+    """State of the inventory page captured in one round trip."""
+    
+    url: str
+    products: List[ProductSnapshot]
+    cart_count: int
+    sort_option: str
+    
+    def find(self, product_name: str) -> Optional[ProductSnapshot]:
+        """
+        Find a product by name.
+        
+        Args:
+            product_name: Name of the product
+            
+        Returns:
+            The product, or None if it is not listed
+        """
+        return next((p for p in self.products if p.name == product_name), None)
 
 
 class InventoryPage(BasePage):
     """Inventory page object containing product browsing functionality."""
     
+    # Locators
+    inventory_container = Element(".inventory_container", "Inventory container")
+    inventory_list = Element(".inventory_list", "Product list")
+    inventory_items = Element(".inventory_item", "Product cards")
+    item_names = Element(".inventory_item_name", "Product names")
+    item_descriptions = Element(".inventory_item_desc", "Product descriptions")
+    item_prices = Element(".inventory_item_price", "Product prices")
+    add_to_cart_buttons = Element("button[id^='add-to-cart']", "Add to cart buttons")
+    remove_buttons = Element("button[id^='remove']", "Remove buttons")
+    shopping_cart_link = Element(".shopping_cart_link", "Shopping cart link")
+    shopping_cart_badge = Element(".shopping_cart_badge", "Cart item count badge")
+    product_sort_dropdown = Element(".product_sort_container", "Sort dropdown")
+    menu_button = Element("#react-burger-menu-btn", "Hamburger menu button")
+    logout_link = Element("#logout_sidebar_link", "Logout menu link")
+    
     def __init__(self, page: Page) -> None:
         """
         Initialize the inventory page.
@@ -18,23 +96,47 @@ class InventoryPage(BasePage):
         """
         super().__init__(page)
         
-        # Locators
-        self.inventory_container = ".inventory_container"
-        self.inventory_list = ".inventory_list"
-        self.inventory_items = ".inventory_item"
-        self.item_names = ".inventory_item_name"
-        self.item_descriptions = ".inventory_item_desc"
-        self.item_prices = ".inventory_item_price"
-        self.add_to_cart_buttons = "button[id^='add-to-cart']"
-        self.remove_buttons = "button[id^='remove']"
-        self.shopping_cart_link = ".shopping_cart_link"
-        self.shopping_cart_badge = ".shopping_cart_badge"
-        self.product_sort_dropdown = ".product_sort_container"
-        self.menu_button = "#react-burger-menu-btn"
-        self.logout_link = "#logout_sidebar_link"
-        
         # Inventory URL
         self.inventory_url = f"{self.base_url}/inventory.html"
+        
+        # Last snapshot, dropped by every mutating action
+        self._snapshot: Optional[InventorySnapshot] = None
+    
+    async def snapshot(self, refresh: bool = False) -> InventorySnapshot:
+        """
+        Capture all products, the cart badge and the sort selection.
+        
+        The snapshot is cached until a mutating action or navigate_to runs,
+        or the page URL changes.
+        
+        Args:
+            refresh: Ignore the cached snapshot
+            
+        Returns:
+            Inventory snapshot
+        """
+        cached = self._snapshot
+        if cached is not None and not refresh and cached.url == self.page.url:
+            return cached
+        
+        snapshot = parse_snapshot(self.page.url, await read_snapshot(self.page))
+        # An empty list usually means the page has not rendered yet; don't cache it
+        self._snapshot = snapshot if snapshot.products else None
+        return snapshot
+    
+    def invalidate_snapshot(self) -> None:
+        """Drop the cached snapshot after the page state changed."""
+        self._snapshot = None
+    
+    async def navigate_to(self, url: str) -> None:
+        """
+        Navigate to a specific URL, dropping the cached snapshot.
+        
+        Args:
+            url: The URL to navigate to
+        """
+        self.invalidate_snapshot()
+        await super().navigate_to(url)
     
     async def is_inventory_page_loaded(self) -> bool:
         """
@@ -55,8 +157,7 @@ class InventoryPage(BasePage):
         Returns:
             List of product names
         """
-        names = await self.page.locator(self.item_names).all_text_contents()
-        return names
+        return [product.name for product in (await self.snapshot()).products]
     
     async def get_product_prices(self) -> List[str]:
         """
@@ -65,8 +166,7 @@ class InventoryPage(BasePage):
         Returns:
             List of product prices
         """
-        prices = await self.page.locator(self.item_prices).all_text_contents()
-        return prices
+        return [product.price_text for product in (await self.snapshot()).products]
     
     async def get_product_count(self) -> int:
         """
@@ -75,64 +175,130 @@ class InventoryPage(BasePage):
         Returns:
             Number of products
         """
-        return await self.page.locator(self.inventory_items).count()
+        return len((await self.snapshot()).products)
     
-    async def add_product_to_cart_by_name(self, product_name: str) -> None:
+    async def add_product_to_cart_by_name(self, product_name: str, wait: bool = True) -> None:
         """
         Add a product to cart by its name.
         
         Args:
             product_name: Name of the product to add
+            wait: Wait for the cart badge to count the product. The wait is
+                best effort: clicks of quirky users (problem_user,
+                error_user) may leave the cart unchanged.
         """
         # Find the product item containing the name
-        product_locator = self.page.locator(self.inventory_items).filter(
+        product_locator = self.locator(self.inventory_items).filter(
             has_text=product_name
         )
         
         # Click the add to cart button within that product
-        add_button = product_locator.locator("button[id^='add-to-cart']")
+        count_before = await self.get_cart_badge_count()
+        add_button = product_locator.locator(self.add_to_cart_buttons)
+        self.invalidate_snapshot()
         await add_button.click()
+        if wait:
+            await self._settle_badge_count(count_before + 1)
     
-    async def remove_product_from_cart_by_name(self, product_name: str) -> None:
+    async def remove_product_from_cart_by_name(self, product_name: str, wait: bool = True) -> None:
         """
         Remove a product from cart by its name.
         
         Args:
             product_name: Name of the product to remove
+            wait: Wait for the cart badge to drop the product, best effort
+                like in add_product_to_cart_by_name
         """
         # Find the product item containing the name
-        product_locator = self.page.locator(self.inventory_items).filter(
+        product_locator = self.locator(self.inventory_items).filter(
             has_text=product_name
         )
         
         # Click the remove button within that product
-        remove_button = product_locator.locator("button[id^='remove']")
+        count_before = await self.get_cart_badge_count()
+        remove_button = product_locator.locator(self.remove_buttons)
+        self.invalidate_snapshot()
         await remove_button.click()
+        if wait:
+            await self._settle_badge_count(count_before - 1)
+    
+    async def _settle_badge_count(self, count: int) -> None:
+        """Wait for the cart badge to show a count, leaving the check to the caller on timeout."""
+        try:
+            await self.wait_for_badge_count(self.shopping_cart_badge, count)
+        except PlaywrightError:
+            pass
     
     async def get_cart_badge_count(self) -> int:
         """
-        Get the shopping cart badge count.
+        Get the shopping cart badge count, read live from the page.
         
         Returns:
             Cart badge count, 0 if no badge is visible
         """
-        if await self.is_element_visible(self.shopping_cart_badge):
-            badge_text = await self.get_text(self.shopping_cart_badge)
-            return int(badge_text) if badge_text.isdigit() else 0
-        return 0
+        text = await self.text_now(self.shopping_cart_badge)
+        return int(text) if text.strip().isdigit() else 0
+    
+    async def seed_cart(self, products: Iterable[Union[str, int]]) -> bool:
+        """
+        Put products in the cart without the UI by writing localStorage.
+        
+        On the app's origin the cart is replaced right away; otherwise an
+        init script seeds it on the first load. Either way it shows after
+        the next navigation. Use add_product_to_cart_by_name for tests of
+        the click itself.
+        
+        Args:
+            products: Product names from EXPECTED_PRODUCTS, or item ids
+            
+        Returns:
+            True if an init script was installed (pooled contexts must be
+            marked dirty), False if the cart was written directly
+        """
+        ids = state.item_ids(products)
+        self.invalidate_snapshot()
+        if state.is_on_origin(self.page, self.base_url):
+            await state.write_cart(self.page, ids)
+            return False
+        await state.seed_cart_on_load(self.page, self.base_url, ids)
+        return True
+    
+    async def get_cart_item_ids(self) -> List[int]:
+        """
+        Read the cart contents from localStorage.
+        
+        Returns:
+            Item ids in the cart
+        """
+        return await state.read_cart(self.page)
     
     async def click_shopping_cart(self) -> None:
         """Click the shopping cart link."""
+        self.invalidate_snapshot()
         await self.click_element(self.shopping_cart_link)
     
-    async def sort_products(self, sort_option: str) -> None:
+    async def sort_products(self, sort_option: str, wait: bool = True) -> None:
         """
         Sort products using the dropdown.
         
         Args:
             sort_option: Sort option value (za, az, lohi, hilo)
+            wait: Wait for the list order to change. The wait is best
+                effort: sorting does nothing for problem_user and error_user.
         """
-        await self.page.locator(self.product_sort_dropdown).select_option(sort_option)
+        current = await self.snapshot()
+        if current.sort_option == sort_option:
+            return
+        
+        previous_names = [product.name for product in current.products]
+        self.invalidate_snapshot()
+        await self.locator(self.product_sort_dropdown).select_option(sort_option)
+        if not wait:
+            return
+        try:
+            await self.wait_for_list_order_change(self.item_names, previous_names)
+        except PlaywrightError:
+            pass
     
     async def open_menu(self) -> None:
         """Open the hamburger menu."""
@@ -140,9 +306,11 @@ class InventoryPage(BasePage):
     
     async def logout(self) -> None:
         """Logout from the application."""
+        self.invalidate_snapshot()
         await self.open_menu()
         await self.wait_for_element(self.logout_link)
         await self.click_element(self.logout_link)
+        await self.wait_for_url_settled(f"{self.base_url}/")
     
     async def get_product_details_by_name(self, product_name: str) -> dict:
         """
@@ -154,16 +322,62 @@ class InventoryPage(BasePage):
         Returns:
             Dictionary with product details
         """
-        product_locator = self.page.locator(self.inventory_items).filter(
-            has_text=product_name
-        )
-        
-        name = await product_locator.locator(self.item_names).text_content()
-        price = await product_locator.locator(self.item_prices).text_content()
-        description = await product_locator.locator(self.item_descriptions).text_content()
+        product = (await self.snapshot()).find(product_name)
+        if product is None:
+            return {"name": "", "price": "", "description": ""}
         
         return {
-            "name": name or "",
-            "price": price or "",
-            "description": description or ""
-        }
\ No newline at end of file
+            "name": product.name,
+            "price": product.price_text,
+            "description": product.description
+        }
+
+
+def read_snapshot(page: Any) -> Any:
+    """
+    Read the raw inventory state in one evaluate.
+    
+    Accepts a sync or an async page, like waits and state, so sync tests
+    can snapshot the fixture's page: parse_snapshot(page.url, read_snapshot(page)).
+    
+    Args:
+        page: Playwright page (sync or async) on the inventory page
+        
+    Returns:
+        The raw result for parse_snapshot (awaitable for async pages)
+    """
+    return page.evaluate(_SNAPSHOT_SCRIPT, {
+        "item": InventoryPage.inventory_items,
+        "name": InventoryPage.item_names,
+        "description": InventoryPage.item_descriptions,
+        "price": InventoryPage.item_prices,
+        "remove": InventoryPage.remove_buttons,
+        "badge": InventoryPage.shopping_cart_badge,
+        "sort": InventoryPage.product_sort_dropdown,
+    })
+
+
+def parse_snapshot(url: str, raw: Dict[str, Any]) -> InventorySnapshot:
+    """
+    Build an inventory snapshot from the result of read_snapshot.
+    
+    Args:
+        url: URL of the page the state was read from
+        raw: Result of read_snapshot
+        
+    Returns:
+        Inventory snapshot
+    """
+    products = [
+        ProductSnapshot(item_id, name, description, price, _parse_price(price), in_cart)
+        for item_id, name, description, price, in_cart in raw["products"]
+    ]
+    return InventorySnapshot(url, products, raw["badge"], raw["sort"])
+
+
+def _parse_price(price_text: str) -> float:
+    """Parse a "$29.99" price, returning 0.0 when it is not a number."""
+    try:
+        return float(price_text.replace("$", ""))
+    except ValueError:
+        return 0.0
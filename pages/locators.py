@@ -0,0 +1,75 @@
+"""
+Declarative element registry for page objects.
+
+Page classes declare their elements once as class attributes:
+
+    class LoginPage(BasePage):
+        username_input = Element("[data-test='username']", "Username field")
+
+Reading the attribute (on the class or an instance) gives the selector
+string, so existing helpers keep working. BasePage collects the declarations
+of every subclass into a registry and builds Playwright Locator objects per
+page instance lazily, caching them for reuse.
+"""
+from typing import Dict, Optional, Type
+
+
+class Element:
+    """A named element selector declared on a page class."""
+
+    def __init__(self, selector: str, description: str = "") -> None:
+        """
+        Initialize the element declaration.
+
+        Args:
+            selector: Playwright selector of the element
+            description: Optional human readable description
+        """
+        self.selector = selector
+        self.description = description
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Optional[object], owner: type) -> str:
+        return self.selector
+
+    def __repr__(self) -> str:
+        return f"Element({self.name}={self.selector!r})"
+
+
+# Page class name -> {element name: Element}
+_REGISTRY: Dict[str, Dict[str, Element]] = {}
+
+
+def collect_elements(cls: Type) -> Dict[str, Element]:
+    """
+    Collect the elements declared on a page class and its bases.
+
+    Args:
+        cls: Page class
+
+    Returns:
+        Mapping of element name to declaration, base classes first
+    """
+    elements: Dict[str, Element] = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, Element):
+                elements[name] = value
+    _REGISTRY[cls.__name__] = elements
+    return elements
+
+
+def registry() -> Dict[str, Dict[str, str]]:
+    """
+    Get every registered page and its element selectors, for tooling.
+
+    Returns:
+        Mapping of page class name to {element name: selector}
+    """
+    return {
+        page: {name: element.selector for name, element in elements.items()}
+        for page, elements in _REGISTRY.items()
+    }
@@ -1,14 +1,27 @@
 """
 Login page object for SauceDemo application.
 """
+import time
 from typing import Optional
 from playwright.async_api import Page
+from data.test_data import TIMEOUTS
+from utils.action_timing import set_tags
+from utils.page_metrics import recorder as page_metrics
+from . import performance
 from .base_page import BasePage
+from .locators import Element
 
 
 class LoginPage(BasePage):
     """Login page object containing login functionality."""
     
+    # Locators
+    username_input = Element("[data-test='username']", "Username field")
+    password_input = Element("[data-test='password']", "Password field")
+    login_button = Element("[data-test='login-button']", "Login button")
+    error_message = Element("[data-test='error']", "Login error message")
+    error_button = Element(".error-button", "Error dismiss button")
+    
     def __init__(self, page: Page) -> None:
         """
         Initialize the login page.
@@ -18,13 +31,6 @@ class LoginPage(BasePage):
         """
         super().__init__(page)
         
-        # Locators
-        self.username_input = "[data-test='username']"
-        self.password_input = "[data-test='password']"
-        self.login_button = "[data-test='login-button']"
-        self.error_message = "[data-test='error']"
-        self.error_button = ".error-button"
-        
         # Login URL
         self.login_url = f"{self.base_url}/"
     
@@ -62,20 +68,40 @@ class LoginPage(BasePage):
             username: Username for login
             password: Password for login
         """
+        set_tags(user=username)
         await self.enter_username(username)
         await self.enter_password(password)
+        started = time.perf_counter()
         await self.click_login()
+        if page_metrics.enabled:
+            await self._record_login_metrics(started)
+    
+    async def _record_login_metrics(self, started: float) -> None:
+        """Record metrics of the post-login page once the login page is left."""
+        await self.page.wait_for_function(
+            performance.LEFT_URL_OR_ERROR_SCRIPT,
+            arg={"url": self.login_url, "errorSelector": self.error_message},
+            timeout=TIMEOUTS["performance_glitch"]
+        )
+        if self.page.url == self.login_url:
+            return
+        await self.page.wait_for_load_state("load")
+        await self.record_page_metrics(
+            "login", transition_ms=round((time.perf_counter() - started) * 1000, 1)
+        )
     
     async def get_error_message(self) -> str:
         """
-        Get the error message text.
+        Get the error message text right now, without waiting.
+        
+        When an error is expected, wait for it first (is_error_displayed or
+        wait_for_element); checking that no error shows then costs no
+        timeout.
         
         Returns:
             Error message text or empty string if no error
         """
-        if await self.is_element_visible(self.error_message):
-            return await self.get_text(self.error_message)
-        return ""
+        return await self.text_now(self.error_message)
     
     async def is_error_displayed(self) -> bool:
         """
@@ -88,8 +114,9 @@ class LoginPage(BasePage):
     
     async def dismiss_error(self) -> None:
         """Dismiss the error message by clicking the error button."""
-        if await self.is_element_visible(self.error_button):
+        if await self.is_visible_now(self.error_button):
             await self.click_element(self.error_button)
+            await self.expect_absent(self.error_message)
     
     async def is_login_page_loaded(self) -> bool:
         """
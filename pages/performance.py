@@ -0,0 +1,82 @@
+"""
+Browser-side page performance metrics read through the Performance API.
+
+collect() runs one evaluate after load that returns Navigation Timing,
+resource timing totals, FCP, LCP, CLS and long tasks. Buffered
+PerformanceObservers pick up entries recorded before the call. Entry types
+a browser does not support (LCP, layout shifts and long tasks outside
+Chromium) are reported as None.
+
+Like the wait primitives, collect() accepts a sync or async page and
+returns whatever page.evaluate returns.
+"""
+from typing import Any
+
+METRICS_SCRIPT = """
+async () => {
+    const supported = PerformanceObserver.supportedEntryTypes || [];
+    const observe = (type) => new Promise((resolve) => {
+        if (!supported.includes(type)) { resolve(null); return; }
+        const entries = [];
+        const observer = new PerformanceObserver((list) => entries.push(...list.getEntries()));
+        observer.observe({ type, buffered: true });
+        setTimeout(() => {
+            entries.push(...observer.takeRecords());
+            observer.disconnect();
+            resolve(entries);
+        }, 0);
+    });
+    const round = (value) => (value === null || value === undefined) ? null : Math.round(value * 10) / 10;
+    const [lcp, shifts, longTasks] = await Promise.all([
+        observe('largest-contentful-paint'), observe('layout-shift'), observe('longtask'),
+    ]);
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+    return {
+        url: window.location.href,
+        navigation: nav ? {
+            url: nav.name,
+            type: nav.type,
+            ttfb: round(nav.responseStart),
+            dom_interactive: round(nav.domInteractive),
+            dom_content_loaded: round(nav.domContentLoadedEventEnd),
+            load: round(nav.loadEventEnd),
+            transfer_size: nav.transferSize || 0,
+        } : null,
+        resources: {
+            count: resources.length,
+            transfer_size: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+            decoded_size: resources.reduce((sum, r) => sum + (r.decodedBodySize || 0), 0),
+            end: round(resources.reduce((end, r) => Math.max(end, r.responseEnd), 0)),
+        },
+        fcp: fcp ? round(fcp.startTime) : null,
+        lcp: lcp && lcp.length ? round(lcp[lcp.length - 1].startTime) : null,
+        cls: shifts ? Math.round(shifts.filter((s) => !s.hadRecentInput)
+            .reduce((sum, s) => sum + s.value, 0) * 1000) / 1000 : null,
+        long_tasks: longTasks ? {
+            count: longTasks.length,
+            total_ms: round(longTasks.reduce((sum, t) => sum + t.duration, 0)),
+            blocking_ms: round(longTasks.reduce((sum, t) => sum + Math.max(0, t.duration - 50), 0)),
+        } : null,
+    };
+}
+"""
+
+# Resolves once the page left `url` or shows an element matching `errorSelector`
+LEFT_URL_OR_ERROR_SCRIPT = """
+({ url, errorSelector }) => window.location.href !== url || !!document.querySelector(errorSelector)
+"""
+
+
+def collect(page: Any) -> Any:
+    """
+    Read the performance metrics of the current document.
+
+    Args:
+        page: Sync or async Playwright page
+
+    Returns:
+        Metrics dictionary (awaitable for async pages)
+    """
+    return page.evaluate(METRICS_SCRIPT)
@@ -0,0 +1,173 @@
+"""
+Application state seeding for test setup.
+
+SauceDemo keeps all state in the browser. The session is the
+``session-username`` cookie holding the username, so a context can be
+logged in by setting it instead of submitting the login form. The cart is
+the ``cart-contents`` localStorage key holding a JSON array of item ids, so
+it can be written directly instead of clicking "Add to cart" once per
+product. The app reads both when a page loads: seed first, then navigate.
+
+Like waits, the functions accept either a sync or an async Playwright page
+and return whatever the page call returns: the result for sync pages, an
+awaitable for async pages.
+"""
+import json
+import time
+from typing import Any, Dict, Iterable, List, Union
+from urllib.parse import urlsplit
+
+from data.test_data import EXPECTED_PRODUCTS
+
+# localStorage key holding the cart's item ids
+CART_STORAGE_KEY = "cart-contents"
+
+# Cookie holding the logged-in username, and its lifetime in the app
+SESSION_COOKIE = "session-username"
+SESSION_MINUTES = 10
+
+# Item id of every known product by name
+PRODUCT_IDS = {product["name"]: product["item_id"] for product in EXPECTED_PRODUCTS}
+
+WRITE_CART_SCRIPT = """
+({ key, ids }) => { window.localStorage.setItem(key, JSON.stringify(ids)); }
+"""
+
+READ_CART_SCRIPT = """
+(key) => JSON.parse(window.localStorage.getItem(key) || '[]')
+"""
+
+# Seeds the cart on the first load of the app's origin; later loads keep the
+# cart the app wrote
+_SEED_CART_INIT_SCRIPT = """
+(() => {
+    if (window.location.origin !== %s) { return; }
+    if (window.localStorage.getItem(%s) === null) {
+        window.localStorage.setItem(%s, %s);
+    }
+})();
+"""
+
+
+def item_ids(products: Iterable[Union[str, int]]) -> List[int]:
+    """
+    Resolve products to item ids.
+
+    Args:
+        products: Product names from EXPECTED_PRODUCTS, or item ids
+
+    Returns:
+        Item ids in the given order
+
+    Raises:
+        KeyError: If a product name is unknown
+    """
+    ids = []
+    for product in products:
+        if isinstance(product, int):
+            ids.append(product)
+        elif product in PRODUCT_IDS:
+            ids.append(PRODUCT_IDS[product])
+        else:
+            raise KeyError(f"Unknown product '{product}', expected one of {list(PRODUCT_IDS)}")
+    return ids
+
+
+def origin_of(url: str) -> str:
+    """
+    Get the origin of a URL.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        scheme://host[:port]
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def is_on_origin(page: Any, base_url: str) -> bool:
+    """
+    Check whether a page currently shows a document of the app's origin.
+
+    Args:
+        page: Playwright page (sync or async)
+        base_url: Application base URL
+
+    Returns:
+        True if localStorage of the app can be written right now
+    """
+    return page.url.startswith("http") and origin_of(page.url) == origin_of(base_url)
+
+
+def write_cart(page: Any, ids: List[int]) -> Any:
+    """
+    Replace the cart contents; the page must be on the app's origin.
+
+    Args:
+        page: Playwright page (sync or async)
+        ids: Item ids to put in the cart
+    """
+    return page.evaluate(WRITE_CART_SCRIPT, {"key": CART_STORAGE_KEY, "ids": ids})
+
+
+def read_cart(page: Any) -> Any:
+    """
+    Read the cart contents from localStorage.
+
+    Args:
+        page: Playwright page (sync or async) on the app's origin
+
+    Returns:
+        Item ids in the cart
+    """
+    return page.evaluate(READ_CART_SCRIPT, CART_STORAGE_KEY)
+
+
+def seed_cart_on_load(page: Any, base_url: str, ids: List[int]) -> Any:
+    """
+    Seed the cart before the app's first page load.
+
+    Installs an init script, so pooled contexts must be marked dirty.
+
+    Args:
+        page: Playwright page (sync or async) not yet on the app's origin
+        base_url: Application base URL
+        ids: Item ids to put in the cart
+    """
+    return page.add_init_script(_SEED_CART_INIT_SCRIPT % (
+        json.dumps(origin_of(base_url)), json.dumps(CART_STORAGE_KEY),
+        json.dumps(CART_STORAGE_KEY), json.dumps(json.dumps(ids))
+    ))
+
+
+def session_cookie(username: str, base_url: str) -> Dict[str, Any]:
+    """
+    Build the app's session cookie for a user.
+
+    Args:
+        username: Username to be logged in as
+        base_url: Application base URL
+
+    Returns:
+        Cookie for BrowserContext.add_cookies
+    """
+    return {
+        "name": SESSION_COOKIE,
+        "value": username,
+        "url": f"{origin_of(base_url)}/",
+        "expires": int(time.time()) + SESSION_MINUTES * 60,
+    }
+
+
+def set_session_cookie(context: Any, username: str, base_url: str) -> Any:
+    """
+    Log a browser context in by setting the session cookie.
+
+    Args:
+        context: Playwright browser context (sync or async)
+        username: Username to be logged in as
+        base_url: Application base URL
+    """
+    return context.add_cookies([session_cookie(username, base_url)])
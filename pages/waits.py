@@ -0,0 +1,239 @@
+"""
+Event-driven wait primitives shared by page objects and tests.
+
+Each condition runs as a single in-page promise driven by MutationObserver
+or navigation events, so waits finish as soon as the DOM reaches the wanted
+state instead of sleeping for a fixed time.
+
+The functions accept either a sync or an async Playwright page and return
+whatever page.evaluate returns: the result for sync pages, an awaitable for
+async pages. BasePage wraps them as async methods.
+"""
+from typing import Any, List
+
+# Default timeout for every wait, in milliseconds
+DEFAULT_TIMEOUT = 5000
+
+# Quiet period used by the "settled" conditions, in milliseconds
+DEFAULT_QUIET_MS = 100
+
+# Resolves when the texts of the matched elements differ from `previous`
+LIST_ORDER_CHANGED_SCRIPT = """
+({ selector, previous, timeout }) => new Promise((resolve, reject) => {
+    const expected = JSON.stringify(previous);
+    const read = () => Array.from(document.querySelectorAll(selector), (el) => el.textContent);
+    const observer = new MutationObserver(() => check());
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        reject(new Error(`Timed out after ${timeout}ms waiting for order of '${selector}' to change`));
+    }, timeout);
+    const check = () => {
+        const current = read();
+        if (JSON.stringify(current) !== expected) {
+            clearTimeout(timer);
+            observer.disconnect();
+            resolve(current);
+        }
+    };
+    observer.observe(document.documentElement, { childList: true, subtree: true, characterData: true });
+    check();
+})
+"""
+
+# Resolves when the texts of the matched elements equal `expected`
+LIST_ORDER_IS_SCRIPT = """
+({ selector, expected, timeout }) => new Promise((resolve, reject) => {
+    const wanted = JSON.stringify(expected);
+    const read = () => Array.from(document.querySelectorAll(selector), (el) => el.textContent);
+    const observer = new MutationObserver(() => check());
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        reject(new Error(`Timed out after ${timeout}ms waiting for '${selector}' to read ${wanted}, last ${JSON.stringify(read())}`));
+    }, timeout);
+    const check = () => {
+        const current = read();
+        if (JSON.stringify(current) === wanted) {
+            clearTimeout(timer);
+            observer.disconnect();
+            resolve(current);
+        }
+    };
+    observer.observe(document.documentElement, { childList: true, subtree: true, characterData: true });
+    check();
+})
+"""
+
+# Resolves when the numeric text of `selector` equals `expected` (missing element counts as 0)
+BADGE_COUNT_SCRIPT = """
+({ selector, expected, timeout }) => new Promise((resolve, reject) => {
+    const read = () => {
+        const el = document.querySelector(selector);
+        return el ? (parseInt(el.textContent, 10) || 0) : 0;
+    };
+    const observer = new MutationObserver(() => check());
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        reject(new Error(`Timed out after ${timeout}ms waiting for '${selector}' to show ${expected}, last value ${read()}`));
+    }, timeout);
+    const check = () => {
+        if (read() === expected) {
+            clearTimeout(timer);
+            observer.disconnect();
+            resolve(expected);
+        }
+    };
+    observer.observe(document.documentElement, { childList: true, subtree: true, characterData: true });
+    check();
+})
+"""
+
+# Resolves once `root` has seen no mutation for `quietMs`
+DOM_QUIESCENT_SCRIPT = """
+({ root, quietMs, timeout }) => new Promise((resolve, reject) => {
+    const target = document.querySelector(root) || document.documentElement;
+    let quietTimer = null;
+    const observer = new MutationObserver(() => arm());
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        reject(new Error(`Timed out after ${timeout}ms waiting for '${root}' to stop changing`));
+    }, timeout);
+    const arm = () => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => {
+            clearTimeout(timer);
+            observer.disconnect();
+            resolve(true);
+        }, quietMs);
+    };
+    observer.observe(target, { childList: true, subtree: true, characterData: true, attributes: true });
+    arm();
+})
+"""
+
+# Resolves once the URL has not changed through history/navigation events for `quietMs`
+URL_SETTLED_SCRIPT = """
+({ quietMs, timeout }) => new Promise((resolve, reject) => {
+    let quietTimer = null;
+    const events = ['popstate', 'hashchange'];
+    const cleanup = () => {
+        clearTimeout(quietTimer);
+        events.forEach((name) => window.removeEventListener(name, arm));
+        if (window.navigation) { window.navigation.removeEventListener('navigatesuccess', arm); }
+    };
+    const timer = setTimeout(() => {
+        cleanup();
+        reject(new Error(`Timed out after ${timeout}ms waiting for the URL to settle`));
+    }, timeout);
+    function arm() {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => {
+            clearTimeout(timer);
+            cleanup();
+            resolve(window.location.href);
+        }, quietMs);
+    }
+    events.forEach((name) => window.addEventListener(name, arm));
+    if (window.navigation) { window.navigation.addEventListener('navigatesuccess', arm); }
+    arm();
+})
+"""
+
+
+def list_order_changed(page: Any, selector: str, previous: List[str],
+                       timeout: int = DEFAULT_TIMEOUT) -> Any:
+    """
+    Wait until the texts of the matched elements differ from a previous read.
+
+    Args:
+        page: Sync or async Playwright page
+        selector: CSS selector of the list entries
+        previous: Entry texts read before the action
+        timeout: Timeout in milliseconds
+
+    Returns:
+        The new entry texts (awaitable for async pages)
+    """
+    return page.evaluate(
+        LIST_ORDER_CHANGED_SCRIPT,
+        {"selector": selector, "previous": previous, "timeout": timeout}
+    )
+
+
+def list_order_is(page: Any, selector: str, expected: List[str],
+                  timeout: int = DEFAULT_TIMEOUT) -> Any:
+    """
+    Wait until the texts of the matched elements equal an expected list.
+
+    Unlike list_order_changed, this also finishes when the list is already
+    in the expected order.
+
+    Args:
+        page: Sync or async Playwright page
+        selector: CSS selector of the list entries
+        expected: Entry texts in the expected order
+        timeout: Timeout in milliseconds
+
+    Returns:
+        The entry texts (awaitable for async pages)
+    """
+    return page.evaluate(
+        LIST_ORDER_IS_SCRIPT,
+        {"selector": selector, "expected": expected, "timeout": timeout}
+    )
+
+
+def badge_count(page: Any, selector: str, expected: int,
+                timeout: int = DEFAULT_TIMEOUT) -> Any:
+    """
+    Wait until a counter badge shows a number; a missing badge counts as 0.
+
+    Args:
+        page: Sync or async Playwright page
+        selector: CSS selector of the badge
+        expected: Count to wait for
+        timeout: Timeout in milliseconds
+
+    Returns:
+        The expected count (awaitable for async pages)
+    """
+    return page.evaluate(
+        BADGE_COUNT_SCRIPT,
+        {"selector": selector, "expected": expected, "timeout": timeout}
+    )
+
+
+def dom_quiescent(page: Any, root: str = "body", quiet_ms: int = DEFAULT_QUIET_MS,
+                  timeout: int = DEFAULT_TIMEOUT) -> Any:
+    """
+    Wait until a DOM subtree stops changing.
+
+    Args:
+        page: Sync or async Playwright page
+        root: CSS selector of the subtree to observe
+        quiet_ms: Mutation-free period that counts as settled
+        timeout: Timeout in milliseconds
+
+    Returns:
+        True once settled (awaitable for async pages)
+    """
+    return page.evaluate(
+        DOM_QUIESCENT_SCRIPT,
+        {"root": root, "quietMs": quiet_ms, "timeout": timeout}
+    )
+
+
+def url_settled(page: Any, quiet_ms: int = DEFAULT_QUIET_MS,
+                timeout: int = DEFAULT_TIMEOUT) -> Any:
+    """
+    Wait until client-side routing stops changing the URL.
+
+    Args:
+        page: Sync or async Playwright page
+        quiet_ms: Navigation-free period that counts as settled
+        timeout: Timeout in milliseconds
+
+    Returns:
+        The settled URL (awaitable for async pages)
+    """
+    return page.evaluate(URL_SETTLED_SCRIPT, {"quietMs": quiet_ms, "timeout": timeout})
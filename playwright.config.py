@@ -7,8 +7,10 @@ config: Dict[str, Any] = {
         "viewport": {"width": 1280, "height": 720},
         "ignoreHTTPSErrors": True,
         "screenshot": "only-on-failure",
-        "video": "retain-on-failure",
-        "trace": "retain-on-failure",
+        # Recording every test only to discard passing ones is costly; use
+        # FAILURE_TRACE / FAILURE_SCREENCAST_SECONDS (utils/failure_capture.py)
+        "video": "off",
+        "trace": "off",
     },
     "projects": [
         {
@@ -0,0 +1,9 @@
+"""
+Local SauceDemo stand-in server initialization file.
+"""
+from .app import FaultConfig, StandInServer
+
+__all__ = [
+    "FaultConfig",
+    "StandInServer",
+]
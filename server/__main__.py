@@ -0,0 +1,50 @@
+"""
+Run the SauceDemo stand-in server from the command line.
+
+Usage:
+    python -m server --port 8765 --latency-ms 50 --error-rate 0.01
+"""
+import argparse
+import time
+
+from utils.test_utils import EnvironmentUtils
+
+from .app import FaultConfig, StandInServer
+
+
+def main() -> None:
+    """Parse arguments and serve until interrupted."""
+    defaults = EnvironmentUtils.get_local_server_faults()
+    parser = argparse.ArgumentParser(description="SauceDemo stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=EnvironmentUtils.get_local_server_port())
+    parser.add_argument("--latency-ms", type=int, default=defaults["latency_ms"])
+    parser.add_argument("--jitter-ms", type=int, default=defaults["jitter_ms"])
+    parser.add_argument("--error-rate", type=float, default=defaults["error_rate"])
+    parser.add_argument("--error-status", type=int, default=defaults["error_status"])
+    parser.add_argument(
+        "--fault-path", action="append", default=defaults["paths"],
+        help="Glob of request paths to inject faults into (repeatable)"
+    )
+    parser.add_argument("--glitch-ms", type=int, default=defaults["glitch_delay_ms"])
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        paths=args.fault_path,
+        glitch_delay_ms=args.glitch_ms
+    )
+    with StandInServer(args.host, args.port, faults) as server:
+        print(f"🚀 SauceDemo stand-in server running at {server.url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            print(f"🛑 Stopped after {server.stats['requests']} requests")
+
+
+if __name__ == "__main__":
+    main()
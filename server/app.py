@@ -0,0 +1,311 @@
+"""
+Local SauceDemo stand-in server with latency and fault injection.
+"""
+import fnmatch
+import random
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+from data.test_data import EXPECTED_PRODUCTS, INVALID_USERS, VALID_USERS
+from utils.test_utils import EnvironmentUtils
+
+from .templates import (
+    APP_CSS,
+    APP_JS,
+    CART_STORAGE_KEY,
+    PAGES,
+    PLACEHOLDER_IMAGE,
+    SESSION_COOKIE,
+    SESSION_MINUTES,
+    render_page,
+)
+
+# Tax rate applied on the checkout overview page
+TAX_RATE = 0.08
+
+# Pages that redirect to the login page without a session cookie
+PROTECTED_PATHS = frozenset(path for path in PAGES if path != "/")
+
+
+class FaultConfig:
+    """Latency and error injection settings for the stand-in server."""
+
+    def __init__(
+        self,
+        latency_ms: int = 0,
+        jitter_ms: int = 0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        paths: Optional[List[str]] = None,
+        glitch_delay_ms: int = 2500,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize the fault configuration.
+
+        Args:
+            latency_ms: Fixed delay added to every affected response
+            jitter_ms: Random extra delay (0..jitter_ms) added on top
+            error_rate: Probability (0.0-1.0) of answering with error_status
+            error_status: HTTP status used for injected errors
+            paths: Glob patterns of request paths to affect, all paths if empty
+            glitch_delay_ms: Login delay applied to performance_glitch_user
+            seed: Optional random seed for reproducible fault sequences
+        """
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}")
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.paths = list(paths or [])
+        self.glitch_delay_ms = glitch_delay_ms
+        self._random = random.Random(seed)
+
+    def applies_to(self, path: str) -> bool:
+        """
+        Check if faults apply to a request path.
+
+        Args:
+            path: Request path
+
+        Returns:
+            True if the path matches the configured patterns
+        """
+        if not self.paths:
+            return True
+        return any(fnmatch.fnmatch(path, pattern) for pattern in self.paths)
+
+    def next_delay(self) -> float:
+        """
+        Get the delay for the next affected response.
+
+        Returns:
+            Delay in seconds
+        """
+        jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        return (self.latency_ms + jitter) / 1000
+
+    def should_fail(self) -> bool:
+        """
+        Decide whether the next affected response is an injected error.
+
+        Returns:
+            True if an error should be returned
+        """
+        return self.error_rate > 0 and self._random.random() < self.error_rate
+
+
+class StandInServer:
+    """Threaded HTTP server serving the SauceDemo stand-in application."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: Optional[FaultConfig] = None
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free port
+            faults: Latency and error injection settings
+        """
+        self.host = host
+        self.port = port
+        self.faults = faults or FaultConfig()
+        self.stats = {"requests": 0, "injected_errors": 0, "delayed": 0}
+        self._stats_lock = threading.Lock()
+        self._routes: Dict[str, Tuple[str, bytes]] = {}
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._build_routes()
+
+    @classmethod
+    def from_environment(cls) -> "StandInServer":
+        """
+        Create a server configured from LOCAL_SERVER_* environment variables.
+
+        Returns:
+            Configured (not yet started) server
+        """
+        return cls(
+            port=EnvironmentUtils.get_local_server_port(),
+            faults=FaultConfig(**EnvironmentUtils.get_local_server_faults())
+        )
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        return f"http://{self.host}:{self.port}"
+
+    def configure(self, faults: FaultConfig) -> None:
+        """
+        Replace the fault configuration of a running server.
+
+        Args:
+            faults: New latency and error injection settings
+        """
+        self.faults = faults
+        self._build_routes()
+
+    def start(self) -> "StandInServer":
+        """
+        Start serving in a background thread.
+
+        Returns:
+            The server itself
+        """
+        handler = type("BoundStandInHandler", (StandInRequestHandler,), {"app": self})
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="stand-in-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and wait for the serving thread to exit."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _build_routes(self) -> None:
+        """Pre-render every page so requests only copy bytes."""
+        config = {
+            "products": [
+                {
+                    "item_id": product["item_id"],
+                    "id": product["id"],
+                    "name": product["name"],
+                    "description": product["description"],
+                    "price": float(product["price"].replace("$", "")),
+                }
+                for product in EXPECTED_PRODUCTS
+            ],
+            "users": [user["username"] for user in VALID_USERS.values()],
+            "lockedOutUser": INVALID_USERS["locked_out"]["username"],
+            "password": VALID_USERS["standard_user"]["password"],
+            "sessionCookie": SESSION_COOKIE,
+            "sessionMinutes": SESSION_MINUTES,
+            "cartKey": CART_STORAGE_KEY,
+            "glitchDelayMs": self.faults.glitch_delay_ms,
+            "taxRate": TAX_RATE,
+        }
+        routes = {
+            path: ("text/html; charset=utf-8", render_page(name, body, config))
+            for path, (name, body) in PAGES.items()
+        }
+        routes["/index.html"] = routes["/"]
+        routes["/static/js/app.js"] = ("application/javascript", APP_JS.encode("utf-8"))
+        routes["/static/css/app.css"] = ("text/css", APP_CSS.encode("utf-8"))
+        self._routes = routes
+
+    def resolve(self, path: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Find the content type and body for a request path.
+
+        Args:
+            path: Request path without query string
+
+        Returns:
+            (content type, body) or None if the path is unknown
+        """
+        if path.startswith("/static/media/"):
+            return "image/png", PLACEHOLDER_IMAGE
+        return self._routes.get(path)
+
+    def record(self, key: str) -> None:
+        """Increment a request counter."""
+        with self._stats_lock:
+            self.stats[key] += 1
+
+
+class StandInRequestHandler(BaseHTTPRequestHandler):
+    """Request handler bound to a StandInServer through the ``app`` attribute."""
+
+    app: StandInServer
+    protocol_version = "HTTP/1.1"
+    server_version = "SauceDemoStandIn/1.0"
+
+    def do_GET(self) -> None:
+        self._respond(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._respond(send_body=False)
+
+    def _respond(self, send_body: bool) -> None:
+        app = self.app
+        faults = app.faults
+        path = urlsplit(self.path).path
+        app.record("requests")
+
+        if faults.applies_to(path):
+            delay = faults.next_delay()
+            if delay:
+                app.record("delayed")
+                time.sleep(delay)
+            if faults.should_fail():
+                app.record("injected_errors")
+                self._send(faults.error_status, "text/plain", b"Injected fault", send_body)
+                return
+
+        if path == "/favicon.ico":
+            self._send(204, "image/x-icon", b"", send_body)
+            return
+
+        if path in PROTECTED_PATHS and not self._has_session():
+            self.send_response(302)
+            self.send_header("Location", f"/?denied={quote(path)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        resolved = app.resolve(path)
+        if resolved is None:
+            self._send(404, "text/plain", b"Not Found", send_body)
+            return
+        content_type, body = resolved
+        self._send(200, content_type, body, send_body)
+
+    def _has_session(self) -> bool:
+        """Check the request for a non-empty session cookie."""
+        cookie = SimpleCookie()
+        try:
+            cookie.load(self.headers.get("Cookie", ""))
+        except Exception:
+            return False
+        return bool(cookie.get(SESSION_COOKIE) and cookie[SESSION_COOKIE].value)
+
+    def _send(self, status: int, content_type: str, body: bytes, send_body: bool) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if content_type.startswith("text/html"):
+            self.send_header("Cache-Control", "no-store")
+        else:
+            self.send_header("Cache-Control", "public, max-age=3600")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Silence per-request logging; it would dominate benchmark output."""
@@ -0,0 +1,500 @@
+"""
+HTML, CSS and JavaScript served by the local SauceDemo stand-in server.
+
+The markup mirrors the ids, classes and data-test attributes of
+www.saucedemo.com so the page objects work unchanged. All application state
+lives in the browser, exactly like the real site: the session is the
+``session-username`` cookie and the cart is the ``cart-contents``
+localStorage key holding a JSON array of item ids.
+"""
+import json
+from typing import Any, Dict
+
+# Cookie and storage keys shared with the real application
+SESSION_COOKIE = "session-username"
+CART_STORAGE_KEY = "cart-contents"
+SESSION_MINUTES = 10
+
+# 1x1 transparent PNG used for every product image
+PLACEHOLDER_IMAGE = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010804000000b51c0c02"
+    "0000000b4944415478da6364600000000600023081d02f0000000049454e44ae426082"
+)
+
+APP_CSS = """
+body { font-family: sans-serif; margin: 0; }
+.login_wrapper, .page_wrapper { padding: 16px; }
+.input_error { display: block; margin: 8px 0; padding: 6px; }
+.input_error.error { border: 1px solid #e2231a; }
+.error-message-container.error h3 { background: #e2231a; color: #fff; padding: 8px; }
+.primary_header { display: flex; justify-content: space-between; padding: 8px; }
+.bm-menu-wrap { display: none; }
+.bm-menu-wrap.open { display: block; }
+.bm-item { display: block; padding: 4px 0; }
+.shopping_cart_link { position: relative; display: inline-block; min-width: 24px; min-height: 24px; }
+.inventory_item { border-bottom: 1px solid #ddd; padding: 8px 0; }
+.inventory_item_img img { width: 64px; height: 64px; }
+"""
+
+APP_JS = r"""
+(function () {
+  'use strict';
+  var CONFIG = window.__SAUCE_CONFIG__;
+  var PRODUCTS = CONFIG.products;
+  var BROKEN_ITEM_IDS = [1, 3, 5];
+
+  function $(selector) { return document.querySelector(selector); }
+  function esc(text) {
+    return String(text).replace(/[&<>"']/g, function (c) {
+      return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+    });
+  }
+  function money(value) { return '$' + value.toFixed(2); }
+
+  // Session cookie
+  function currentUser() {
+    var match = document.cookie.match(new RegExp('(?:^|; )' + CONFIG.sessionCookie + '=([^;]*)'));
+    return match ? decodeURIComponent(match[1]) : '';
+  }
+  function startSession(user) {
+    var expires = new Date(Date.now() + CONFIG.sessionMinutes * 60000);
+    document.cookie = CONFIG.sessionCookie + '=' + encodeURIComponent(user) +
+      '; expires=' + expires.toUTCString() + '; path=/';
+  }
+  function endSession() {
+    document.cookie = CONFIG.sessionCookie + '=; expires=Thu, 01 Jan 1970 00:00:00 GMT; path=/';
+  }
+  function requireSession(path) {
+    if (!currentUser()) {
+      window.location.replace('/?denied=' + encodeURIComponent(path));
+      return false;
+    }
+    return true;
+  }
+
+  // Cart stored in localStorage
+  function readCart() {
+    try {
+      var ids = JSON.parse(window.localStorage.getItem(CONFIG.cartKey) || '[]');
+      return Array.isArray(ids) ? ids : [];
+    } catch (e) {
+      return [];
+    }
+  }
+  function writeCart(ids) {
+    window.localStorage.setItem(CONFIG.cartKey, JSON.stringify(ids));
+  }
+  function productById(id) {
+    for (var i = 0; i < PRODUCTS.length; i++) {
+      if (PRODUCTS[i].item_id === id) { return PRODUCTS[i]; }
+    }
+    return null;
+  }
+  function isQuirkyUser() {
+    var user = currentUser();
+    return user === 'problem_user' || user === 'error_user';
+  }
+
+  // Shared header with burger menu and cart badge
+  function renderHeader() {
+    var header = $('#header_container');
+    if (!header) { return; }
+    header.innerHTML =
+      '<div class="primary_header" data-test="primary-header">' +
+      '<div id="menu_button_container"><button id="react-burger-menu-btn" type="button">Open Menu</button>' +
+      '<div class="bm-menu-wrap" hidden><nav class="bm-item-list">' +
+      '<a id="inventory_sidebar_link" class="bm-item menu-item" data-test="inventory-sidebar-link" href="/inventory.html">All Items</a>' +
+      '<a id="about_sidebar_link" class="bm-item menu-item" data-test="about-sidebar-link" href="https://saucelabs.com/">About</a>' +
+      '<a id="logout_sidebar_link" class="bm-item menu-item" data-test="logout-sidebar-link" href="#">Logout</a>' +
+      '<a id="reset_sidebar_link" class="bm-item menu-item" data-test="reset-sidebar-link" href="#">Reset App State</a>' +
+      '</nav><button id="react-burger-cross-btn" type="button">Close Menu</button></div></div>' +
+      '<div class="app_logo">Swag Labs</div>' +
+      '<div id="shopping_cart_container" class="shopping_cart_container">' +
+      '<a class="shopping_cart_link" data-test="shopping-cart-link" href="/cart.html"></a></div></div>';
+    var wrap = header.querySelector('.bm-menu-wrap');
+    $('#react-burger-menu-btn').addEventListener('click', function () {
+      wrap.hidden = false;
+      wrap.classList.add('open');
+    });
+    $('#react-burger-cross-btn').addEventListener('click', function () {
+      wrap.hidden = true;
+      wrap.classList.remove('open');
+    });
+    $('#logout_sidebar_link').addEventListener('click', function (event) {
+      event.preventDefault();
+      endSession();
+      window.location.assign('/');
+    });
+    $('#reset_sidebar_link').addEventListener('click', function (event) {
+      event.preventDefault();
+      writeCart([]);
+      updateBadge();
+    });
+    updateBadge();
+  }
+  function updateBadge() {
+    var link = $('.shopping_cart_link');
+    if (!link) { return; }
+    var count = readCart().length;
+    link.innerHTML = count
+      ? '<span class="shopping_cart_badge" data-test="shopping-cart-badge">' + count + '</span>'
+      : '';
+  }
+
+  function showError(message) {
+    var container = $('.error-message-container');
+    container.classList.add('error');
+    container.innerHTML =
+      '<h3 data-test="error"><button class="error-button" data-test="error-button" type="button">x</button>' +
+      esc(message) + '</h3>';
+    var inputs = document.querySelectorAll('.input_error');
+    for (var i = 0; i < inputs.length; i++) { inputs[i].classList.add('error'); }
+    container.querySelector('.error-button').addEventListener('click', clearError);
+  }
+  function clearError() {
+    var container = $('.error-message-container');
+    container.classList.remove('error');
+    container.innerHTML = '';
+    var inputs = document.querySelectorAll('.input_error');
+    for (var i = 0; i < inputs.length; i++) { inputs[i].classList.remove('error'); }
+  }
+
+  // Pages
+  function initLogin() {
+    var denied = new URLSearchParams(window.location.search).get('denied');
+    if (denied) {
+      showError("Epic sadface: You can only access '" + denied + "' when you are logged in.");
+    }
+    $('#login_button_container form').addEventListener('submit', function (event) {
+      event.preventDefault();
+      var username = $('#user-name').value;
+      var password = $('#password').value;
+      var error = '';
+      if (!username) {
+        error = 'Epic sadface: Username is required';
+      } else if (!password) {
+        error = 'Epic sadface: Password is required';
+      } else if (username === CONFIG.lockedOutUser && password === CONFIG.password) {
+        error = 'Epic sadface: Sorry, this user has been locked out.';
+      } else if (CONFIG.users.indexOf(username) === -1 || password !== CONFIG.password) {
+        error = 'Epic sadface: Username and password do not match any user in this service';
+      }
+      if (error) {
+        showError(error);
+        return;
+      }
+      startSession(username);
+      var delay = username === 'performance_glitch_user' ? CONFIG.glitchDelayMs : 0;
+      window.setTimeout(function () { window.location.assign('/inventory.html'); }, delay);
+    });
+  }
+
+  function sortedProducts(order) {
+    var items = PRODUCTS.slice();
+    var compare = {
+      az: function (a, b) { return a.name < b.name ? -1 : a.name > b.name ? 1 : 0; },
+      za: function (a, b) { return a.name < b.name ? 1 : a.name > b.name ? -1 : 0; },
+      lohi: function (a, b) { return a.price - b.price; },
+      hilo: function (a, b) { return b.price - a.price; }
+    }[order];
+    return compare ? items.sort(compare) : items;
+  }
+
+  function itemButton(product, inCart) {
+    var action = inCart ? 'remove' : 'add-to-cart';
+    var cls = inCart ? 'btn btn_secondary btn_small btn_inventory' : 'btn btn_primary btn_small btn_inventory';
+    var id = action + '-' + product.id;
+    return '<button class="' + cls + '" data-test="' + esc(id) + '" id="' + esc(id) + '" name="' + esc(id) +
+      '" data-item-id="' + product.item_id + '">' + (inCart ? 'Remove' : 'Add to cart') + '</button>';
+  }
+
+  function bindCartButtons(root, rerender) {
+    root.addEventListener('click', function (event) {
+      var button = event.target.closest('button[data-item-id]');
+      if (!button) { return; }
+      var itemId = Number(button.getAttribute('data-item-id'));
+      var cart = readCart();
+      var index = cart.indexOf(itemId);
+      if (index === -1) {
+        if (isQuirkyUser() && BROKEN_ITEM_IDS.indexOf(itemId) !== -1) { return; }
+        cart.push(itemId);
+      } else {
+        if (isQuirkyUser()) { return; }
+        cart.splice(index, 1);
+      }
+      writeCart(cart);
+      updateBadge();
+      rerender();
+    });
+  }
+
+  function initInventory() {
+    if (!requireSession('/inventory.html')) { return; }
+    renderHeader();
+    var list = $('.inventory_list');
+    var select = $('.product_sort_container');
+    var active = $('.active_option');
+    var order = 'az';
+    var problem = currentUser() === 'problem_user';
+
+    function render() {
+      var cart = readCart();
+      list.innerHTML = sortedProducts(order).map(function (product) {
+        var image = problem ? '/static/media/sl-404.jpg' : '/static/media/' + product.id + '.jpg';
+        return '<div class="inventory_item" data-test="inventory-item">' +
+          '<div class="inventory_item_img"><a href="#" id="item_' + product.item_id + '_img_link">' +
+          '<img alt="' + esc(product.name) + '" class="inventory_item_img" src="' + esc(image) + '"></a></div>' +
+          '<div class="inventory_item_description" data-test="inventory-item-description">' +
+          '<div class="inventory_item_label"><a href="#" id="item_' + product.item_id + '_title_link">' +
+          '<div class="inventory_item_name" data-test="inventory-item-name">' + esc(product.name) + '</div></a>' +
+          '<div class="inventory_item_desc" data-test="inventory-item-desc">' + esc(product.description) + '</div></div>' +
+          '<div class="pricebar"><div class="inventory_item_price" data-test="inventory-item-price">' +
+          money(product.price) + '</div>' + itemButton(product, cart.indexOf(product.item_id) !== -1) +
+          '</div></div></div>';
+      }).join('');
+    }
+
+    select.addEventListener('change', function () {
+      if (currentUser() === 'error_user') {
+        window.alert('Sorting is broken! This error has been reported to Backtrace.');
+        select.value = order;
+        return;
+      }
+      active.textContent = select.options[select.selectedIndex].text;
+      if (!problem) { order = select.value; }
+      render();
+    });
+    bindCartButtons(list, render);
+    render();
+  }
+
+  function initCart() {
+    if (!requireSession('/cart.html')) { return; }
+    renderHeader();
+    var list = $('.cart_list');
+    function render() {
+      var rows = readCart().map(productById).filter(Boolean).map(function (product) {
+        return '<div class="cart_item" data-test="inventory-item">' +
+          '<div class="cart_quantity" data-test="item-quantity">1</div>' +
+          '<div class="cart_item_label"><a href="#" id="item_' + product.item_id + '_title_link">' +
+          '<div class="inventory_item_name" data-test="inventory-item-name">' + esc(product.name) + '</div></a>' +
+          '<div class="inventory_item_desc" data-test="inventory-item-desc">' + esc(product.description) + '</div>' +
+          '<div class="item_pricebar"><div class="inventory_item_price" data-test="inventory-item-price">' +
+          money(product.price) + '</div>' + itemButton(product, true) + '</div></div></div>';
+      });
+      list.innerHTML = '<div class="cart_quantity_label">QTY</div><div class="cart_desc_label">Description</div>' +
+        rows.join('');
+    }
+    bindCartButtons(list, render);
+    $('#continue-shopping').addEventListener('click', function () { window.location.assign('/inventory.html'); });
+    $('#checkout').addEventListener('click', function () { window.location.assign('/checkout-step-one.html'); });
+    render();
+  }
+
+  function initCheckoutStepOne() {
+    if (!requireSession('/checkout-step-one.html')) { return; }
+    renderHeader();
+    $('#cancel').addEventListener('click', function () { window.location.assign('/cart.html'); });
+    $('#checkout_info_container form').addEventListener('submit', function (event) {
+      event.preventDefault();
+      var error = '';
+      if (!$('#first-name').value) {
+        error = 'Error: First Name is required';
+      } else if (!$('#last-name').value) {
+        error = 'Error: Last Name is required';
+      } else if (!$('#postal-code').value) {
+        error = 'Error: Postal Code is required';
+      }
+      if (error) {
+        showError(error);
+        return;
+      }
+      window.location.assign('/checkout-step-two.html');
+    });
+  }
+
+  function initCheckoutStepTwo() {
+    if (!requireSession('/checkout-step-two.html')) { return; }
+    renderHeader();
+    var products = readCart().map(productById).filter(Boolean);
+    var subtotal = products.reduce(function (sum, product) { return sum + product.price; }, 0);
+    var tax = Math.round(subtotal * CONFIG.taxRate * 100) / 100;
+    $('.cart_list').innerHTML = products.map(function (product) {
+      return '<div class="cart_item" data-test="inventory-item"><div class="cart_quantity">1</div>' +
+        '<div class="inventory_item_name" data-test="inventory-item-name">' + esc(product.name) + '</div>' +
+        '<div class="inventory_item_price" data-test="inventory-item-price">' + money(product.price) + '</div></div>';
+    }).join('');
+    $('.summary_subtotal_label').textContent = 'Item total: ' + money(subtotal);
+    $('.summary_tax_label').textContent = 'Tax: ' + money(tax);
+    $('.summary_total_label').textContent = 'Total: ' + money(subtotal + tax);
+    $('#cancel').addEventListener('click', function () { window.location.assign('/inventory.html'); });
+    $('#finish').addEventListener('click', function () {
+      if (currentUser() === 'error_user') { return; }
+      writeCart([]);
+      window.location.assign('/checkout-complete.html');
+    });
+  }
+
+  function initCheckoutComplete() {
+    if (!requireSession('/checkout-complete.html')) { return; }
+    renderHeader();
+    $('#back-to-products').addEventListener('click', function () { window.location.assign('/inventory.html'); });
+  }
+
+  var PAGES = {
+    login: initLogin,
+    inventory: initInventory,
+    cart: initCart,
+    'checkout-step-one': initCheckoutStepOne,
+    'checkout-step-two': initCheckoutStepTwo,
+    'checkout-complete': initCheckoutComplete
+  };
+  PAGES[document.body.getAttribute('data-page')]();
+})();
+"""
+
+LOGIN_BODY = """
+<div class="login_container">
+  <div class="login_logo">Swag Labs</div>
+  <div class="login_wrapper">
+    <div id="login_button_container" class="form_column">
+      <form>
+        <input class="input_error form_input" placeholder="Username" type="text" data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none">
+        <input class="input_error form_input" placeholder="Password" type="password" data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none">
+        <div class="error-message-container"></div>
+        <input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" name="login-button" value="Login">
+      </form>
+    </div>
+  </div>
+</div>
+"""
+
+INVENTORY_BODY = """
+<div id="page_wrapper" class="page_wrapper">
+  <div id="contents_wrapper">
+    <div id="header_container" class="header_container" data-test="header-container"></div>
+    <div class="header_secondary_container" data-test="secondary-header">
+      <span class="title" data-test="title">Products</span>
+      <div class="right_component">
+        <span class="select_container">
+          <span class="active_option" data-test="active-option">Name (A to Z)</span>
+          <select class="product_sort_container" data-test="product-sort-container">
+            <option value="az">Name (A to Z)</option>
+            <option value="za">Name (Z to A)</option>
+            <option value="lohi">Price (low to high)</option>
+            <option value="hilo">Price (high to low)</option>
+          </select>
+        </span>
+      </div>
+    </div>
+    <div id="inventory_container" class="inventory_container" data-test="inventory-container">
+      <div class="inventory_list" data-test="inventory-list"></div>
+    </div>
+  </div>
+</div>
+"""
+
+CART_BODY = """
+<div id="page_wrapper" class="page_wrapper">
+  <div id="contents_wrapper">
+    <div id="header_container" class="header_container" data-test="header-container"></div>
+    <div class="header_secondary_container"><span class="title" data-test="title">Your Cart</span></div>
+    <div id="cart_contents_container" class="cart_contents_container">
+      <div class="cart_list" data-test="cart-list"></div>
+      <div class="cart_footer">
+        <button class="btn btn_secondary back btn_medium" data-test="continue-shopping" id="continue-shopping" name="continue-shopping">Continue Shopping</button>
+        <button class="btn btn_action btn_medium checkout_button" data-test="checkout" id="checkout" name="checkout">Checkout</button>
+      </div>
+    </div>
+  </div>
+</div>
+"""
+
+CHECKOUT_STEP_ONE_BODY = """
+<div id="page_wrapper" class="page_wrapper">
+  <div id="contents_wrapper">
+    <div id="header_container" class="header_container" data-test="header-container"></div>
+    <div class="header_secondary_container"><span class="title" data-test="title">Checkout: Your Information</span></div>
+    <div id="checkout_info_container" class="checkout_info_container">
+      <form>
+        <input class="input_error form_input" placeholder="First Name" type="text" data-test="firstName" id="first-name" name="firstName">
+        <input class="input_error form_input" placeholder="Last Name" type="text" data-test="lastName" id="last-name" name="lastName">
+        <input class="input_error form_input" placeholder="Zip/Postal Code" type="text" data-test="postalCode" id="postal-code" name="postalCode">
+        <div class="error-message-container"></div>
+        <button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel" name="cancel" type="button">Cancel</button>
+        <input type="submit" class="submit-button btn btn_primary cart_button btn_action" data-test="continue" id="continue" name="continue" value="Continue">
+      </form>
+    </div>
+  </div>
+</div>
+"""
+
+CHECKOUT_STEP_TWO_BODY = """
+<div id="page_wrapper" class="page_wrapper">
+  <div id="contents_wrapper">
+    <div id="header_container" class="header_container" data-test="header-container"></div>
+    <div class="header_secondary_container"><span class="title" data-test="title">Checkout: Overview</span></div>
+    <div id="checkout_summary_container" class="checkout_summary_container">
+      <div class="cart_list" data-test="cart-list"></div>
+      <div class="summary_info" data-test="summary-info">
+        <div class="summary_subtotal_label" data-test="subtotal-label"></div>
+        <div class="summary_tax_label" data-test="tax-label"></div>
+        <div class="summary_total_label" data-test="total-label"></div>
+        <button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel" name="cancel">Cancel</button>
+        <button class="btn btn_action btn_medium cart_button" data-test="finish" id="finish" name="finish">Finish</button>
+      </div>
+    </div>
+  </div>
+</div>
+"""
+
+CHECKOUT_COMPLETE_BODY = """
+<div id="page_wrapper" class="page_wrapper">
+  <div id="contents_wrapper">
+    <div id="header_container" class="header_container" data-test="header-container"></div>
+    <div class="header_secondary_container"><span class="title" data-test="title">Checkout: Complete!</span></div>
+    <div id="checkout_complete_container" class="checkout_complete_container" data-test="checkout-complete-container">
+      <h2 class="complete-header" data-test="complete-header">Thank you for your order!</h2>
+      <div class="complete-text" data-test="complete-text">Your order has been dispatched, and will arrive just as fast as the pony can get there!</div>
+      <button class="btn btn_primary btn_small" data-test="back-to-products" id="back-to-products" name="back-to-products">Back Home</button>
+    </div>
+  </div>
+</div>
+"""
+
+# Route path -> (page name, body markup)
+PAGES = {
+    "/": ("login", LOGIN_BODY),
+    "/inventory.html": ("inventory", INVENTORY_BODY),
+    "/cart.html": ("cart", CART_BODY),
+    "/checkout-step-one.html": ("checkout-step-one", CHECKOUT_STEP_ONE_BODY),
+    "/checkout-step-two.html": ("checkout-step-two", CHECKOUT_STEP_TWO_BODY),
+    "/checkout-complete.html": ("checkout-complete", CHECKOUT_COMPLETE_BODY),
+}
+
+
+def render_page(page_name: str, body: str, config: Dict[str, Any]) -> bytes:
+    """
+    Render a complete HTML document for one application page.
+
+    Args:
+        page_name: Name the client-side app uses to pick the page initializer
+        body: Page body markup
+        config: Application config embedded as window.__SAUCE_CONFIG__
+
+    Returns:
+        Encoded HTML document
+    """
+    config_json = json.dumps(config, separators=(",", ":")).replace("</", "<\\/")
+    html = (
+        "<!DOCTYPE html>\n"
+        '<html lang="en"><head><meta charset="utf-8">'
+        "<title>Swag Labs</title>"
+        '<link rel="stylesheet" href="/static/css/app.css">'
+        "</head>"
+        f'<body data-page="{page_name}"><div id="root">{body}</div>'
+        f"<script>window.__SAUCE_CONFIG__ = {config_json};</script>"
+        '<script src="/static/js/app.js"></script>'
+        "</body></html>"
+    )
+    return html.encode("utf-8")
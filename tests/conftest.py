@@ -1,10 +1,194 @@
 """
 Pytest configuration and fixtures.
 """
+import json
+import os
+import shutil
+from typing import Optional
+
 import pytest
 from playwright.sync_api import Page as SyncPage
 from playwright.async_api import Page as AsyncPage
-from pages import LoginPage, InventoryPage
+from data import URLS, VALID_USERS
+from pages import LoginPage, InventoryPage, state
+from server import StandInServer
+from utils.auth_cache import LoginCache
+from utils import action_timing
+from utils.browser_pool import ContextPool
+from utils.duration_scheduler import (
+    DEFAULT_HISTORY_PATH, DurationHistory, DurationRecorder, DurationSchedulerPlugin,
+    is_available as duration_scheduling_available
+)
+from utils.failure_capture import FailureCapture
+from utils.har_replay import get_har_archive
+from utils.page_metrics import METRICS_DIR, recorder as page_metrics
+from utils.network_profiles import STATS_DIR, NetworkRouter, NetworkStats
+from utils.reruns import RerunPlugin, attempts_of, retries_from_config
+from utils.screenshots import capture_settings, screenshots
+from utils.sharding import ShardPlugin, parse_shard
+from utils.test_utils import EnvironmentUtils, ResultAggregator, TestUtils
+
+
+# Set on a test item once its setup or call has failed
+_failed_key = pytest.StashKey[bool]()
+
+
+def pytest_addoption(parser):
+    """Register the duration scheduling, sharding and rerun options."""
+    group = parser.getgroup("duration scheduling")
+    group.addoption(
+        "--duration-schedule", action="store_true", default=False,
+        help="With -n, hand out tests to xdist workers longest first using recorded durations"
+    )
+    group.addoption(
+        "--duration-history", default=DEFAULT_HISTORY_PATH,
+        help=f"Per-test duration history file (default: {DEFAULT_HISTORY_PATH})"
+    )
+    group.addoption(
+        "--shard", default=None, metavar="I/N",
+        help="Run only shard I of N, balanced by recorded durations"
+    )
+    group = parser.getgroup("reruns")
+    group.addoption(
+        "--retries", type=int, default=None,
+        help="Reruns of a failed test (default: retries in playwright.config.py)"
+    )
+    group.addoption(
+        "--max-session-reruns", type=int, default=10,
+        help="Reruns allowed per worker across all tests (default: 10)"
+    )
+
+
+def pytest_configure(config):
+    """
+    Register the benchmark marker, select this job's shard, rerun failed
+    tests, record test durations on the controller and install the LPT
+    scheduler.
+    """
+    config.addinivalue_line("markers", "benchmark: Latency benchmarks (BENCHMARK=true)")
+    history = DurationHistory(config.getoption("duration_history"))
+    config.pluginmanager.register(RerunPlugin(
+        retries_from_config(config.getoption("retries")), config.getoption("max_session_reruns")
+    ), "reruns")
+    if config.getoption("shard"):
+        try:
+            index, count = parse_shard(config.getoption("shard"))
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+        config.pluginmanager.register(ShardPlugin(index, count, history), "shard")
+    if hasattr(config, "workerinput"):
+        return
+    config.pluginmanager.register(DurationRecorder(history), "duration-recorder")
+    if config.getoption("duration_schedule") and duration_scheduling_available():
+        config.pluginmanager.register(DurationSchedulerPlugin(history), "duration-scheduler")
+
+
+@pytest.fixture(autouse=True)
+def action_timing_tags(request):
+    """Tag page object timings, page metrics and log events with the current test id and browser."""
+    action_timing.set_tags(test_id=request.node.nodeid, browser="", user="")
+    if action_timing.timings.enabled and "browser_name" in request.fixturenames:
+        action_timing.set_tags(browser=request.getfixturevalue("browser_name"))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_server():
+    """
+    Start the bundled SauceDemo stand-in server when LOCAL_SERVER=true.
+    Each xdist worker runs its own server on its own port.
+    """
+    if not EnvironmentUtils.is_local_server_enabled():
+        yield None
+        return
+    server = StandInServer.from_environment().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, browser_context_args):
+    """
+    Worker-scoped pool of warm browser contexts, enabled with CONTEXT_POOL=true.
+    Returns None when pooling is disabled.
+    """
+    if not EnvironmentUtils.is_context_pool_enabled():
+        yield None
+        return
+    pool = ContextPool(
+        browser, browser_context_args, **EnvironmentUtils.get_context_pool_settings()
+    )
+    pool.prewarm()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def network_router() -> NetworkRouter:
+    """
+    Worker-scoped router for the NETWORK_PROFILE resource-blocking profile.
+    Its statistics are written per worker at session end.
+    """
+    router = NetworkRouter.from_environment()
+    yield router
+    if router.profile.is_active:
+        router.stats.dump(router.profile.name)
+
+
+@pytest.fixture(scope="session")
+def har_archive():
+    """HAR record-and-replay archives selected by HAR_MODE."""
+    return get_har_archive()
+
+
+def _install_routes(context, request, network_router, har_archive) -> None:
+    """Install the network profile, then the test's HAR archive on top of it."""
+    network_router.install(context)
+    options = har_archive.options(request.node.nodeid)
+    if options:
+        context.route_from_har(**options)
+    if har_archive.is_active:
+        har_archive.mark_installed(context)
+
+
+@pytest.fixture(scope="session")
+def failure_capture(pytestconfig) -> FailureCapture:
+    """
+    Trace chunks and screencast buffers kept only for failing tests, enabled
+    with FAILURE_TRACE and FAILURE_SCREENCAST_SECONDS. Tracing is left to
+    pytest-playwright when its --tracing option is used.
+    """
+    capture = FailureCapture.from_environment()
+    if pytestconfig.getoption("--tracing") != "off":
+        capture.trace = False
+    return capture
+
+
+@pytest.fixture
+def page(request, context_pool, network_router, har_archive, failure_capture):
+    """
+    Page for the current test.
+    Drawn from the context pool when enabled, otherwise created in the
+    pytest-playwright per-test context (keeping its tracing and video).
+    The network profile and HAR archive are installed before the page is used.
+    """
+    # Recorded archives are only written when their context closes
+    if context_pool is None or har_archive.records:
+        context = request.getfixturevalue("context")
+        _install_routes(context, request, network_router, har_archive)
+        test_page = context.new_page()
+    else:
+        test_page = context_pool.acquire_page()
+        # Pool resets drop every route, so routes are installed per checkout
+        _install_routes(test_page.context, request, network_router, har_archive)
+    if failure_capture.is_active:
+        failure_capture.start(test_page, request.node.nodeid)
+    yield test_page
+    if failure_capture.is_active:
+        failed = request.node.stash.get(_failed_key, False)
+        for path in failure_capture.finish(test_page, request.node.nodeid, failed):
+            request.node.user_properties.append(("failure_artifact", path))
+    if context_pool is not None and not har_archive.records:
+        context_pool.release(test_page.context)
 
 
 @pytest.fixture
@@ -19,16 +203,183 @@ def inventory_page(page) -> InventoryPage:
     return InventoryPage(page)
 
 
+@pytest.fixture(scope="session")
+def login_cache(browser, browser_context_args) -> LoginCache:
+    """
+    Worker-scoped login cache.
+    Each user from VALID_USERS logs in through the UI once per worker; later
+    contexts are authenticated from the saved storage_state.
+    """
+    return LoginCache(browser, browser_context_args)
+
+
+def _opened_inventory(page) -> bool:
+    """Open the inventory page and check with one wait whether the session was accepted."""
+    page.goto(URLS["inventory"])
+    page.locator(
+        f"{InventoryPage.inventory_container}, {LoginPage.login_button}"
+    ).first.wait_for()
+    return page.locator(InventoryPage.inventory_container).is_visible()
+
+
 @pytest.fixture
-async def authenticated_page(page):
+def login_as(page, login_cache, context_pool):
+    """
+    Factory that authenticates the test's page as a given user and opens
+    the inventory page. The session cookie is set directly; if the app
+    rejects it, the cached UI login is restored instead, logging in again
+    once if that session was rejected too.
+    """
+    def _login_as(username: str = "standard_user"):
+        action_timing.set_tags(user=username)
+        if username in VALID_USERS:
+            state.set_session_cookie(page.context, VALID_USERS[username]["username"], URLS["base_url"])
+            if _opened_inventory(page):
+                return page
+            page.context.clear_cookies()
+        for _ in range(2):
+            if login_cache.apply(page.context, username) and context_pool is not None:
+                context_pool.mark_dirty(page.context)
+            if _opened_inventory(page):
+                return page
+            page.context.clear_cookies()
+            login_cache.invalidate(username)
+        raise RuntimeError(f"Could not restore a session for {username}")
+    return _login_as
+
+
+@pytest.fixture
+def authenticated_page(login_as):
     """
     Create an authenticated page session.
-    Logs in with standard user and returns the page object.
+    Restores the cached standard user session and returns the page object.
+    """
+    return login_as("standard_user")
+
+
+@pytest.fixture
+def seed_cart(page, context_pool):
     """
-    login_page = LoginPage(page)
-    await login_page.navigate_to_login()
-    await login_page.login("standard_user", "secret_sauce")
-    return page
+    Factory that puts products (names or item ids) in the cart through
+    localStorage instead of UI clicks. The cart shows after the next
+    navigation.
+    """
+    def _seed_cart(*products):
+        ids = state.item_ids(products)
+        if state.is_on_origin(page, URLS["inventory"]):
+            state.write_cart(page, ids)
+        else:
+            state.seed_cart_on_load(page, URLS["inventory"], ids)
+            if context_pool is not None:
+                context_pool.mark_dirty(page.context)
+        return ids
+    return _seed_cart
+
+
+# Streams every finished test result on the controller process
+RESULTS_FILE = os.path.join("test-results", "results.jsonl")
+_results: Optional[ResultAggregator] = None
+
+
+def pytest_sessionstart(session):
+    """Drop statistics left over from a previous run and start result streaming."""
+    global _results
+    if not hasattr(session.config, "workerinput"):
+        shutil.rmtree(STATS_DIR, ignore_errors=True)
+        shutil.rmtree(action_timing.TIMINGS_DIR, ignore_errors=True)
+        shutil.rmtree(METRICS_DIR, ignore_errors=True)
+        if os.path.exists(RESULTS_FILE):
+            os.remove(RESULTS_FILE)
+        _results = ResultAggregator(RESULTS_FILE)
+
+
+def pytest_runtest_logreport(report):
+    """Append each test's outcome to the results stream as it finishes."""
+    if _results is None:
+        return
+    if report.outcome == "rerun":
+        return
+    if report.when == "call" or (report.when == "setup" and not report.passed):
+        attempts = attempts_of(report)
+        _results.add({
+            "nodeid": report.nodeid,
+            "status": "flaky" if report.passed and attempts > 1 else report.outcome,
+            "duration": round(report.duration, 4),
+            "attempts": attempts,
+            "worker": report.node.gateway.id if hasattr(report, "node") else "master",
+        })
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Attach the page performance metrics of a test to its call report, and a
+    screenshot when the test failed.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    # Setup starts every attempt, including reruns
+    if report.when == "setup" or report.failed:
+        item.stash[_failed_key] = report.failed
+    if report.when == "call" and report.failed and "page" in item.funcargs:
+        _capture_failure(item, report)
+    if report.when == "call" and page_metrics.enabled:
+        for entry in page_metrics.for_test(item.nodeid):
+            report.user_properties.append(("page_metrics", json.dumps(entry)))
+
+
+def _capture_failure(item, report) -> None:
+    """Queue a screenshot of the failed test's page; the write happens in the background."""
+    if not EnvironmentUtils.get_screenshot_settings()["on_failure"]:
+        return
+    page = item.funcargs["page"]
+    if not isinstance(page, SyncPage) or page.is_closed():
+        return
+    try:
+        path = screenshots.capture(
+            page, item.nodeid, status="failure", **capture_settings()
+        )
+    except Exception:
+        return
+    report.user_properties.append(("screenshot", path))
+
+
+def pytest_sessionfinish(session):
+    """Dump this process's timings and page metrics, and summarize the results."""
+    action_timing.timings.dump()
+    page_metrics.dump()
+    screenshots.flush()
+    if _results is not None:
+        _results.close()
+        TestUtils.save_test_results(_results.summary(), "results-summary.json", indent=None)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report requests and bytes saved by the network profile across workers."""
+    if hasattr(terminalreporter.config, "workerinput"):
+        return
+    stats = NetworkStats.merge()
+    saved = stats["requests"]["block"] + stats["requests"]["stub"]
+    if saved:
+        total = saved + stats["requests"]["allow"]
+        terminalreporter.write_sep("-", f"network profile: {stats.get('profile')}")
+        terminalreporter.write_line(
+            f"{saved}/{total} requests blocked or stubbed "
+            f"(~{stats['estimated_bytes_saved'] / 1024:.0f} KiB saved), by type: "
+            + ", ".join(f"{k}={v}" for k, v in sorted(stats["saved_by_type"].items()))
+        )
+    rows = action_timing.summarize(action_timing.merge_timings())
+    if rows:
+        TestUtils.save_test_results(rows, "timings/actions-summary.json")
+        terminalreporter.write_sep("-", "page object action latency (ms)")
+        terminalreporter.write_line(
+            f"{'action':<48}{'count':>7}{'total':>10}{'p50':>9}{'p95':>9}{'p99':>9}"
+        )
+        for row in rows[:20]:
+            terminalreporter.write_line(
+                f"{row['action']:<48}{row['count']:>7}{row['total_ms']:>10}"
+                f"{row['p50']:>9}{row['p95']:>9}{row['p99']:>9}"
+            )
 
 
 # Test data fixtures
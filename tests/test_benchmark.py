@@ -0,0 +1,105 @@
+"""
+Latency benchmarks of key flows for every user in VALID_USERS.
+
+Enabled with BENCHMARK=true. Each flow is repeated after a warmup, outliers
+are dropped and the samples are compared against the stored baseline in
+benchmarks/; a test fails when the flow got significantly slower by more
+than BENCHMARK_BUDGET. BENCHMARK_UPDATE_BASELINE=true rewrites the baselines.
+"""
+import pytest
+from data import EXPECTED_PRODUCTS, TIMEOUTS, URLS, VALID_USERS
+from pages import InventoryPage, LoginPage, waits
+from utils.benchmark import measure, run_benchmark
+from utils.test_utils import EnvironmentUtils
+
+SETTINGS = EnvironmentUtils.get_benchmark_settings()
+
+# Backpack can be added to the cart by every user, quirky ones included
+BENCHMARK_PRODUCT = EXPECTED_PRODUCTS[0]["name"]
+
+# Sorting is deliberately broken for these users
+SORT_BROKEN_USERS = {"problem_user", "error_user"}
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(
+        not EnvironmentUtils.is_benchmark_enabled(), reason="set BENCHMARK=true to run benchmarks"
+    ),
+]
+
+
+def _user_params(skip_users=()):
+    """Parametrize over VALID_USERS, skipping users a flow does not apply to."""
+    return [
+        pytest.param(
+            name,
+            id=name,
+            marks=pytest.mark.skip(reason=f"flow is broken by design for {name}")
+            if name in skip_users else ()
+        )
+        for name in VALID_USERS
+    ]
+
+
+def _report(name, samples):
+    """Compare samples with the baseline and fail on a regression."""
+    comparison, summary = run_benchmark(name, samples)
+    print(f"📊 {summary}")
+    if comparison is not None:
+        assert not comparison.regressed, f"Latency regression: {summary}"
+
+
+class TestBenchmark:
+    """Repeated, timed runs of the login, sort and add-to-cart flows."""
+    
+    @pytest.mark.parametrize("user", _user_params())
+    def test_login_to_inventory(self, page, browser_name, user):
+        """Time from submitting the login form until products are rendered."""
+        credentials = VALID_USERS[user]
+        
+        def reset():
+            page.context.clear_cookies()
+            page.goto(URLS["login"])
+            page.fill(LoginPage.username_input, credentials["username"])
+            page.fill(LoginPage.password_input, credentials["password"])
+        
+        def flow():
+            page.click(LoginPage.login_button)
+            page.locator(InventoryPage.inventory_items).first.wait_for(
+                timeout=TIMEOUTS["performance_glitch"]
+            )
+        
+        samples = measure(flow, SETTINGS["iterations"], SETTINGS["warmup"], reset)
+        _report(f"login_to_inventory-{user}-{browser_name}", samples)
+    
+    @pytest.mark.parametrize("user", _user_params(SORT_BROKEN_USERS))
+    def test_sort_products(self, page, browser_name, login_as, user):
+        """Time from choosing a sort order until the list is re-ordered."""
+        login_as(user)
+        orders = iter(["za", "az"] * (SETTINGS["iterations"] + SETTINGS["warmup"]))
+        
+        def flow():
+            previous = page.locator(InventoryPage.item_names).all_text_contents()
+            page.select_option(InventoryPage.product_sort_dropdown, next(orders))
+            waits.list_order_changed(page, InventoryPage.item_names, previous)
+        
+        samples = measure(flow, SETTINGS["iterations"], SETTINGS["warmup"])
+        _report(f"sort_products-{user}-{browser_name}", samples)
+    
+    @pytest.mark.parametrize("user", _user_params())
+    def test_add_to_cart(self, page, browser_name, login_as, user):
+        """Time from clicking "Add to cart" until the cart badge updates."""
+        login_as(user)
+        product = page.locator(InventoryPage.inventory_items).filter(has_text=BENCHMARK_PRODUCT)
+        
+        def reset():
+            page.evaluate("() => window.localStorage.clear()")
+            page.reload()
+            waits.badge_count(page, InventoryPage.shopping_cart_badge, 0)
+        
+        def flow():
+            product.locator(InventoryPage.add_to_cart_buttons).click()
+            waits.badge_count(page, InventoryPage.shopping_cart_badge, 1)
+        
+        samples = measure(flow, SETTINGS["iterations"], SETTINGS["warmup"], reset)
+        _report(f"add_to_cart-{user}-{browser_name}", samples)
@@ -2,6 +2,7 @@
 Inventory page functionality tests for SauceDemo application.
 """
 import pytest
+from data import EXPECTED_PRODUCTS
 from pages import InventoryPage
 
 
@@ -53,10 +54,10 @@ class TestInventory:
     @pytest.mark.inventory
     async def test_remove_product_from_cart(self, authenticated_page, inventory_page: InventoryPage):
         """Test removing a product from the shopping cart."""
-        # Add a product first
-        product_names = await inventory_page.get_product_names()
-        first_product = product_names[0]
-        await inventory_page.add_product_to_cart_by_name(first_product)
+        # Seed the cart directly, adding through the UI is covered above
+        first_product = EXPECTED_PRODUCTS[0]["name"]
+        await inventory_page.seed_cart([first_product])
+        await inventory_page.navigate_to(inventory_page.inventory_url)
         
         # Get cart count after adding
         cart_count_after_add = await inventory_page.get_cart_badge_count()
@@ -167,8 +168,7 @@ class TestInventory:
         # Perform logout
         await inventory_page.logout()
         
-        # Verify redirect to login page
-        await login_page.page.wait_for_timeout(1000)  # Wait for redirect
+        # Verify redirect to login page (logout waits for the URL to settle)
         assert await login_page.is_login_page_loaded(), "Should be redirected to login page after logout"
         
         # Verify URL is login page
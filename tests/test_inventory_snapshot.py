@@ -0,0 +1,59 @@
+"""
+Unit tests for the snapshot cache of InventoryPage.
+"""
+import asyncio
+
+from pages import InventoryPage
+from utils.test_utils import EnvironmentUtils
+
+RAW_SNAPSHOT = {
+    "products": [[4, "Sauce Labs Backpack", "carry.allTheThings()", "$29.99", False]],
+    "badge": 0,
+    "sort": "az",
+}
+
+
+class _RecordingPage:
+    """Async page double answering snapshot evaluates and counting them."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.snapshot_reads = 0
+
+    async def evaluate(self, script, arg=None):
+        if isinstance(arg, dict) and "item" in arg:
+            self.snapshot_reads += 1
+            return RAW_SNAPSHOT
+        return None
+
+    async def goto(self, url):
+        self.url = url
+
+
+def _inventory_page() -> InventoryPage:
+    return InventoryPage(_RecordingPage(f"{EnvironmentUtils.get_base_url()}/inventory.html"))
+
+
+class TestSnapshotCache:
+    """Caching and invalidation of InventoryPage.snapshot."""
+
+    def test_snapshot_is_cached(self):
+        inventory_page = _inventory_page()
+        first = asyncio.run(inventory_page.snapshot())
+        assert asyncio.run(inventory_page.snapshot()) is first
+        assert inventory_page.page.snapshot_reads == 1
+        assert first.find("Sauce Labs Backpack").price == 29.99
+
+    def test_mutating_action_invalidates(self):
+        inventory_page = _inventory_page()
+        asyncio.run(inventory_page.snapshot())
+        asyncio.run(inventory_page.seed_cart(["Sauce Labs Backpack"]))
+        asyncio.run(inventory_page.snapshot())
+        assert inventory_page.page.snapshot_reads == 2
+
+    def test_navigation_invalidates(self):
+        inventory_page = _inventory_page()
+        asyncio.run(inventory_page.snapshot())
+        asyncio.run(inventory_page.navigate_to(inventory_page.inventory_url))
+        asyncio.run(inventory_page.snapshot())
+        assert inventory_page.page.snapshot_reads == 2
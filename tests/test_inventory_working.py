@@ -2,23 +2,16 @@
 Working inventory tests for SauceDemo application using pytest-playwright.
 """
 import pytest
+from data import EXPECTED_PRODUCTS, URLS
+from pages import state, waits
+from pages.inventory_page import parse_snapshot, read_snapshot
 
 
 class TestInventoryWorking:
     """Test class for inventory page functionality that works with pytest-playwright."""
     
-    def authenticated_session(self, page):
-        """Helper to log in and get to inventory page."""
-        page.goto("https://www.saucedemo.com/")
-        page.locator("[data-test='username']").fill("standard_user")
-        page.locator("[data-test='password']").fill("secret_sauce")
-        page.locator("[data-test='login-button']").click()
-        page.wait_for_url("**/inventory.html")
-    
-    def test_inventory_page_loads(self, page):
+    def test_inventory_page_loads(self, page, authenticated_page):
         """Test that inventory page loads correctly after authentication."""
-        self.authenticated_session(page)
-        
         # Verify inventory page is loaded
         assert page.locator(".inventory_container").is_visible(), "Inventory page should be loaded"
         
@@ -28,10 +21,8 @@ class TestInventoryWorking:
         assert product_count > 0, "Products should be displayed on the page"
         print(f"✅ Found {product_count} products")
     
-    def test_product_display(self, page):
+    def test_product_display(self, page, authenticated_page):
         """Test that products are displayed with required information."""
-        self.authenticated_session(page)
-        
         # Get product information
         product_names = page.locator(".inventory_item_name").all_text_contents()
         product_prices = page.locator(".inventory_item_price").all_text_contents()
@@ -47,10 +38,8 @@ class TestInventoryWorking:
         
         print(f"✅ Found {len(product_names)} products with proper names and prices")
     
-    def test_add_product_to_cart(self, page):
+    def test_add_product_to_cart(self, page, authenticated_page):
         """Test adding a product to the shopping cart."""
-        self.authenticated_session(page)
-        
         # Get initial cart count (should be 0 or empty)
         cart_badge = page.locator(".shopping_cart_badge")
         initial_count = 0
@@ -68,46 +57,48 @@ class TestInventoryWorking:
         
         print(f"✅ Cart count increased from {initial_count} to {updated_count}")
     
-    def test_remove_product_from_cart(self, page):
+    def test_remove_product_from_cart(self, page, authenticated_page, seed_cart):
         """Test removing a product from the shopping cart."""
-        self.authenticated_session(page)
-        
-        # Add a product first
-        first_add_button = page.locator("button[id^='add-to-cart']").first
-        first_add_button.click()
-        
-        # Wait for cart badge and get count
-        page.wait_for_selector(".shopping_cart_badge")
-        count_after_add = int(page.locator(".shopping_cart_badge").text_content())
-        
-        # Remove the product (button should change to "Remove")
-        first_remove_button = page.locator("button[id^='remove']").first
-        first_remove_button.click()
+        # Seed the cart directly, adding through the UI is covered above
+        first_product = EXPECTED_PRODUCTS[0]
+        seed_cart(first_product["name"])
+        page.goto(URLS["inventory"])
+        assert page.locator(".shopping_cart_badge").text_content() == "1", "Seeded product should be in the cart"
         
-        # Verify cart count decreased or badge disappeared
-        page.wait_for_timeout(1000)  # Wait for UI update
+        # Remove the product (its button shows "Remove" after seeding)
+        page.locator(f"#remove-{first_product['id']}").click()
         
-        cart_badge = page.locator(".shopping_cart_badge")
-        if cart_badge.is_visible():
-            count_after_remove = int(cart_badge.text_content())
-            assert count_after_remove == count_after_add - 1, "Cart count should decrease by 1"
-        else:
-            # Badge disappeared, meaning cart is empty (count = 0)
-            count_after_remove = 0
-            assert count_after_remove == count_after_add - 1, "Cart should be empty after removing item"
+        # Verify the badge disappeared and the cart is empty
+        waits.badge_count(page, ".shopping_cart_badge", 0)
+        assert state.read_cart(page) == [], "Cart should be empty after removing the item"
         
-        print(f"✅ Cart count decreased from {count_after_add} to {count_after_remove}")
+        print(f"✅ Removed {first_product['name']} from the cart")
     
-    def test_product_sorting_name_az(self, page):
+    def test_inventory_snapshot(self, page, authenticated_page):
+        """Test that a single snapshot captures every product and the page state."""
+        snapshot = parse_snapshot(page.url, read_snapshot(page))
+        
+        # Verify every expected product is listed with its id and price
+        assert len(snapshot.products) == len(EXPECTED_PRODUCTS), "Snapshot should list every product"
+        for expected in EXPECTED_PRODUCTS:
+            product = snapshot.find(expected["name"])
+            assert product is not None, f"Snapshot should include {expected['name']}"
+            assert product.item_id == expected["item_id"], f"Unexpected item id for {expected['name']}"
+            assert product.price_text == expected["price"], f"Unexpected price for {expected['name']}"
+            assert not product.in_cart, f"{expected['name']} should not be in the cart yet"
+        
+        # Verify page level state
+        assert snapshot.cart_count == 0, "Cart should be empty"
+        assert snapshot.sort_option == "az", "Default sort should be name A-Z"
+    
+    def test_product_sorting_name_az(self, page, authenticated_page):
         """Test sorting products by name A-Z."""
-        self.authenticated_session(page)
-        
-        # Sort products by name A-Z
+        # Sort products by name A-Z (already the default order)
+        names_before = page.locator(".inventory_item_name").all_text_contents()
         page.locator(".product_sort_container").select_option("az")
         
-        # Get product names after sorting
-        page.wait_for_timeout(1000)  # Wait for sorting to complete
-        product_names = page.locator(".inventory_item_name").all_text_contents()
+        # Get product names once they are in A-Z order
+        product_names = waits.list_order_is(page, ".inventory_item_name", sorted(names_before))
         
         # Verify products are sorted A-Z
         sorted_names = sorted(product_names)
@@ -115,15 +106,14 @@ class TestInventoryWorking:
         
         print(f"✅ Products sorted A-Z: {product_names[:2]}...")
     
-    def test_product_sorting_name_za(self, page):
+    def test_product_sorting_name_za(self, page, authenticated_page):
         """Test sorting products by name Z-A."""
-        self.authenticated_session(page)
-        
         # Sort products by name Z-A
+        names_before = page.locator(".inventory_item_name").all_text_contents()
         page.locator(".product_sort_container").select_option("za")
         
         # Get product names after sorting
-        page.wait_for_timeout(1000)  # Wait for sorting to complete
+        waits.list_order_changed(page, ".inventory_item_name", names_before)
         product_names = page.locator(".inventory_item_name").all_text_contents()
         
         # Verify products are sorted Z-A
@@ -132,10 +122,8 @@ class TestInventoryWorking:
         
         print(f"✅ Products sorted Z-A: {product_names[:2]}...")
     
-    def test_shopping_cart_navigation(self, page):
+    def test_shopping_cart_navigation(self, page, authenticated_page):
         """Test navigation to shopping cart page."""
-        self.authenticated_session(page)
-        
         # Click shopping cart
         page.locator(".shopping_cart_link").click()
         
@@ -146,10 +134,8 @@ class TestInventoryWorking:
         
         print("✅ Successfully navigated to cart page")
     
-    def test_logout_functionality(self, page):
+    def test_logout_functionality(self, page, authenticated_page):
         """Test logout functionality from inventory page."""
-        self.authenticated_session(page)
-        
         # Open menu
         page.locator("#react-burger-menu-btn").click()
         
@@ -158,7 +144,7 @@ class TestInventoryWorking:
         page.locator("#logout_sidebar_link").click()
         
         # Verify redirect to login page
-        page.wait_for_url("https://www.saucedemo.com/")
+        page.wait_for_url(URLS["login"])
         assert page.locator("[data-test='username']").is_visible(), "Should be redirected to login page after logout"
         
         # Verify URL is login page
@@ -173,13 +159,21 @@ class TestInventoryWorking:
         ("lohi", "price_ascending"),
         ("hilo", "price_descending")
     ])
-    def test_product_sorting_options(self, page, sort_option, expected_order):
+    def test_product_sorting_options(self, page, authenticated_page, sort_option, expected_order):
         """Test all sorting options."""
-        self.authenticated_session(page)
-        
         # Apply sorting
+        names_before = page.locator(".inventory_item_name").all_text_contents()
+        prices_before = page.locator(".inventory_item_price").all_text_contents()
         page.locator(".product_sort_container").select_option(sort_option)
-        page.wait_for_timeout(1000)
+        
+        # Wait for the expected order; equal prices keep any name order
+        if "price" in expected_order:
+            expected = sorted(prices_before, key=lambda p: float(p.replace("$", "")),
+                              reverse="descending" in expected_order)
+            waits.list_order_is(page, ".inventory_item_price", expected)
+        else:
+            expected = sorted(names_before, reverse=expected_order == "descending")
+            waits.list_order_is(page, ".inventory_item_name", expected)
         
         if "price" in expected_order:
             # Test price sorting
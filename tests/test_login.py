@@ -108,9 +108,8 @@ class TestLogin:
         # Dismiss the error
         await login_page.dismiss_error()
         
-        # Verify error is no longer displayed (may take a moment)
-        await login_page.page.wait_for_timeout(500)
-        assert not await login_page.is_error_displayed(), "Error should be dismissed"
+        # Verify error is no longer displayed (dismiss_error waits for its removal)
+        assert not await login_page.is_visible_now(login_page.error_message), "Error should be dismissed"
     
     @pytest.mark.login
     async def test_login_page_elements(self, login_page: LoginPage):
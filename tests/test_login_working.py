@@ -2,6 +2,7 @@
 Working login tests for SauceDemo application using pytest-playwright.
 """
 import pytest
+from data import URLS
 from pages import LoginPage, InventoryPage
 
 
@@ -15,7 +16,7 @@ class TestLoginWorking:
         inventory_page = InventoryPage(page)
         
         # Navigate to login page
-        page.goto("https://www.saucedemo.com/")
+        page.goto(URLS["login"])
         
         # Verify login page is loaded
         assert page.locator("[data-test='username']").is_visible(), "Username field should be visible"
@@ -40,7 +41,7 @@ class TestLoginWorking:
     
     def test_login_with_empty_credentials(self, page):
         """Test login attempt with empty credentials."""
-        page.goto("https://www.saucedemo.com/")
+        page.goto(URLS["login"])
         
         # Attempt login with empty credentials (just click login button)
         page.locator("[data-test='login-button']").click()
@@ -54,7 +55,7 @@ class TestLoginWorking:
     
     def test_login_with_invalid_credentials(self, page):
         """Test login attempt with invalid credentials."""
-        page.goto("https://www.saucedemo.com/")
+        page.goto(URLS["login"])
         
         # Attempt login with invalid credentials
         page.locator("[data-test='username']").fill("invalid_user")
@@ -70,7 +71,7 @@ class TestLoginWorking:
     
     def test_login_locked_out_user(self, page):
         """Test login attempt with locked out user."""
-        page.goto("https://www.saucedemo.com/")
+        page.goto(URLS["login"])
         
         # Attempt login with locked out user
         page.locator("[data-test='username']").fill("locked_out_user")
@@ -92,7 +93,7 @@ class TestLoginWorking:
     ])
     def test_login_various_users(self, page, username, password, should_succeed):
         """Test login with various user accounts."""
-        page.goto("https://www.saucedemo.com/")
+        page.goto(URLS["login"])
         
         # Perform login
         page.locator("[data-test='username']").fill(username)
@@ -0,0 +1,56 @@
+"""
+Unit tests for the shard partitioning used by --shard.
+"""
+import pytest
+
+from utils.duration_scheduler import DurationHistory
+from utils.sharding import assign_shards, parse_shard
+
+NODEIDS = [f"tests/test_x.py::test_case[{index}]" for index in range(20)]
+
+
+def _history(durations) -> DurationHistory:
+    history = DurationHistory("does-not-exist.json")
+    history.durations = dict(durations)
+    return history
+
+
+class TestParseShard:
+    """Parsing of I/N shard specifications."""
+
+    def test_valid(self):
+        assert parse_shard("1/4") == (1, 4)
+        assert parse_shard("4/4") == (4, 4)
+
+    @pytest.mark.parametrize("value", ["0/4", "5/4", "1/0", "1", "a/b", "1/2/3"])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+
+class TestAssignShards:
+    """Duration-balanced, deterministic partitioning."""
+
+    def test_every_test_in_exactly_one_shard(self):
+        shards = assign_shards(NODEIDS, 3)
+        assert set(shards) == set(NODEIDS)
+        assert set(shards.values()) == {1, 2, 3}
+
+    def test_independent_of_collection_order(self):
+        history = _history({nodeid: index * 0.7 for index, nodeid in enumerate(NODEIDS)})
+        assert assign_shards(NODEIDS, 4, history) == assign_shards(NODEIDS[::-1], 4, history)
+
+    def test_equal_counts_without_history(self):
+        counts = sorted(list(assign_shards(NODEIDS, 4).values()).count(s) for s in range(1, 5))
+        assert counts == [5, 5, 5, 5]
+
+    def test_near_zero_durations_are_spread(self):
+        history = _history({nodeid: 0.0002 + (index % 2) * 0.0001 for index, nodeid in enumerate(NODEIDS)})
+        counts = [list(assign_shards(NODEIDS, 4, history).values()).count(s) for s in range(1, 5)]
+        assert counts == [5, 5, 5, 5]
+
+    def test_balanced_by_duration(self):
+        durations = {nodeid: 10.0 if index < 2 else 1.0 for index, nodeid in enumerate(NODEIDS)}
+        shards = assign_shards(NODEIDS, 2, _history(durations))
+        loads = [sum(d for n, d in durations.items() if shards[n] == s) for s in (1, 2)]
+        assert loads == [19.0, 19.0]
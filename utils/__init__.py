@@ -1,13 +1,15 @@
 """
 Utils initialization file.
 """
-from .test_utils import TestUtils, EnvironmentUtils, ReportUtils
+from .test_utils import TestUtils, EnvironmentUtils, ReportUtils, ResultAggregator, WaitResult
 from .logger import TestLogger, get_logger, logger
 
 __all__ = [
     "TestUtils",
     "EnvironmentUtils", 
     "ReportUtils",
+    "ResultAggregator",
+    "WaitResult",
     "TestLogger",
     "get_logger",
     "logger"
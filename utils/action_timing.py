@@ -0,0 +1,291 @@
+"""
+Per-action latency instrumentation for page objects.
+
+Every public coroutine method of BasePage and its subclasses is wrapped by
+instrument_class(). When ACTION_TIMING=true each call is timed into a
+log-bucketed histogram keyed by action, test id, browser and user; the tags
+come from context variables set by the fixtures, so concurrent asyncio
+tasks keep their own tags. Only top-level calls are recorded: a page
+object method called by another one (BasePage.click_element inside
+LoginPage.login) counts towards its caller, so every sample is an
+inclusive user-level action. When timing is off the wrapper costs one flag
+check per call.
+
+Each worker dumps its histograms as JSON at session end; the controller
+merges them and reports p50/p95/p99 per action.
+"""
+import contextvars
+import functools
+import glob
+import inspect
+import json
+import math
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .test_utils import EnvironmentUtils, TestUtils
+
+# Directory where each worker writes its histograms
+TIMINGS_DIR = os.path.join("test-results", "timings")
+
+# Relative width of a histogram bucket (5% resolution)
+_BUCKET_BASE = math.log(1.05)
+
+# Durations below this many milliseconds share the first bucket
+_MIN_MS = 0.01
+
+_test_id: "contextvars.ContextVar[str]" = contextvars.ContextVar("test_id", default="")
+_browser: "contextvars.ContextVar[str]" = contextvars.ContextVar("browser", default="")
+_user: "contextvars.ContextVar[str]" = contextvars.ContextVar("user", default="")
+
+_TAGS = {"test_id": _test_id, "browser": _browser, "user": _user}
+
+# Set while a timed call runs, so nested timed calls are not recorded
+_in_action: "contextvars.ContextVar[bool]" = contextvars.ContextVar("in_action", default=False)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with constant-time inserts."""
+
+    def __init__(self) -> None:
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        """
+        Record one duration.
+
+        Args:
+            ms: Duration in milliseconds
+        """
+        index = int(math.log(max(ms, _MIN_MS) / _MIN_MS) / _BUCKET_BASE)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add the samples of another histogram.
+
+        Args:
+            other: Histogram to merge in
+        """
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def percentile(self, p: float) -> float:
+        """
+        Estimate a percentile from the buckets.
+
+        Args:
+            p: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, in milliseconds
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(_MIN_MS * math.exp((index + 1) * _BUCKET_BASE), self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the histogram as a JSON-serializable dictionary."""
+        return {
+            "buckets": {str(k): v for k, v in self.buckets.items()},
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """
+        Rebuild a histogram from to_dict() output.
+
+        Args:
+            data: Serialized histogram
+
+        Returns:
+            Histogram instance
+        """
+        histogram = cls()
+        histogram.buckets = {int(k): v for k, v in data["buckets"].items()}
+        histogram.count = data["count"]
+        histogram.total_ms = data["total_ms"]
+        histogram.max_ms = data["max_ms"]
+        return histogram
+
+
+class ActionTimings:
+    """Histograms of one process, keyed by (action, test id, browser, user)."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        Initialize the timings.
+
+        Args:
+            enabled: Whether instrumented calls are recorded
+        """
+        self.enabled = enabled
+        self.histograms: Dict[Tuple[str, str, str, str], LatencyHistogram] = {}
+
+    def record(self, action: str, ms: float) -> None:
+        """
+        Record one call of an action under the current tags.
+
+        Args:
+            action: Action name, e.g. "LoginPage.login"
+            ms: Duration in milliseconds
+        """
+        key = (action, _test_id.get(), _browser.get(), _user.get())
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram()
+        histogram.add(ms)
+
+    def dump(self, directory: str = TIMINGS_DIR) -> Optional[str]:
+        """
+        Write this worker's histograms to disk.
+
+        Args:
+            directory: Output directory
+
+        Returns:
+            Path of the written file, None if nothing was recorded
+        """
+        if not self.histograms:
+            return None
+        TestUtils.create_directory(directory)
+        path = os.path.join(directory, f"actions-{EnvironmentUtils.get_worker_id()}.json")
+        rows = [
+            {"action": action, "test_id": test_id, "browser": browser, "user": user,
+             **histogram.to_dict()}
+            for (action, test_id, browser, user), histogram in self.histograms.items()
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(rows, f)
+        return path
+
+
+# Process-wide timings, enabled by ACTION_TIMING
+timings = ActionTimings(EnvironmentUtils.is_action_timing_enabled())
+
+
+def set_tags(**tags: str) -> None:
+    """
+    Set timing tags for the current context (test_id, browser, user).
+
+    Args:
+        **tags: Tag values by name
+    """
+    for name, value in tags.items():
+        _TAGS[name].set(value or "")
+
+
+def current_tags() -> Dict[str, str]:
+    """
+    Get the timing tags of the current context.
+
+    Returns:
+        Mapping of tag name to value
+    """
+    return {name: var.get() for name, var in _TAGS.items()}
+
+
+def timed(action: str, func: Callable) -> Callable:
+    """
+    Wrap a coroutine function so its top-level calls are recorded under an action name.
+
+    Args:
+        action: Action name
+        func: Coroutine function to wrap
+
+    Returns:
+        Wrapped coroutine function
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not timings.enabled or _in_action.get():
+            return await func(*args, **kwargs)
+        token = _in_action.set(True)
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            timings.record(action, (time.perf_counter() - start) * 1000)
+            _in_action.reset(token)
+
+    wrapper.__timed__ = True
+    return wrapper
+
+
+def instrument_class(cls: type) -> type:
+    """
+    Wrap the public coroutine methods defined on a class with timed().
+
+    Args:
+        cls: Page object class
+
+    Returns:
+        The same class
+    """
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(value):
+            continue
+        if getattr(value, "__timed__", False):
+            continue
+        setattr(cls, name, timed(f"{cls.__name__}.{name}", value))
+    return cls
+
+
+def merge_timings(directory: str = TIMINGS_DIR) -> Dict[str, LatencyHistogram]:
+    """
+    Merge the histograms dumped by every worker per action.
+
+    Args:
+        directory: Directory containing actions-*.json files
+
+    Returns:
+        Mapping of action name to merged histogram
+    """
+    merged: Dict[str, LatencyHistogram] = {}
+    for path in glob.glob(os.path.join(directory, "actions-*.json")):
+        for row in TestUtils.load_test_data(path):
+            histogram = merged.setdefault(row["action"], LatencyHistogram())
+            histogram.merge(LatencyHistogram.from_dict(row))
+    return merged
+
+
+def summarize(histograms: Dict[str, LatencyHistogram],
+              percentiles: Iterable[float] = (50, 95, 99)) -> List[Dict[str, Any]]:
+    """
+    Summarize merged histograms, slowest total time first.
+
+    Args:
+        histograms: Mapping of action name to histogram
+        percentiles: Percentiles to report
+
+    Returns:
+        One row per action with count, total and percentiles in milliseconds
+    """
+    rows = []
+    for action, histogram in histograms.items():
+        row = {"action": action, "count": histogram.count,
+               "total_ms": round(histogram.total_ms, 1)}
+        for p in percentiles:
+            row[f"p{p:g}"] = round(histogram.percentile(p), 1)
+        rows.append(row)
+    return sorted(rows, key=lambda row: -row["total_ms"])
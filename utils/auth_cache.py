@@ -0,0 +1,179 @@
+"""
+Worker-scoped login cache backed by Playwright storage_state files.
+"""
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+from playwright.sync_api import Browser, BrowserContext
+
+from data.test_data import URLS, VALID_USERS
+from pages.login_page import LoginPage
+from .test_utils import EnvironmentUtils, TestUtils
+
+# Cookie the application uses to hold the logged-in user
+SESSION_COOKIE = "session-username"
+
+# Re-login when the session has less than this many seconds left
+EXPIRY_MARGIN_SECONDS = 30
+
+# Lifetime assumed for session cookies without an explicit expiry
+DEFAULT_SESSION_SECONDS = 600
+
+# Applies localStorage entries from a storage state to matching origins
+_LOCAL_STORAGE_SCRIPT = """
+(() => {
+    const origins = %s;
+    const entries = origins[window.location.origin];
+    if (!entries) { return; }
+    for (const entry of entries) {
+        if (window.localStorage.getItem(entry.name) === null) {
+            window.localStorage.setItem(entry.name, entry.value);
+        }
+    }
+})();
+"""
+
+
+class LoginCache:
+    """Logs each user in once per worker and reuses the saved storage_state."""
+
+    def __init__(
+        self,
+        browser: Browser,
+        context_args: Optional[Dict[str, Any]] = None,
+        cache_dir: Optional[str] = None
+    ):
+        """
+        Initialize the login cache.
+
+        Args:
+            browser: Browser used for the one-off UI logins
+            context_args: Extra arguments for the login browser contexts
+            cache_dir: Directory for storage_state files, per-worker by default
+        """
+        self.browser = browser
+        self.context_args = dict(context_args or {})
+        self.context_args.pop("storage_state", None)
+        self.cache_dir = cache_dir or os.path.join(
+            "test-results", ".auth", EnvironmentUtils.get_worker_id()
+        )
+        self.logins = 0
+        TestUtils.create_directory(self.cache_dir)
+
+    def storage_state_path(self, username: str) -> str:
+        """
+        Get the storage_state file path for a user.
+
+        Args:
+            username: Username from VALID_USERS
+
+        Returns:
+            Path of the user's storage_state file
+        """
+        return os.path.join(self.cache_dir, f"{TestUtils.sanitize_filename(username)}.json")
+
+    def get_storage_state(self, username: str) -> str:
+        """
+        Get a fresh storage_state file for a user, logging in if needed.
+
+        Args:
+            username: Username from VALID_USERS
+
+        Returns:
+            Path of the user's storage_state file
+        """
+        path = self.storage_state_path(username)
+        if not self._is_fresh(path):
+            self._login(username, path)
+        return path
+
+    def new_context(self, username: str = "standard_user", **kwargs) -> BrowserContext:
+        """
+        Create a browser context that starts already authenticated.
+
+        Args:
+            username: Username from VALID_USERS
+            **kwargs: Extra browser context arguments
+
+        Returns:
+            Authenticated browser context
+        """
+        args = {**self.context_args, **kwargs}
+        return self.browser.new_context(storage_state=self.get_storage_state(username), **args)
+
+    def apply(self, context: BrowserContext, username: str = "standard_user") -> bool:
+        """
+        Authenticate an existing browser context from the cached state.
+
+        Args:
+            context: Browser context to authenticate
+            username: Username from VALID_USERS
+
+        Returns:
+            True if an init script was installed to restore localStorage
+        """
+        state = TestUtils.load_test_data(self.get_storage_state(username))
+        if state.get("cookies"):
+            context.add_cookies(state["cookies"])
+        origins = {
+            origin["origin"]: origin["localStorage"]
+            for origin in state.get("origins", [])
+            if origin.get("localStorage")
+        }
+        if not origins:
+            return False
+        context.add_init_script(_LOCAL_STORAGE_SCRIPT % json.dumps(origins))
+        return True
+
+    def invalidate(self, username: str) -> None:
+        """
+        Drop a user's cached state so the next request logs in again.
+
+        Args:
+            username: Username from VALID_USERS
+        """
+        path = self.storage_state_path(username)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _is_fresh(self, path: str) -> bool:
+        """Check that a storage_state file exists and its session has not expired."""
+        if not os.path.exists(path):
+            return False
+        try:
+            state = TestUtils.load_test_data(path)
+        except (OSError, ValueError):
+            return False
+
+        session = next(
+            (c for c in state.get("cookies", []) if c.get("name") == SESSION_COOKIE),
+            None
+        )
+        if session is None:
+            return False
+
+        expires = session.get("expires", -1)
+        if expires is None or expires < 0:
+            expires = os.path.getmtime(path) + DEFAULT_SESSION_SECONDS
+        return expires - time.time() > EXPIRY_MARGIN_SECONDS
+
+    def _login(self, username: str, path: str) -> None:
+        """Log in through the UI once and save the resulting storage_state."""
+        if username not in VALID_USERS:
+            raise KeyError(f"Unknown user '{username}', expected one of {list(VALID_USERS)}")
+        credentials = VALID_USERS[username]
+
+        context = self.browser.new_context(**self.context_args)
+        try:
+            page = context.new_page()
+            page.goto(URLS["login"])
+            page.locator(LoginPage.username_input).fill(credentials["username"])
+            page.locator(LoginPage.password_input).fill(credentials["password"])
+            page.locator(LoginPage.login_button).click()
+            page.wait_for_url("**/inventory.html")
+            context.storage_state(path=path)
+            self.logins += 1
+        finally:
+            context.close()
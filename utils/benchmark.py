@@ -0,0 +1,241 @@
+"""
+Latency benchmark statistics and baselines.
+
+Samples are cleaned with Tukey's IQR fences and compared against a stored
+baseline with a one-sided Mann-Whitney U test: a benchmark regresses when
+the current samples are significantly slower than the baseline AND the
+median slowed down by more than the configured budget.
+"""
+import json
+import math
+import os
+import statistics
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .test_utils import EnvironmentUtils, TestUtils
+
+# Where each run writes its samples
+RESULTS_DIR = os.path.join("test-results", "benchmarks")
+
+
+class BenchmarkComparison(NamedTuple):
+    """Outcome of comparing current samples with a baseline."""
+
+    name: str
+    baseline_median: float
+    current_median: float
+    change: float
+    p_value: float
+    regressed: bool
+
+    def describe(self) -> str:
+        """Get a one-line human readable description."""
+        return (
+            f"{self.name}: median {self.current_median:.1f}ms vs baseline "
+            f"{self.baseline_median:.1f}ms ({self.change:+.1%}, p={self.p_value:.4f})"
+        )
+
+
+def remove_outliers(samples: Sequence[float], k: float = 1.5) -> List[float]:
+    """
+    Drop samples outside Tukey's fences.
+
+    Args:
+        samples: Measured values
+        k: Fence distance in interquartile ranges
+
+    Returns:
+        Samples within [Q1 - k*IQR, Q3 + k*IQR], in original order
+    """
+    if len(samples) < 4:
+        return list(samples)
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    low, high = q1 - k * (q3 - q1), q3 + k * (q3 - q1)
+    return [s for s in samples if low <= s <= high]
+
+
+def nearest_rank(samples: Sequence[float], p: float) -> float:
+    """
+    Get a percentile by the nearest-rank method.
+
+    Args:
+        samples: Measured values
+        p: Percentile between 0 and 100
+
+    Returns:
+        Smallest sample with at least p% of samples at or below it
+    """
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(len(ordered) * p / 100) - 1)]
+
+
+def mann_whitney_greater(current: Sequence[float], baseline: Sequence[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that current values tend to be larger.
+
+    Uses the normal approximation with tie and continuity correction, which
+    is accurate for the 8+ samples per side the benchmarks collect.
+
+    Args:
+        current: Samples of the current run
+        baseline: Samples of the baseline
+
+    Returns:
+        p-value of the hypothesis that current is not larger than baseline
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    pooled = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(pooled)
+    tie_term = 0.0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        for r in range(i, j + 1):
+            ranks[r] = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, pooled) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def measure(flow: Callable[[], Any], iterations: int, warmup: int = 0,
+            reset: Optional[Callable[[], Any]] = None) -> List[float]:
+    """
+    Time a flow repeatedly.
+
+    Args:
+        flow: Measured action
+        iterations: Number of measured runs
+        warmup: Number of unmeasured runs first
+        reset: Optional unmeasured action run before every flow
+
+    Returns:
+        Durations of the measured runs in milliseconds
+    """
+    samples = []
+    for i in range(warmup + iterations):
+        if reset:
+            reset()
+        start = time.perf_counter()
+        flow()
+        elapsed = (time.perf_counter() - start) * 1000
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+class BenchmarkBaseline:
+    """Baseline samples stored as one JSON file per benchmark."""
+
+    def __init__(self, directory: str):
+        """
+        Initialize the baseline store.
+
+        Args:
+            directory: Directory holding <name>.json files
+        """
+        self.directory = directory
+
+    def path_for(self, name: str) -> str:
+        """Get the baseline file of a benchmark."""
+        return os.path.join(self.directory, f"{TestUtils.sanitize_filename(name)}.json")
+
+    def load(self, name: str) -> Optional[List[float]]:
+        """
+        Load the baseline samples of a benchmark.
+
+        Args:
+            name: Benchmark name
+
+        Returns:
+            Baseline samples, None if there is no baseline
+        """
+        path = self.path_for(name)
+        if not os.path.exists(path):
+            return None
+        return TestUtils.load_test_data(path)["samples"]
+
+    def save(self, name: str, samples: Sequence[float]) -> str:
+        """
+        Store samples as the new baseline of a benchmark.
+
+        Args:
+            name: Benchmark name
+            samples: Samples in milliseconds
+
+        Returns:
+            Path of the baseline file
+        """
+        TestUtils.create_directory(self.directory)
+        path = self.path_for(name)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"name": name, "samples": [round(s, 2) for s in samples]}, f, indent=1)
+        return path
+
+
+def compare(name: str, current: Sequence[float], baseline: Sequence[float],
+            budget: float, alpha: float) -> BenchmarkComparison:
+    """
+    Compare cleaned current samples with a baseline.
+
+    Args:
+        name: Benchmark name
+        current: Current samples in milliseconds
+        baseline: Baseline samples in milliseconds
+        budget: Allowed relative slowdown of the median (0.2 = 20%)
+        alpha: Significance level of the Mann-Whitney test
+
+    Returns:
+        Comparison result
+    """
+    current = remove_outliers(current)
+    baseline = remove_outliers(baseline)
+    current_median = statistics.median(current)
+    baseline_median = statistics.median(baseline)
+    change = current_median / baseline_median - 1 if baseline_median else 0.0
+    p_value = mann_whitney_greater(current, baseline)
+    return BenchmarkComparison(
+        name, baseline_median, current_median, change, p_value,
+        regressed=p_value < alpha and change > budget
+    )
+
+
+def run_benchmark(name: str, samples: Sequence[float]) -> Tuple[Optional[BenchmarkComparison], str]:
+    """
+    Record samples, update or compare against the baseline per configuration.
+
+    Args:
+        name: Benchmark name
+        samples: Measured samples in milliseconds
+
+    Returns:
+        Comparison (None without a baseline or when updating it) and a
+        one-line summary
+    """
+    settings = EnvironmentUtils.get_benchmark_settings()
+    cleaned = remove_outliers(samples)
+    TestUtils.create_directory(RESULTS_DIR)
+    TestUtils.save_test_results(
+        {"name": name, "samples": list(samples), "median": statistics.median(cleaned),
+         "p95": nearest_rank(cleaned, 95), "outliers": len(samples) - len(cleaned)},
+        os.path.join("benchmarks", f"{TestUtils.sanitize_filename(name)}.json")
+    )
+    store = BenchmarkBaseline(settings["baseline_dir"])
+    baseline = store.load(name)
+    if settings["update_baseline"] or baseline is None:
+        path = store.save(name, samples)
+        return None, f"{name}: baseline written to {path}"
+    comparison = compare(name, samples, baseline, settings["budget"], settings["alpha"])
+    return comparison, comparison.describe()
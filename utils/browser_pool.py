@@ -0,0 +1,180 @@
+"""
+Pool of warm browser contexts shared by the tests of one worker.
+"""
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Browser, BrowserContext, Error, Page
+
+# Reads the JS heap size where the browser exposes it (Chromium only)
+_HEAP_SIZE_SCRIPT = "() => (performance.memory ? performance.memory.usedJSHeapSize : 0)"
+
+_CLEAR_STORAGE_SCRIPT = """() => {
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+}"""
+
+
+class ContextPool:
+    """Bounded pool of browser contexts that are reset instead of destroyed."""
+
+    def __init__(
+        self,
+        browser: Browser,
+        context_args: Optional[Dict[str, Any]] = None,
+        max_size: int = 2,
+        max_uses: int = 50,
+        max_heap_mb: int = 200
+    ):
+        """
+        Initialize the context pool.
+
+        Args:
+            browser: The worker's browser
+            context_args: Arguments for new browser contexts
+            max_size: Maximum number of idle contexts kept warm
+            max_uses: Recycle a context after this many tests
+            max_heap_mb: Recycle a context whose JS heap exceeds this size
+        """
+        self.browser = browser
+        self.context_args = dict(context_args or {})
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_heap_bytes = max_heap_mb * 1024 * 1024
+        self.stats = {"created": 0, "reused": 0, "recycled": 0, "closed": 0}
+        self._idle: List[BrowserContext] = []
+        self._uses: Dict[BrowserContext, int] = {}
+        self._origins: Dict[BrowserContext, Set[str]] = {}
+        self._dirty: Set[BrowserContext] = set()
+
+    def prewarm(self, count: Optional[int] = None) -> None:
+        """
+        Create idle contexts ahead of the first test.
+
+        Args:
+            count: Number of contexts to create, defaults to max_size
+        """
+        target = min(count or self.max_size, self.max_size)
+        while len(self._idle) < target:
+            self._idle.append(self._create())
+
+    def acquire(self) -> BrowserContext:
+        """
+        Take a clean context from the pool, creating one if none is idle.
+
+        Returns:
+            Browser context with exactly one blank page
+        """
+        if self._idle:
+            self.stats["reused"] += 1
+            return self._idle.pop()
+        return self._create()
+
+    def acquire_page(self) -> Page:
+        """
+        Take a clean context from the pool and return its page.
+
+        Returns:
+            Blank page of a pooled context
+        """
+        return self.acquire().pages[0]
+
+    def mark_dirty(self, context: BrowserContext) -> None:
+        """
+        Flag a context as not resettable, e.g. after add_init_script().
+
+        Args:
+            context: Context obtained from acquire()
+        """
+        if context in self._uses:
+            self._dirty.add(context)
+
+    def release(self, context: BrowserContext, recycle: bool = False) -> None:
+        """
+        Return a context to the pool.
+
+        The context is reset and kept warm unless it reached its use limit,
+        grew past the heap limit, visited several origins, was marked dirty,
+        or the pool is already full; in those cases it is closed.
+
+        Args:
+            context: Context obtained from acquire()
+            recycle: Force the context to be closed instead of reused
+        """
+        self._uses[context] = self._uses.get(context, 0) + 1
+        if (
+            recycle
+            or context in self._dirty
+            or len(self._idle) >= self.max_size
+            or self._uses[context] >= self.max_uses
+            or len(self._origins.get(context, ())) > 1
+            or self._heap_size(context) > self.max_heap_bytes
+        ):
+            self._close(context)
+            return
+
+        try:
+            self._reset(context)
+        except Error:
+            self._close(context)
+            return
+        self._idle.append(context)
+
+    def close(self) -> None:
+        """Close every idle context."""
+        while self._idle:
+            self._close(self._idle.pop(), recycled=False)
+
+    def _create(self) -> BrowserContext:
+        """Create a context with one page and origin tracking."""
+        context = self.browser.new_context(**self.context_args)
+        self.stats["created"] += 1
+        self._uses[context] = 0
+        self._origins[context] = set()
+        context.on("page", lambda page: self._track(context, page))
+        context.new_page()
+        return context
+
+    def _track(self, context: BrowserContext, page: Page) -> None:
+        """Record the origins a context's main frames navigate to."""
+        def on_navigated(frame) -> None:
+            if frame == page.main_frame:
+                parts = urlsplit(frame.url)
+                if parts.scheme in ("http", "https"):
+                    self._origins[context].add(f"{parts.scheme}://{parts.netloc}")
+        page.on("framenavigated", on_navigated)
+
+    def _reset(self, context: BrowserContext) -> None:
+        """Clear cookies, storage, routes and pages, keeping one blank page."""
+        pages = context.pages
+        page = pages[0] if pages else context.new_page()
+        for extra in pages[1:]:
+            extra.close()
+        if page.url.startswith("http"):
+            page.evaluate(_CLEAR_STORAGE_SCRIPT)
+        page.goto("about:blank")
+        context.clear_cookies()
+        context.clear_permissions()
+        context.unroute_all(behavior="ignoreErrors")
+        self._origins[context] = set()
+
+    def _heap_size(self, context: BrowserContext) -> int:
+        """Get the JS heap size of the context's first page, 0 if unknown."""
+        pages = context.pages
+        if not pages or not pages[0].url.startswith("http"):
+            return 0
+        try:
+            return int(pages[0].evaluate(_HEAP_SIZE_SCRIPT))
+        except Error:
+            return 0
+
+    def _close(self, context: BrowserContext, recycled: bool = True) -> None:
+        """Close a context and forget its bookkeeping, counting it as recycled or closed at shutdown."""
+        self.stats["recycled" if recycled else "closed"] += 1
+        self._uses.pop(context, None)
+        self._origins.pop(context, None)
+        self._dirty.discard(context)
+        try:
+            context.close()
+        except Error:
+            pass
@@ -0,0 +1,243 @@
+"""
+Duration-aware scheduling for pytest-xdist.
+
+Every run records per-test durations into a history file. With
+--duration-schedule the xdist controller hands out tests longest first:
+each worker starts with the longest tests and, whenever it runs low, gets
+the longest test still pending. This is longest-processing-time-first
+scheduling driven by actual completion times, so a parallel run finishes
+close to total duration / workers. Tests without history are estimated
+from the median of their parametrized siblings, or of the whole history.
+"""
+import json
+import os
+import re
+import statistics
+from typing import Dict, Optional, Sequence, Set
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError:  # pytest-xdist not installed
+    LoadScheduling = None
+
+# Default location of the duration history
+DEFAULT_HISTORY_PATH = ".test-durations.json"
+
+# Estimate used when there is no history at all, in seconds
+DEFAULT_ESTIMATE = 1.0
+
+# Weight of the newest measurement when smoothing durations
+SMOOTHING = 0.5
+
+_PARAMS = re.compile(r"\[.*\]$")
+
+
+class DurationHistory:
+    """Per-test durations persisted between runs."""
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH):
+        """
+        Initialize the history, loading the file if it exists.
+
+        Args:
+            path: History file path
+        """
+        self.path = path
+        self.durations: Dict[str, float] = {}
+        self._measured: Dict[str, float] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.durations = {k: float(v) for k, v in json.load(f).items()}
+            except (OSError, ValueError):
+                self.durations = {}
+
+    def estimate(self, nodeid: str) -> float:
+        """
+        Estimate the duration of a test.
+
+        Args:
+            nodeid: Test node id
+
+        Returns:
+            Recorded duration, else the median of parametrized siblings,
+            else the median of all recorded tests, in seconds
+        """
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        base = _PARAMS.sub("", nodeid)
+        siblings = [v for k, v in self.durations.items() if _PARAMS.sub("", k) == base]
+        if siblings:
+            return statistics.median(siblings)
+        if self.durations:
+            return statistics.median(self.durations.values())
+        return DEFAULT_ESTIMATE
+
+    def add(self, nodeid: str, seconds: float) -> None:
+        """
+        Add a measured phase duration (setup, call or teardown) of a test.
+
+        Args:
+            nodeid: Test node id
+            seconds: Measured duration
+        """
+        self._measured[nodeid] = self._measured.get(nodeid, 0.0) + seconds
+
+    def discard(self, nodeid: str) -> None:
+        """
+        Drop this run's measurements of a test, keeping its recorded history.
+
+        Args:
+            nodeid: Test node id
+        """
+        self._measured.pop(nodeid, None)
+
+    def save(self) -> None:
+        """Merge this run's measurements into the history file."""
+        if not self._measured:
+            return
+        for nodeid, seconds in self._measured.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = round(
+                seconds if previous is None else SMOOTHING * seconds + (1 - SMOOTHING) * previous,
+                4
+            )
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(self.durations.items())), f, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+def lpt_makespan(estimates: Sequence[float], workers: int) -> float:
+    """
+    Predict the wall time of LPT bin packing of durations onto workers.
+
+    Args:
+        estimates: Test durations in seconds
+        workers: Number of workers
+
+    Returns:
+        Duration of the most loaded worker
+    """
+    bins = [0.0] * max(workers, 1)
+    for duration in sorted(estimates, reverse=True):
+        bins[bins.index(min(bins))] += duration
+    return max(bins)
+
+
+class DurationRecorder:
+    """Pytest plugin recording test durations on the controller process."""
+
+    def __init__(self, history: DurationHistory):
+        """
+        Initialize the recorder.
+
+        Args:
+            history: History receiving the measurements
+        """
+        self.history = history
+        self._skipped: Set[str] = set()
+
+    def pytest_runtest_logreport(self, report) -> None:
+        # Failed attempts of rerun tests would count twice; skipped tests
+        # take ~0s and would hide their real duration
+        if report.outcome == "rerun" or report.nodeid in self._skipped:
+            return
+        if report.skipped:
+            self._skipped.add(report.nodeid)
+            self.history.discard(report.nodeid)
+            return
+        self.history.add(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self, session) -> None:
+        self.history.save()
+
+
+if LoadScheduling is not None:
+
+    class DurationScheduling(LoadScheduling):
+        """LoadScheduling that hands out the longest pending test first."""
+
+        def __init__(self, config, log=None, history: Optional[DurationHistory] = None):
+            """
+            Initialize the scheduler.
+
+            Args:
+                config: Pytest config
+                log: xdist log producer
+                history: Duration history used for the estimates
+            """
+            super().__init__(config, log)
+            self.history = history or DurationHistory()
+
+        def schedule(self) -> None:
+            """Order the collection longest first and start every node."""
+            assert self.collection_is_completed
+            if self.collection is not None:
+                for node in self.nodes:
+                    self.check_schedule(node)
+                return
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+            self.collection = next(iter(self.node2collection.values()))
+            estimates = [self.history.estimate(nodeid) for nodeid in self.collection]
+            self.pending[:] = sorted(range(len(self.collection)), key=lambda i: -estimates[i])
+            if not self.collection:
+                return
+            self.log(
+                f"LPT schedule: {sum(estimates):.1f}s of tests, predicted wall time "
+                f"{lpt_makespan(estimates, len(self.nodes)):.1f}s on {len(self.nodes)} workers"
+            )
+            # Deal two tests per node round-robin so the longest ones land on
+            # different workers; a worker needs its next test queued to run one
+            for _ in range(2):
+                for node in self.nodes:
+                    self._send_tests(node, 1)
+            if not self.pending:
+                for node in self.nodes:
+                    node.shutdown()
+
+        def check_schedule(self, node, duration: float = 0) -> None:
+            """Top the node up to two queued tests, longest pending first."""
+            if node.shutting_down:
+                return
+            if self.pending:
+                queued = len(self.node2pending[node])
+                if queued < 2:
+                    self._send_tests(node, 2 - queued)
+            else:
+                node.shutdown()
+
+    class DurationSchedulerPlugin:
+        """Pytest plugin installing DurationScheduling on the xdist controller."""
+
+        def __init__(self, history: DurationHistory):
+            """
+            Initialize the plugin.
+
+            Args:
+                history: Duration history used for the estimates
+            """
+            self.history = history
+
+        def pytest_xdist_make_scheduler(self, config, log) -> "DurationScheduling":
+            return DurationScheduling(config, log, self.history)
+
+else:
+    DurationScheduling = None
+    DurationSchedulerPlugin = None
+
+
+def is_available() -> bool:
+    """
+    Check if duration scheduling can be used.
+
+    Returns:
+        True if pytest-xdist is installed
+    """
+    return LoadScheduling is not None
+
@@ -0,0 +1,170 @@
+"""
+Trace and screencast capture that only persists artifacts of failed tests.
+
+Tracing is started once per browser context and split into one chunk per
+test: a passing test's chunk is stopped without a path, so Playwright drops
+it instead of writing a file. On Chromium, a ring buffer of the last N
+seconds of screencast frames (CDP Page.startScreencast, JPEG) can be kept
+per page; the frames are only written when the test fails. Other browsers
+skip the screencast.
+"""
+import base64
+import json
+import os
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple
+
+from .screenshots import screenshots
+from .test_utils import EnvironmentUtils, TestUtils
+
+TRACES_DIR = "test-results/traces"
+SCREENCAST_DIR = "test-results/screencast"
+
+
+class ScreencastBuffer:
+    """Keeps the most recent screencast frames of a Chromium page."""
+
+    def __init__(self, page: Any, seconds: float, quality: int = 60, max_width: int = 800):
+        """
+        Start the screencast.
+
+        Args:
+            page: Playwright page (sync API) of a Chromium context
+            seconds: Length of the kept window
+            quality: JPEG quality of the frames
+            max_width: Maximum frame width in pixels
+        """
+        self.seconds = seconds
+        self.frames: Deque[Tuple[float, str]] = deque()
+        self.session = page.context.new_cdp_session(page)
+        self.session.on("Page.screencastFrame", self._on_frame)
+        self.session.send("Page.startScreencast", {
+            "format": "jpeg", "quality": quality, "maxWidth": max_width
+        })
+
+    def _on_frame(self, params: Dict[str, Any]) -> None:
+        self.session.send("Page.screencastFrameAck", {"sessionId": params["sessionId"]})
+        timestamp = params["metadata"].get("timestamp", 0.0)
+        self.frames.append((timestamp, params["data"]))
+        while self.frames and self.frames[0][0] < timestamp - self.seconds:
+            self.frames.popleft()
+
+    def stop(self) -> None:
+        """Stop the screencast and detach from the page."""
+        try:
+            self.session.send("Page.stopScreencast")
+            self.session.detach()
+        except Exception:
+            pass
+
+    def save(self, directory: str) -> int:
+        """
+        Queue the buffered frames for writing as numbered JPEGs.
+
+        Args:
+            directory: Output directory, also receives frames.json with timestamps
+
+        Returns:
+            Number of frames written
+        """
+        timestamps = []
+        for index, (timestamp, data) in enumerate(self.frames):
+            screenshots.write_file(
+                os.path.join(directory, f"frame-{index:04d}.jpg"), base64.b64decode(data)
+            )
+            timestamps.append(timestamp)
+        if timestamps:
+            screenshots.write_file(
+                os.path.join(directory, "frames.json"), json.dumps(timestamps).encode("utf-8")
+            )
+        return len(timestamps)
+
+
+class FailureCapture:
+    """Per-test trace chunks and screencast buffers, kept for failures only."""
+
+    def __init__(self, trace: bool = False, screencast_seconds: float = 0.0):
+        """
+        Initialize the capture manager.
+
+        Args:
+            trace: Record a trace chunk per test
+            screencast_seconds: Screencast window to keep, 0 disables it
+        """
+        self.trace = trace
+        self.screencast_seconds = screencast_seconds
+        self._tracing: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._screencasts: Dict[Any, ScreencastBuffer] = {}
+        # Attempts started per test, so reruns do not overwrite artifacts
+        self._attempts: Dict[str, int] = {}
+
+    @classmethod
+    def from_environment(cls) -> "FailureCapture":
+        """
+        Create the capture manager from FAILURE_TRACE and FAILURE_SCREENCAST_SECONDS.
+
+        Returns:
+            FailureCapture instance
+        """
+        settings = EnvironmentUtils.get_failure_capture_settings()
+        return cls(settings["trace"], settings["screencast_seconds"])
+
+    @property
+    def is_active(self) -> bool:
+        """Whether anything is captured."""
+        return self.trace or self.screencast_seconds > 0
+
+    def start(self, page: Any, test_id: str) -> None:
+        """
+        Start capturing a test on its page.
+
+        Args:
+            page: Playwright page (sync API) the test uses
+            test_id: Test node id, used as the trace chunk title
+        """
+        self._attempts[test_id] = self._attempts.get(test_id, 0) + 1
+        context = page.context
+        if self.trace:
+            if context not in self._tracing:
+                context.tracing.start(screenshots=True, snapshots=True)
+                self._tracing.add(context)
+            context.tracing.start_chunk(title=test_id)
+        if self.screencast_seconds > 0 and context.browser.browser_type.name == "chromium":
+            self._screencasts[page] = ScreencastBuffer(page, self.screencast_seconds)
+
+    def finish(self, page: Any, test_id: str, failed: bool) -> List[str]:
+        """
+        Stop capturing a test and persist its artifacts if it failed.
+
+        Args:
+            page: Page passed to start()
+            test_id: Test node id
+            failed: Whether the test failed
+
+        Returns:
+            Paths of the written trace and screencast directory, named
+            after the test, the worker and the attempt
+        """
+        name = TestUtils.sanitize_filename(test_id.replace(" ", "_"))
+        name = f"{name}_{EnvironmentUtils.get_worker_id()}_attempt{self._attempts.get(test_id, 1)}"
+        paths = []
+        screencast = self._screencasts.pop(page, None)
+        if screencast is not None:
+            screencast.stop()
+            directory = os.path.join(SCREENCAST_DIR, name)
+            if failed and screencast.save(directory):
+                paths.append(directory)
+        context = page.context
+        if self.trace and context in self._tracing:
+            try:
+                if failed:
+                    path = os.path.join(TRACES_DIR, f"{name}.zip")
+                    context.tracing.stop_chunk(path=path)
+                    paths.append(path)
+                else:
+                    context.tracing.stop_chunk()
+            except Exception:
+                # The context was closed by the test, its chunk is gone
+                self._tracing.discard(context)
+        return paths
@@ -0,0 +1,148 @@
+"""
+HAR record-and-replay for deterministic, offline test runs.
+
+HAR_MODE selects what happens to each archive:
+
+    off      no HAR routing
+    record   record archives that do not exist yet, replay the others
+    replay   serve recorded responses, unrecorded requests go to the network
+    strict   serve recorded responses, abort unrecorded requests
+    update   re-record every archive
+
+Archives are keyed per test (conftest) or per page object class
+(BasePage.navigate_to, for pages not created by the fixtures). Recorded
+archives are written by Playwright when the browser context closes.
+"""
+import os
+import weakref
+from typing import Any, Dict, Optional
+
+from .test_utils import EnvironmentUtils, TestUtils
+
+HAR_MODES = ("off", "record", "replay", "strict", "update")
+
+
+class HarArchive:
+    """Maps archive keys to route_from_har options for the active mode."""
+
+    def __init__(self, mode: str = "off", directory: str = "hars"):
+        """
+        Initialize the archive set.
+
+        Args:
+            mode: One of HAR_MODES
+            directory: Directory holding the .har files
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in HAR_MODES:
+            raise ValueError(f"Unknown HAR_MODE '{mode}', expected one of {list(HAR_MODES)}")
+        self.mode = mode
+        self.directory = directory
+        self._installed: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    @classmethod
+    def from_environment(cls) -> "HarArchive":
+        """
+        Create the archive set configured by HAR_MODE and HAR_DIR.
+
+        Returns:
+            Configured HarArchive
+        """
+        return cls(EnvironmentUtils.get_har_mode(), EnvironmentUtils.get_har_dir())
+
+    @property
+    def is_active(self) -> bool:
+        """True if HAR routing is enabled."""
+        return self.mode != "off"
+
+    @property
+    def records(self) -> bool:
+        """True if archives may be written, which needs contexts to be closed."""
+        return self.mode in ("record", "update")
+
+    def path_for(self, key: str) -> str:
+        """
+        Get the archive path for a key.
+
+        Args:
+            key: Test node id or page object name
+
+        Returns:
+            Path of the .har file
+        """
+        name = TestUtils.sanitize_filename(key.replace("::", "__").replace(" ", "_"))
+        return os.path.join(self.directory, f"{name}.har")
+
+    def options(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the route_from_har keyword arguments for a key.
+
+        Args:
+            key: Test node id or page object name
+
+        Returns:
+            Keyword arguments, or None if no HAR routing applies
+
+        Raises:
+            FileNotFoundError: In strict mode, if the archive was never recorded
+        """
+        if not self.is_active:
+            return None
+        path = self.path_for(key)
+        exists = os.path.exists(path)
+        if self.mode == "update" or (self.mode == "record" and not exists):
+            TestUtils.create_directory(self.directory)
+            return {
+                "har": path,
+                "update": True,
+                "update_content": "embed",
+                "update_mode": "minimal",
+            }
+        if not exists:
+            if self.mode == "strict":
+                raise FileNotFoundError(
+                    f"No HAR archive at {path}; record it with HAR_MODE=record"
+                )
+            return None
+        not_found = "abort" if self.mode == "strict" else "fallback"
+        return {"har": path, "not_found": not_found}
+
+    def mark_installed(self, target: Any) -> None:
+        """
+        Remember that a page or context already routes from an archive.
+
+        Args:
+            target: Playwright Page or BrowserContext
+        """
+        self._installed.add(target)
+
+    def is_installed(self, page: Any) -> bool:
+        """
+        Check whether a page or its context already routes from an archive.
+
+        Args:
+            page: Playwright Page
+
+        Returns:
+            True if an archive was installed on the page or its context
+        """
+        return page in self._installed or page.context in self._installed
+
+
+# Process-wide archive set shared by the fixtures and page objects
+_archive: Optional[HarArchive] = None
+
+
+def get_har_archive() -> HarArchive:
+    """
+    Get the process-wide HarArchive, creating it from the environment.
+
+    Returns:
+        Shared HarArchive
+    """
+    global _archive
+    if _archive is None:
+        _archive = HarArchive.from_environment()
+    return _archive
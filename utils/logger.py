@@ -1,10 +1,153 @@
 """
 Logger configuration and utilities for test automation.
+
+Loggers only put records on an in-memory queue; one QueueListener thread
+per process, started with the first record, formats them and writes to the console and the log file, so
+test and browser actions never wait on disk I/O. Messages use %-style
+arguments and are formatted on the listener thread, after the level check.
+
+The TestLogger helpers (test_start/pass/fail/skip, action, verification)
+also emit structured events, written as compact JSON lines to
+test-results/logs/events-<worker>.jsonl. LOG_FORMAT selects text, jsonl or
+both; merge_event_streams() combines the per-worker files by timestamp.
 """
+import atexit
+import glob
+import heapq
+import json
 import logging
 import os
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, IO, Iterator, List, Optional
+
+from .action_timing import current_tags
+from .test_utils import EnvironmentUtils
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the json module
+    orjson = None
+
+LOG_DIR = "test-results/logs"
+
+# Records waiting for the listener thread
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+# TestLogger instances by name
+_loggers: Dict[str, "TestLogger"] = {}
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # The listener starts with the first record, not when utils is imported
+        if _listener is None:
+            _start_listener()
+        super().emit(record)
+
+
+def _dumps(event: Dict[str, Any]) -> bytes:
+    """Serialize an event as one compact JSON line."""
+    if orjson is not None:
+        return orjson.dumps(event) + b"\n"
+    return (json.dumps(event, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class EventStreamHandler(logging.Handler):
+    """Writes the structured events of log records as buffered JSON lines."""
+
+    def __init__(self, path: str, buffer_size: int = 1 << 16):
+        """
+        Initialize the handler.
+
+        Args:
+            path: Output .jsonl file, opened on the first event
+            buffer_size: Write buffer size in bytes
+        """
+        super().__init__(logging.DEBUG)
+        self.path = path
+        self.buffer_size = buffer_size
+        self._file: Optional[IO[bytes]] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        event = getattr(record, "event", None)
+        if event is None:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.path, "wb", buffering=self.buffer_size)
+            self._file.write(_dumps(event))
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        super().close()
+
+
+def _start_listener() -> None:
+    """Start the process-wide listener with console and file handlers once."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        log_format = EnvironmentUtils.get_log_format()
+
+        # Console handler
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+        handlers: List[logging.Handler] = [console_handler]
+
+        # File handlers, one set per process
+        os.makedirs(LOG_DIR, exist_ok=True)
+        worker_id = EnvironmentUtils.get_worker_id()
+
+        if log_format in ("text", "both"):
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            log_file = os.path.join(LOG_DIR, f"test_execution_{timestamp}_{worker_id}.log")
+
+            file_handler = logging.FileHandler(log_file, delay=True)
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+
+        if log_format in ("jsonl", "both"):
+            handlers.append(EventStreamHandler(os.path.join(LOG_DIR, f"events-{worker_id}.jsonl")))
+
+        _listener = QueueListener(_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_stop_listener)
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
 
 
 class TestLogger:
@@ -20,99 +163,162 @@ class TestLogger:
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, log_level.upper()))
+        self._started: Dict[str, float] = {}
         
         # Prevent adding multiple handlers if logger already exists
         if not self.logger.handlers:
-            self._setup_handlers()
-    
-    def _setup_handlers(self) -> None:
-        """Set up console and file handlers for the logger."""
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-        
-        # File handler
-        log_dir = "test-results/logs"
-        os.makedirs(log_dir, exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = os.path.join(log_dir, f"test_execution_{timestamp}.log")
-        
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+            self.logger.addHandler(_DeferredQueueHandler(_queue))
     
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """Log debug message."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
     
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """Log info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """Log error message."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
     
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args) -> None:
         """Log critical message."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
+    
+    def _event(self, level: int, event_type: str, message: str, *args,
+               test_name: str = "", **fields: Any) -> None:
+        """
+        Log a message together with its structured event.
+        
+        Args:
+            level: Logging level
+            event_type: Event type, e.g. "test_start" or "action"
+            message: %-style message
+            *args: Message arguments
+            test_name: Test name, used when no test id is tagged
+            **fields: Extra event fields
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        event = {
+            "type": event_type,
+            "nodeid": current_tags()["test_id"] or test_name,
+            "worker": EnvironmentUtils.get_worker_id(),
+            "ts": time.monotonic(),
+            "wall": time.time(),
+            **fields,
+        }
+        self.logger.log(level, message, *args, extra={"event": event})
+    
+    def _finish(self, test_name: str) -> Optional[float]:
+        """Get the seconds since test_start for a test, if it was started."""
+        started = self._started.pop(test_name, None)
+        return None if started is None else round(time.monotonic() - started, 6)
     
     def test_start(self, test_name: str) -> None:
         """Log test start."""
-        self.info(f"🚀 Starting test: {test_name}")
+        self._started[test_name] = time.monotonic()
+        self._event(logging.INFO, "test_start", "🚀 Starting test: %s", test_name,
+                    test_name=test_name)
     
     def test_pass(self, test_name: str) -> None:
         """Log test pass."""
-        self.info(f"✅ Test passed: {test_name}")
+        self._event(logging.INFO, "test_pass", "✅ Test passed: %s", test_name,
+                    test_name=test_name, duration=self._finish(test_name))
     
     def test_fail(self, test_name: str, error_message: str = "") -> None:
         """Log test failure."""
-        self.error(f"❌ Test failed: {test_name}")
+        self._event(logging.ERROR, "test_fail", "❌ Test failed: %s", test_name,
+                    test_name=test_name, duration=self._finish(test_name),
+                    error=error_message or None)
         if error_message:
-            self.error(f"Error details: {error_message}")
+            self.logger.error("Error details: %s", error_message)
     
     def test_skip(self, test_name: str, reason: str = "") -> None:
         """Log test skip."""
-        self.warning(f"⏭️ Test skipped: {test_name}")
+        self._event(logging.WARNING, "test_skip", "⏭️ Test skipped: %s", test_name,
+                    test_name=test_name, duration=self._finish(test_name),
+                    reason=reason or None)
         if reason:
-            self.warning(f"Skip reason: {reason}")
+            self.logger.warning("Skip reason: %s", reason)
     
     def action(self, action: str) -> None:
         """Log user action."""
-        self.info(f"🎬 Action: {action}")
+        self._event(logging.INFO, "action", "🎬 Action: %s", action, action=action)
     
     def verification(self, verification: str, result: bool) -> None:
         """Log verification step."""
-        status = "✅" if result else "❌"
-        self.info(f"{status} Verification: {verification} - {'PASS' if result else 'FAIL'}")
-
-
-# Global logger instance
-logger = TestLogger()
+        self._event(
+            logging.INFO, "verification", "%s Verification: %s - %s",
+            "✅" if result else "❌", verification, "PASS" if result else "FAIL",
+            verification=verification, result=result
+        )
 
 
 def get_logger(name: Optional[str] = None) -> TestLogger:
     """
     Get logger instance.
     
+    Instances are cached per name, so repeated calls share one logger.
+    
     Args:
         name: Optional logger name
         
     Returns:
         TestLogger instance
     """
-    if name:
-        return TestLogger(name)
-    return logger
\ No newline at end of file
+    name = name or "test_automation"
+    cached = _loggers.get(name)
+    if cached is None:
+        cached = _loggers[name] = TestLogger(name)
+    return cached
+
+
+# Global logger instance
+logger = get_logger()
+
+
+def read_events(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read the events of one JSONL stream.
+    
+    Args:
+        path: Path of an events-*.jsonl file
+        
+    Yields:
+        Event dictionaries in file order
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line) if orjson is not None else json.loads(line)
+
+
+def merge_event_streams(directory: str = LOG_DIR, output: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Merge per-worker event streams into one timeline.
+    
+    Each stream is already in time order, so the merge is a streaming
+    k-way merge by wall clock time (monotonic time breaks ties).
+    
+    Args:
+        directory: Directory containing events-*.jsonl files
+        output: Optional path to write the merged stream to
+        
+    Returns:
+        Merged events, or an empty list when written to output
+    """
+    paths = sorted(glob.glob(os.path.join(directory, "**", "events-*.jsonl"), recursive=True))
+    merged = heapq.merge(
+        *(read_events(path) for path in paths), key=lambda event: (event["wall"], event["ts"])
+    )
+    if output is None:
+        return list(merged)
+    with open(output, "wb") as f:
+        for event in merged:
+            f.write(_dumps(event))
+    return []
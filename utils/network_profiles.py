@@ -0,0 +1,260 @@
+"""
+Resource-blocking network profiles installed per browser context.
+
+A profile blocks requests by resource type and URL pattern, and can stub
+images with a tiny placeholder instead of aborting them (useful when a page
+waits for image load events). Install it with:
+
+    router = NetworkRouter.from_environment()
+    router.install(context)          # sync API
+    await router.install(context)    # async API
+
+install() returns whatever context.route() returns, so the same router
+works with both Playwright APIs.
+"""
+import asyncio
+import fnmatch
+import glob
+import json
+import os
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+from .test_utils import EnvironmentUtils, TestUtils
+
+# 1x1 transparent PNG served in place of stubbed images
+PLACEHOLDER_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010804000000b51c0c02"
+    "0000000b4944415478da6364600000000600023081d02f0000000049454e44ae426082"
+)
+
+# Third-party error reporting and analytics endpoints seen on saucedemo.com
+TRACKER_PATTERNS = (
+    "*backtrace.io*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*optimizely.com*",
+    "*doubleclick.net*",
+)
+
+# Typical transfer sizes used to estimate bytes saved by an aborted request
+ESTIMATED_BYTES = {
+    "image": 45_000,
+    "font": 30_000,
+    "media": 250_000,
+    "stylesheet": 15_000,
+    "script": 40_000,
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+# Directory where each worker writes its routing statistics
+STATS_DIR = os.path.join("test-results", "network")
+
+
+class NetworkProfile:
+    """Named set of blocking and stubbing rules."""
+
+    def __init__(
+        self,
+        name: str,
+        block_types: Iterable[str] = (),
+        block_patterns: Iterable[str] = (),
+        stub_types: Iterable[str] = ()
+    ):
+        """
+        Initialize the profile.
+
+        Args:
+            name: Profile name
+            block_types: Playwright resource types to abort
+            block_patterns: URL glob patterns to abort
+            stub_types: Resource types answered with a placeholder instead
+        """
+        self.name = name
+        self.block_types: FrozenSet[str] = frozenset(block_types)
+        self.block_patterns = tuple(block_patterns)
+        self.stub_types: FrozenSet[str] = frozenset(stub_types)
+
+    @property
+    def is_active(self) -> bool:
+        """True if the profile changes any request."""
+        return bool(self.block_types or self.block_patterns or self.stub_types)
+
+    def decide(self, resource_type: str, url: str) -> str:
+        """
+        Decide what to do with a request.
+
+        Args:
+            resource_type: Playwright resource type of the request
+            url: Request URL
+
+        Returns:
+            "stub", "block" or "allow"
+        """
+        if resource_type in self.stub_types:
+            return "stub"
+        if resource_type in self.block_types:
+            return "block"
+        if any(fnmatch.fnmatch(url, pattern) for pattern in self.block_patterns):
+            return "block"
+        return "allow"
+
+
+PROFILES: Dict[str, NetworkProfile] = {
+    "off": NetworkProfile("off"),
+    "trackers": NetworkProfile("trackers", block_patterns=TRACKER_PATTERNS),
+    "lean": NetworkProfile(
+        "lean", block_types=("image", "font", "media"), block_patterns=TRACKER_PATTERNS
+    ),
+    "stub": NetworkProfile(
+        "stub", block_types=("font", "media"), block_patterns=TRACKER_PATTERNS,
+        stub_types=("image",)
+    ),
+}
+
+
+class NetworkStats:
+    """Thread-safe counters of requests allowed, blocked and stubbed."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {"allow": 0, "block": 0, "stub": 0}
+        self.by_type: Dict[str, int] = {}
+        self.bytes_saved = 0
+
+    def record(self, decision: str, resource_type: str) -> None:
+        """
+        Record one routed request.
+
+        Args:
+            decision: "allow", "block" or "stub"
+            resource_type: Playwright resource type of the request
+        """
+        with self._lock:
+            self.counts[decision] += 1
+            if decision == "allow":
+                return
+            self.by_type[resource_type] = self.by_type.get(resource_type, 0) + 1
+            saved = ESTIMATED_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+            if decision == "stub":
+                saved = max(saved - len(PLACEHOLDER_PNG), 0)
+            self.bytes_saved += saved
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the counters as a JSON-serializable dictionary."""
+        with self._lock:
+            return {
+                "requests": dict(self.counts),
+                "saved_by_type": dict(self.by_type),
+                "estimated_bytes_saved": self.bytes_saved,
+            }
+
+    def dump(self, profile: str, directory: str = STATS_DIR) -> str:
+        """
+        Write this worker's statistics to disk.
+
+        Args:
+            profile: Name of the active profile
+            directory: Output directory
+
+        Returns:
+            Path of the written file
+        """
+        TestUtils.create_directory(directory)
+        path = os.path.join(directory, f"stats-{EnvironmentUtils.get_worker_id()}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"profile": profile, **self.to_dict()}, f)
+        return path
+
+    @staticmethod
+    def merge(directory: str = STATS_DIR) -> Dict[str, Any]:
+        """
+        Merge the statistics files written by every worker.
+
+        Args:
+            directory: Directory containing stats-*.json files
+
+        Returns:
+            Combined statistics
+        """
+        merged: Dict[str, Any] = {
+            "requests": {"allow": 0, "block": 0, "stub": 0},
+            "saved_by_type": {},
+            "estimated_bytes_saved": 0,
+        }
+        for path in glob.glob(os.path.join(directory, "stats-*.json")):
+            stats = TestUtils.load_test_data(path)
+            merged["profile"] = stats.get("profile")
+            for key, value in stats["requests"].items():
+                merged["requests"][key] += value
+            for key, value in stats["saved_by_type"].items():
+                merged["saved_by_type"][key] = merged["saved_by_type"].get(key, 0) + value
+            merged["estimated_bytes_saved"] += stats["estimated_bytes_saved"]
+        return merged
+
+
+class NetworkRouter:
+    """Routes every request of a context through a NetworkProfile."""
+
+    def __init__(self, profile: NetworkProfile, stats: Optional[NetworkStats] = None):
+        """
+        Initialize the router.
+
+        Args:
+            profile: Profile to apply
+            stats: Shared statistics, a new instance if omitted
+        """
+        self.profile = profile
+        self.stats = stats or NetworkStats()
+
+    @classmethod
+    def from_environment(cls, stats: Optional[NetworkStats] = None) -> "NetworkRouter":
+        """
+        Create a router for the profile named by NETWORK_PROFILE.
+
+        Args:
+            stats: Shared statistics, a new instance if omitted
+
+        Returns:
+            Configured router
+
+        Raises:
+            ValueError: If the profile name is unknown
+        """
+        name = EnvironmentUtils.get_network_profile()
+        if name not in PROFILES:
+            raise ValueError(f"Unknown NETWORK_PROFILE '{name}', expected one of {list(PROFILES)}")
+        return cls(PROFILES[name], stats)
+
+    def install(self, context: Any) -> Any:
+        """
+        Install the routing handler on a browser context.
+
+        Args:
+            context: Sync or async Playwright BrowserContext
+
+        Returns:
+            Result of context.route(), awaitable for async contexts; a
+            no-op when the profile changes nothing
+        """
+        if not self.profile.is_active:
+            return _done(context)
+        return context.route("**/*", self._handle)
+
+    def _handle(self, route: Any, request: Any) -> Any:
+        """Abort, stub or pass on one request."""
+        resource_type = request.resource_type
+        decision = self.profile.decide(resource_type, request.url)
+        self.stats.record(decision, resource_type)
+        if decision == "stub":
+            return route.fulfill(status=200, content_type="image/png", body=PLACEHOLDER_PNG)
+        if decision == "block":
+            return route.abort("blockedbyclient")
+        return route.fallback()
+
+
+def _done(context: Any) -> Any:
+    """Return a no-op awaitable for async contexts, None for sync ones."""
+    if type(context).__module__.startswith("playwright.async_api"):
+        return asyncio.sleep(0)
+    return None
@@ -0,0 +1,85 @@
+"""
+Per-run store for browser-side page performance metrics.
+
+With PAGE_METRICS=true, page objects collect Navigation Timing and Web
+Vitals after every page load (see pages/performance.py) and record them
+here, tagged like the action timings. conftest attaches each test's
+records to its report and every worker writes its records to
+test-results/metrics/ at session end.
+"""
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from .action_timing import current_tags
+from .test_utils import EnvironmentUtils, TestUtils
+
+# Directory where each worker writes its metrics
+METRICS_DIR = os.path.join("test-results", "metrics")
+
+
+class PageMetricsRecorder:
+    """Collects page metrics records of one process."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            enabled: Whether page objects collect metrics
+        """
+        self.enabled = enabled
+        self.records: List[Dict[str, Any]] = []
+        self._by_test: Dict[str, List[Dict[str, Any]]] = {}
+
+    def record(self, source: str, metrics: Dict[str, Any], **extra: Any) -> Dict[str, Any]:
+        """
+        Store the metrics of one page load under the current tags.
+
+        Args:
+            source: What triggered the load, e.g. "LoginPage.login"
+            metrics: Result of pages.performance.collect()
+            **extra: Additional fields such as transition_ms
+
+        Returns:
+            The stored record
+        """
+        entry = {"source": source, **current_tags(), **extra, **metrics}
+        self.records.append(entry)
+        self._by_test.setdefault(entry["test_id"], []).append(entry)
+        return entry
+
+    def for_test(self, test_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the records of one test.
+
+        Args:
+            test_id: Test node id
+
+        Returns:
+            Records tagged with the test id
+        """
+        return list(self._by_test.get(test_id, ()))
+
+    def dump(self, directory: str = METRICS_DIR) -> Optional[str]:
+        """
+        Write this worker's records as JSON lines.
+
+        Args:
+            directory: Output directory
+
+        Returns:
+            Path of the written file, None if nothing was recorded
+        """
+        if not self.records:
+            return None
+        TestUtils.create_directory(directory)
+        path = os.path.join(directory, f"page-metrics-{EnvironmentUtils.get_worker_id()}.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for entry in self.records:
+                f.write(json.dumps(entry) + "\n")
+        return path
+
+
+# Process-wide recorder, enabled by PAGE_METRICS
+recorder = PageMetricsRecorder(EnvironmentUtils.is_page_metrics_enabled())
@@ -0,0 +1,147 @@
+"""
+Rerun of failed tests inside the same session.
+
+A failed test is run again right away on the same worker, up to "retries"
+times (from playwright.config.py unless --retries is given) and up to a
+per-process session budget. Between attempts only function-scoped fixtures
+are torn down: the attempt runs with the test's parent as "next item", so
+the launched browser, context pool and login cache stay warm. Failed
+attempts are reported with the "rerun" outcome, and a test that passes
+after a rerun is reported as flaky instead of passed.
+"""
+import os
+import runpy
+from typing import Any, Dict, Optional
+
+import pytest
+from _pytest.runner import CallInfo, runtestprotocol
+
+# playwright.config.py at the repository root
+PLAYWRIGHT_CONFIG = os.path.join(os.path.dirname(os.path.dirname(__file__)), "playwright.config.py")
+
+
+def load_playwright_config(path: str = PLAYWRIGHT_CONFIG) -> Dict[str, Any]:
+    """
+    Load the config dictionary of playwright.config.py.
+
+    Args:
+        path: Config file path
+
+    Returns:
+        The config dictionary, empty if the file does not exist
+    """
+    if not os.path.exists(path):
+        return {}
+    return runpy.run_path(path).get("config", {})
+
+
+def attempts_of(report) -> int:
+    """
+    Get the number of attempts a test needed.
+
+    Args:
+        report: Test report
+
+    Returns:
+        Attempts recorded by the rerun plugin, 1 if the test was not rerun
+    """
+    for name, value in getattr(report, "user_properties", ()):
+        if name == "attempts":
+            return int(value)
+    return 1
+
+
+class RerunPlugin:
+    """Pytest plugin rerunning failed tests with warm session fixtures."""
+
+    def __init__(self, retries: int, max_session_reruns: int):
+        """
+        Initialize the plugin.
+
+        Args:
+            retries: Reruns allowed per test
+            max_session_reruns: Reruns allowed in this process across all tests
+        """
+        self.retries = retries
+        self.max_session_reruns = max_session_reruns
+        self.session_reruns = 0
+
+    def _may_rerun(self, item, attempt: int) -> bool:
+        return (
+            attempt <= self.retries
+            and self.session_reruns < self.max_session_reruns
+            and not item.session.shouldfail
+            and not item.session.shouldstop
+        )
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem) -> Optional[bool]:
+        if self.retries <= 0:
+            return None
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        attempt = 1
+        while True:
+            may_rerun = self._may_rerun(item, attempt)
+            # Keep everything above function scope set up while a rerun is possible
+            reports = runtestprotocol(
+                item, log=False, nextitem=item.parent if may_rerun else nextitem
+            )
+            failed = any(report.failed for report in reports)
+            if failed and may_rerun:
+                self.session_reruns += 1
+                for report in reports:
+                    if report.failed:
+                        report.outcome = "rerun"
+                        item.ihook.pytest_runtest_logreport(report=report)
+                attempt += 1
+                continue
+            if may_rerun:
+                reports[-1] = self._finish_teardown(item, nextitem, reports[-1])
+            break
+        for report in reports:
+            if attempt > 1:
+                report.user_properties.append(("attempts", attempt))
+            item.ihook.pytest_runtest_logreport(report=report)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    @staticmethod
+    def _finish_teardown(item, nextitem, teardown_report):
+        """Tear down what the real next item does not need, reporting errors on the teardown."""
+        call = CallInfo.from_call(
+            lambda: item.session._setupstate.teardown_exact(nextitem), when="teardown"
+        )
+        if call.excinfo is None:
+            return teardown_report
+        return item.ihook.pytest_runtest_makereport(item=item, call=call)
+
+    def pytest_report_teststatus(self, report):
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+        if report.when == "call" and report.passed and attempts_of(report) > 1:
+            return "flaky", "K", ("FLAKY", {"yellow": True})
+        return None
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        flaky = terminalreporter.stats.get("flaky", [])
+        if not flaky:
+            return
+        terminalreporter.write_sep("=", "flaky tests (passed after rerun)", yellow=True)
+        for report in flaky:
+            terminalreporter.write_line(f"{report.nodeid} ({attempts_of(report)} attempts)")
+
+
+def retries_from_config(option: Optional[int]) -> int:
+    """
+    Get the per-test retries.
+
+    Args:
+        option: Value of --retries, None if not given
+
+    Returns:
+        The option, else "retries" of playwright.config.py, else 0
+    """
+    if option is not None:
+        return option
+    return int(load_playwright_config().get("retries", 0))
+
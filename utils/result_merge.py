@@ -0,0 +1,309 @@
+"""
+Merge JUnit XML and JSON result artifacts from the CI matrix.
+
+Every result file found under a directory is stream-parsed (iterparse for
+JUnit XML, line by line for JSONL) in a process pool, and all test cases are
+written to one CSV with test id, browser, Python version, outcome, duration
+and a normalized error signature. The combined summary for the report job
+is built in the same pass.
+
+Usage:
+    python -m utils.result_merge all-test-results \\
+        --csv merged-results.csv --summary test-execution-summary.json
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .test_utils import ResultAggregator
+
+COLUMNS = ("test_id", "browser", "python", "outcome", "duration", "error_signature", "source")
+
+BROWSERS = ("chromium", "firefox", "webkit")
+
+_PYTHON = re.compile(r"py(?:thon)?-?(\d+\.\d+)")
+_BROWSER = re.compile(r"\b(" + "|".join(BROWSERS) + r")\b")
+
+# Volatile parts of error messages replaced to group identical failures
+_VOLATILE = (
+    (re.compile(r"0x[0-9a-fA-F]+"), "0x?"),
+    (re.compile(r"\b\d+(\.\d+)?(?![\dx])"), "N"),
+    (re.compile(r"(['\"]).*?\1"), "'?'"),
+    (re.compile(r"\s+"), " "),
+)
+
+
+def error_signature(error_type: str, message: str, limit: int = 120) -> str:
+    """
+    Build a stable signature of an error for grouping failures.
+
+    Args:
+        error_type: Exception type or JUnit failure type
+        message: Error message, only its first line is used
+
+    Returns:
+        "<type>: <normalized first line>" (or just the line when the type is
+        unknown), or "" if there is no error
+    """
+    if not error_type and not message:
+        return ""
+    line = (message or "").strip().splitlines()[0] if (message or "").strip() else ""
+    for pattern, replacement in _VOLATILE:
+        line = pattern.sub(replacement, line)
+    line = line.strip()
+    return (f"{error_type}: {line}" if error_type else line)[:limit]
+
+
+def matrix_from_path(path: str) -> Tuple[str, str]:
+    """
+    Derive browser and Python version from an artifact path.
+
+    Args:
+        path: Result file path, e.g. .../test-results-firefox-py3.10/junit-firefox-py3.10.xml
+
+    Returns:
+        (browser, python) with empty strings when unknown
+    """
+    lowered = path.lower().replace("_", "-")
+    browser = _BROWSER.search(lowered)
+    python = _PYTHON.search(lowered)
+    return (browser.group(1) if browser else "", python.group(1) if python else "")
+
+
+def _browser_from_test_id(test_id: str, default: str) -> str:
+    """Use the pytest-playwright browser parameter of a test id if present."""
+    match = re.search(r"\[(?:.*-)?(" + "|".join(BROWSERS) + r")(?:-.*)?\]$", test_id)
+    return match.group(1) if match else default
+
+
+def iter_junit(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the test cases of a JUnit XML file.
+
+    Args:
+        path: JUnit XML file
+
+    Yields:
+        One row per test case
+    """
+    browser, python = matrix_from_path(path)
+    for _, element in ET.iterparse(path, events=("end",)):
+        if element.tag != "testcase":
+            continue
+        classname = element.get("classname", "")
+        name = element.get("name", "")
+        test_id = f"{classname}::{name}" if classname else name
+        outcome, signature = "passed", ""
+        for child in element:
+            if child.tag in ("failure", "error"):
+                outcome = "failed" if child.tag == "failure" else "error"
+                signature = error_signature(
+                    child.get("type", ""), child.get("message") or child.text or ""
+                )
+                break
+            if child.tag == "skipped":
+                outcome = "skipped"
+                break
+        yield {
+            "test_id": test_id,
+            "browser": _browser_from_test_id(name, browser),
+            "python": python,
+            "outcome": outcome,
+            "duration": float(element.get("time") or 0),
+            "error_signature": signature,
+            "source": path,
+        }
+        element.clear()
+
+
+def iter_json_results(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the results of a JSONL result stream (see ResultAggregator).
+
+    Args:
+        path: .jsonl file with one result per line
+
+    Yields:
+        One row per result
+    """
+    browser, python = matrix_from_path(path)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            test_id = result.get("nodeid") or result.get("test_id") or result.get("name", "")
+            yield {
+                "test_id": test_id,
+                "browser": result.get("browser") or _browser_from_test_id(test_id, browser),
+                "python": result.get("python") or python,
+                "outcome": result.get("status", "unknown"),
+                "duration": float(result.get("duration") or 0),
+                "error_signature": error_signature(
+                    result.get("error_type", ""), result.get("error", "")
+                ),
+                "source": path,
+            }
+
+
+def is_junit_file(path: str) -> bool:
+    """
+    Check whether an XML file is a JUnit report.
+
+    Args:
+        path: XML file path
+
+    Returns:
+        True if the root element is <testsuites> or <testsuite>
+    """
+    try:
+        for _, element in ET.iterparse(path, events=("start",)):
+            return element.tag in ("testsuites", "testsuite")
+    except (OSError, ET.ParseError):
+        pass
+    return False
+
+
+def find_result_files(root: str) -> List[str]:
+    """
+    Find JUnit XML and JSONL result files below a directory.
+
+    Artifacts are the direct subdirectories of root. An artifact with JUnit
+    XML also contains the same tests in results.jsonl, so its JSONL files
+    are skipped.
+
+    Args:
+        root: Directory holding the downloaded artifacts
+
+    Returns:
+        Sorted file paths
+    """
+    artifacts: Dict[str, Dict[str, List[str]]] = {}
+    for directory, _, files in os.walk(root):
+        relative = os.path.relpath(directory, root)
+        artifact = relative.split(os.sep)[0]
+        found = artifacts.setdefault(artifact, {"xml": [], "jsonl": []})
+        for name in files:
+            path = os.path.join(directory, name)
+            if name.endswith(".xml") and is_junit_file(path):
+                found["xml"].append(path)
+            elif name.endswith(".jsonl") and name.startswith("results"):
+                found["jsonl"].append(path)
+    return sorted(
+        path for found in artifacts.values() for path in (found["xml"] or found["jsonl"])
+    )
+
+
+def find_report_files(root: str) -> List[str]:
+    """
+    Find the HTML reports below a directory.
+
+    Args:
+        root: Directory holding the downloaded artifacts
+
+    Returns:
+        Sorted file paths
+    """
+    return sorted(
+        os.path.join(directory, name)
+        for directory, _, files in os.walk(root) for name in files if name.endswith(".html")
+    )
+
+
+def _parse_file(path: str) -> List[Tuple]:
+    """Parse one result file into compact row tuples (runs in a worker process)."""
+    rows = iter_junit(path) if path.endswith(".xml") else iter_json_results(path)
+    try:
+        return [tuple(row[column] for column in COLUMNS) for row in rows]
+    except ET.ParseError:
+        return []
+
+
+def merge_results(paths: Sequence[str], csv_path: str, jobs: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Merge result files into one CSV and summarize them.
+
+    Args:
+        paths: Result files to merge
+        csv_path: Output CSV path
+        jobs: Worker processes, defaults to the CPU count
+
+    Returns:
+        Combined summary
+    """
+    aggregator = ResultAggregator()
+    by_matrix: Dict[str, Counter] = {}
+    errors: Counter = Counter()
+    outcomes_by_test: Dict[str, set] = {}
+
+    directory = os.path.dirname(csv_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(csv_path, "w", newline="", encoding="utf-8") as f, \
+            ProcessPoolExecutor(max_workers=jobs) as pool:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for rows in pool.map(_parse_file, paths, chunksize=8):
+            writer.writerows(rows)
+            for test_id, browser, python, outcome, duration, signature, _ in rows:
+                aggregator.add({"status": outcome, "duration": duration})
+                key = f"{browser or 'unknown'}-py{python or '?'}"
+                by_matrix.setdefault(key, Counter())[outcome] += 1
+                if signature:
+                    errors[signature] += 1
+                outcomes_by_test.setdefault(f"{test_id}|{browser}", set()).add(outcome)
+
+    summary = aggregator.summary()
+    summary.pop("results_file", None)
+    summary.update({
+        "artifacts_parsed": len(paths),
+        "artifacts_generated": list(paths),
+        "results_csv": csv_path,
+        "by_matrix": {key: dict(counts) for key, counts in sorted(by_matrix.items())},
+        "top_errors": [{"signature": s, "count": c} for s, c in errors.most_common(10)],
+        "inconsistent_tests": sorted(
+            key.split("|")[0] for key, outcomes in outcomes_by_test.items()
+            if "passed" in outcomes and outcomes & {"failed", "error"}
+        ),
+    })
+    return summary
+
+
+def main() -> None:
+    """Parse arguments, merge the artifacts and write the summary."""
+    parser = argparse.ArgumentParser(description="Merge JUnit/JSON results into one CSV")
+    parser.add_argument("root", help="Directory with downloaded result artifacts")
+    parser.add_argument("--csv", default="merged-results.csv", help="Output CSV path")
+    parser.add_argument("--summary", default="test-execution-summary.json", help="Summary JSON path")
+    parser.add_argument("--jobs", type=int, default=None, help="Parser processes")
+    parser.add_argument(
+        "--meta", action="append", default=[], metavar="KEY=VALUE",
+        help="Extra field for the summary (repeatable)"
+    )
+    args = parser.parse_args()
+
+    paths = find_result_files(args.root)
+    summary = {
+        "execution_time": datetime.now().isoformat(),
+        **dict(item.split("=", 1) for item in args.meta),
+        **merge_results(paths, args.csv, args.jobs),
+    }
+    # The per-job HTML reports are listed with the parsed result files
+    summary["artifacts_generated"] = sorted(paths + find_report_files(args.root))
+    with open(args.summary, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+    print("Test Execution Summary Generated")
+    print(f"Artifacts parsed: {summary['artifacts_parsed']}, tests: {summary['total_tests']}, "
+          f"pass rate: {summary['pass_rate']:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
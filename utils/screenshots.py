@@ -0,0 +1,143 @@
+"""
+Screenshot capture pipeline.
+
+The browser encodes the image (PNG, or JPEG with a quality setting), so
+capture only waits for the screenshot bytes. Hashing is cheap and done
+inline to deduplicate identical frames; disk writes run on a background
+thread, so a capture returns as soon as the bytes arrive. Names combine the
+test name, status, a microsecond timestamp, the xdist worker and a
+per-process counter, so they never collide across workers.
+"""
+import atexit
+import hashlib
+import inspect
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .test_utils import EnvironmentUtils, TestUtils
+
+SCREENSHOT_DIR = "test-results/screenshots"
+
+EXTENSIONS = {"png": "png", "jpeg": "jpg"}
+
+
+class ScreenshotWriter:
+    """Deduplicates screenshot bytes and writes them in the background."""
+
+    def __init__(self, directory: str = SCREENSHOT_DIR):
+        """
+        Initialize the writer.
+
+        Args:
+            directory: Output directory, created on the first write
+        """
+        self.directory = directory
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        self._paths: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, data: bytes, name: str, status: str = "capture",
+               image_type: str = "png") -> str:
+        """
+        Queue screenshot bytes for writing.
+
+        Args:
+            data: Encoded image bytes
+            name: Test or screenshot name
+            status: Status part of the file name (failure, success, ...)
+            image_type: "png" or "jpeg"
+
+        Returns:
+            Path the image is (or will be) written to. Identical bytes
+            return the path of the first copy.
+        """
+        digest = hashlib.sha1(data).hexdigest()
+        with self._lock:
+            existing = self._paths.get(digest)
+            if existing is not None:
+                return existing
+            path = os.path.join(self.directory, TestUtils.generate_screenshot_name(
+                name, status, EXTENSIONS[image_type]
+            ))
+            self._paths[digest] = path
+        self.write_file(path, data)
+        return path
+
+    def write_file(self, path: str, data: bytes) -> None:
+        """
+        Queue bytes for writing to a path, creating its directory.
+
+        Args:
+            path: Output file path
+            data: File content
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(1, thread_name_prefix="screenshots")
+                atexit.register(self.flush)
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(self._executor.submit(self._write, path, data))
+
+    @staticmethod
+    def _write(path: str, data: bytes) -> None:
+        TestUtils.create_directory(os.path.dirname(path) or ".")
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def capture(self, page: Any, name: str, status: str = "capture",
+                image_type: str = "png", quality: Optional[int] = None,
+                full_page: bool = False, clip: Optional[Dict[str, float]] = None) -> Any:
+        """
+        Take a screenshot of a page and queue it for writing.
+
+        Works with sync and async pages: with an async page the returned
+        awaitable resolves to the path.
+
+        Args:
+            page: Playwright page (sync or async)
+            name: Test or screenshot name
+            status: Status part of the file name
+            image_type: "png" or "jpeg"
+            quality: JPEG quality 0-100, ignored for PNG
+            full_page: Capture the full scrollable page instead of the viewport
+            clip: Region to capture, {"x", "y", "width", "height"}
+
+        Returns:
+            Path of the screenshot, or an awaitable of it for async pages
+        """
+        options: Dict[str, Any] = {"type": image_type, "full_page": full_page}
+        if image_type == "jpeg" and quality is not None:
+            options["quality"] = quality
+        if clip is not None:
+            options["clip"] = clip
+        data = page.screenshot(**options)
+        if inspect.isawaitable(data):
+            async def finish() -> str:
+                return self.submit(await data, name, status, image_type)
+            return finish()
+        return self.submit(data, name, status, image_type)
+
+    def flush(self) -> None:
+        """Block until every queued screenshot is on disk."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+
+# Process-wide writer
+screenshots = ScreenshotWriter()
+
+
+def capture_settings() -> Dict[str, Any]:
+    """
+    Get the capture options for screenshots taken on test failure.
+
+    Returns:
+        Keyword arguments for ScreenshotWriter.capture
+    """
+    settings = EnvironmentUtils.get_screenshot_settings()
+    return {key: settings[key] for key in ("image_type", "quality", "full_page")}
@@ -0,0 +1,191 @@
+"""
+Deterministic test sharding across CI jobs.
+
+With --shard=i/n each job keeps only its part of the collected tests. Every
+job computes the same partition: tests are ordered by estimated duration
+(from the duration history) with a stable hash of the node id breaking
+ties, then each test goes to the shard with the least estimated time so
+far. Without history all estimates are equal and the tests are spread by
+hash. Parametrized cases are separate tests and may land on different
+shards. All jobs must see the same history file to agree on the partition.
+
+Verify that the shards cover the suite exactly once with:
+    python -m utils.sharding verify 4 -- --browser=chromium
+"""
+import argparse
+import hashlib
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import pytest
+
+from .duration_scheduler import DurationHistory
+
+# Smallest estimate used for balancing, about the cost of the fastest test;
+# recorded ~0s durations (skips, instant failures) would otherwise never
+# grow a shard's load
+MIN_ESTIMATE = 0.1
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification.
+
+    Args:
+        value: "i/n" with 1 <= i <= n
+
+    Returns:
+        (index, count), index starting at 1
+
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected i/n such as 1/4") from None
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{value}', index must be between 1 and {max(count, 1)}")
+    return index, count
+
+
+def stable_hash(nodeid: str) -> int:
+    """
+    Hash a node id identically in every process and on every machine.
+
+    Args:
+        nodeid: Test node id
+
+    Returns:
+        Unsigned 64-bit hash
+    """
+    return int.from_bytes(hashlib.sha1(nodeid.encode("utf-8")).digest()[:8], "big")
+
+
+def assign_shards(nodeids: Sequence[str], count: int,
+                  history: Optional[DurationHistory] = None) -> Dict[str, int]:
+    """
+    Partition tests into shards of about equal estimated duration.
+
+    Args:
+        nodeids: Collected test node ids
+        count: Number of shards
+        history: Duration history for estimates, equal weights if omitted
+
+    Returns:
+        Shard index (starting at 1) for every node id
+    """
+    def estimate(nodeid: str) -> float:
+        # Rounded so float noise cannot reorder tests between machines
+        if history is None:
+            return 1.0
+        return max(round(history.estimate(nodeid), 3), MIN_ESTIMATE)
+
+    ordered = sorted(set(nodeids), key=lambda nodeid: (-estimate(nodeid), stable_hash(nodeid)))
+    loads = [0.0] * count
+    shards = {}
+    for nodeid in ordered:
+        shard = loads.index(min(loads))
+        loads[shard] += estimate(nodeid)
+        shards[nodeid] = shard + 1
+    return shards
+
+
+class ShardPlugin:
+    """Pytest plugin deselecting the tests of other shards."""
+
+    def __init__(self, index: int, count: int, history: DurationHistory):
+        """
+        Initialize the plugin.
+
+        Args:
+            index: This job's shard, starting at 1
+            count: Number of shards
+            history: Duration history used for balancing
+        """
+        self.index = index
+        self.count = count
+        self.history = history
+        self.estimate = 0.0
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items) -> None:
+        shards = assign_shards([item.nodeid for item in items], self.count, self.history)
+        selected, deselected = [], []
+        for item in items:
+            (selected if shards[item.nodeid] == self.index else deselected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+        self.estimate = sum(self.history.estimate(item.nodeid) for item in selected)
+
+    def pytest_report_collectionfinish(self, config, items) -> str:
+        return f"shard {self.index}/{self.count}: {len(items)} tests, ~{self.estimate:.0f}s estimated"
+
+
+def collect_nodeids(pytest_args: Sequence[str]) -> Set[str]:
+    """
+    Collect test node ids in a pytest subprocess.
+
+    Args:
+        pytest_args: Extra pytest arguments
+
+    Returns:
+        Collected node ids
+
+    Raises:
+        RuntimeError: If collection fails
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *pytest_args],
+        capture_output=True, text=True
+    )
+    if result.returncode not in (0, 5):
+        raise RuntimeError(f"Collection failed for {list(pytest_args)}:\n{result.stdout}{result.stderr}")
+    return {line.strip() for line in result.stdout.splitlines() if "::" in line}
+
+
+def verify_shards(count: int, pytest_args: Sequence[str] = ()) -> List[str]:
+    """
+    Check that the shards are disjoint and together equal the full suite.
+
+    Args:
+        count: Number of shards
+        pytest_args: Extra pytest arguments used for every collection
+
+    Returns:
+        Problems found, empty if the partition is exact
+    """
+    full = collect_nodeids(pytest_args)
+    seen: Dict[str, int] = {}
+    problems = []
+    for index in range(1, count + 1):
+        for nodeid in collect_nodeids([f"--shard={index}/{count}", *pytest_args]):
+            if nodeid in seen:
+                problems.append(f"{nodeid} is in shards {seen[nodeid]} and {index}")
+            seen[nodeid] = index
+    problems += [f"{nodeid} is in no shard" for nodeid in sorted(full - set(seen))]
+    problems += [f"{nodeid} is not in the full suite" for nodeid in sorted(set(seen) - full)]
+    return problems
+
+
+def main() -> None:
+    """Verify a shard count from the command line."""
+    parser = argparse.ArgumentParser(description="Verify that --shard partitions the suite exactly")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    verify = subparsers.add_parser("verify", help="Collect every shard and compare with the full suite")
+    verify.add_argument("count", type=int, help="Number of shards")
+    verify.add_argument("pytest_args", nargs="*", help="Extra pytest arguments (after --)")
+    args = parser.parse_args()
+
+    problems = verify_shards(args.count, args.pytest_args)
+    for problem in problems:
+        print(problem)
+    if problems:
+        sys.exit(1)
+    print(f"{args.count} shards cover the suite exactly once")
+
+
+if __name__ == "__main__":
+    main()
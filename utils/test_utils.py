@@ -1,12 +1,22 @@
 """
 Utility functions for test automation.
 """
+import asyncio
+import inspect
+import itertools
 import os
 import json
+import math
+import random
+import threading
+import time
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, IO
 from pathlib import Path
 
+# Per-process sequence number for unique screenshot names
+_screenshot_sequence = itertools.count()
+
 
 class TestUtils:
     """Utility class containing helper methods for test automation."""
@@ -32,13 +42,15 @@ class TestUtils:
         Path(path).mkdir(parents=True, exist_ok=True)
     
     @staticmethod
-    def save_test_results(results: Dict[str, Any], filename: str = None) -> str:
+    def save_test_results(results: Dict[str, Any], filename: str = None,
+                          indent: Optional[int] = 2) -> str:
         """
         Save test results to JSON file.
         
         Args:
             results: Test results dictionary
             filename: Optional filename, if not provided uses timestamp
+            indent: JSON indentation, None for compact output
             
         Returns:
             Path to saved file
@@ -52,7 +64,7 @@ class TestUtils:
         filepath = os.path.join(results_dir, filename)
         
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+            json.dump(results, f, indent=indent, ensure_ascii=False)
         
         return filepath
     
@@ -71,20 +83,26 @@ class TestUtils:
             return json.load(f)
     
     @staticmethod
-    def generate_screenshot_name(test_name: str, status: str = "failure") -> str:
+    def generate_screenshot_name(test_name: str, status: str = "failure",
+                                 extension: str = "png") -> str:
         """
         Generate screenshot filename.
         
+        Names include a microsecond timestamp, the xdist worker id and a
+        per-process sequence number, so they are unique across workers.
+        
         Args:
             test_name: Name of the test
             status: Status of the test (failure, success, etc.)
+            extension: File extension without the dot
             
         Returns:
             Screenshot filename
         """
-        timestamp = TestUtils.get_timestamp()
-        clean_test_name = test_name.replace(" ", "_").replace("/", "_")
-        return f"{clean_test_name}_{status}_{timestamp}.png"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        clean_test_name = TestUtils.sanitize_filename(test_name.replace(" ", "_"))
+        worker_id = EnvironmentUtils.get_worker_id()
+        return f"{clean_test_name}_{status}_{timestamp}_{worker_id}_{next(_screenshot_sequence)}.{extension}"
     
     @staticmethod
     def sanitize_filename(filename: str) -> str:
@@ -116,27 +134,134 @@ class TestUtils:
         return float(price_str.replace('$', ''))
     
     @staticmethod
-    def wait_for_condition(condition_func, timeout: int = 5000, interval: int = 100) -> bool:
+    def wait_for_condition(condition_func: Callable[[], Any], timeout: int = 5000,
+                           interval: int = 100, backoff: float = 1.5,
+                           max_interval: int = 1000, jitter: float = 0.1,
+                           cancel_event: Optional[threading.Event] = None) -> "WaitResult":
         """
         Wait for a condition to be true with polling.
         
+        The polling interval grows by the backoff factor up to max_interval,
+        with random jitter so concurrent waiters don't poll in lockstep. Do
+        not call this from a coroutine, use wait_for_condition_async there.
+        
         Args:
-            condition_func: Function that returns boolean
+            condition_func: Function that returns a truthy value when done
             timeout: Maximum wait time in milliseconds
-            interval: Polling interval in milliseconds
+            interval: Initial polling interval in milliseconds
+            backoff: Factor applied to the interval after each attempt
+            max_interval: Upper bound of the polling interval in milliseconds
+            jitter: Fraction of the interval added or removed at random
+            cancel_event: Event that stops the wait early when set
             
         Returns:
-            True if condition met, False if timeout
+            WaitResult, truthy if the condition was met
+        """
+        start = time.monotonic()
+        deadline = start + timeout / 1000
+        attempts = 0
+        for delay in _poll_delays(interval, backoff, max_interval, jitter):
+            attempts += 1
+            value = condition_func()
+            if value:
+                return WaitResult(True, attempts, start, value=value)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            delay = min(delay, remaining)
+            if cancel_event is not None:
+                if cancel_event.wait(delay):
+                    return WaitResult(False, attempts, start, cancelled=True)
+            else:
+                time.sleep(delay)
+        return WaitResult(False, attempts, start)
+    
+    @staticmethod
+    async def wait_for_condition_async(condition_func: Callable[[], Any], timeout: int = 5000,
+                                       interval: int = 100, backoff: float = 1.5,
+                                       max_interval: int = 1000, jitter: float = 0.1,
+                                       cancel_event: Optional[asyncio.Event] = None) -> "WaitResult":
         """
-        import asyncio
-        import time
+        Wait for a condition to be true without blocking the event loop.
         
-        start_time = time.time()
-        while (time.time() - start_time) * 1000 < timeout:
-            if condition_func():
-                return True
-            time.sleep(interval / 1000)
-        return False
+        Same polling as wait_for_condition, but sleeps with asyncio so other
+        coroutines keep running. The condition may be a coroutine function
+        or return an awaitable. Cancelling the waiting task propagates
+        CancelledError as usual.
+        
+        Args:
+            condition_func: Function returning a truthy value (or an awaitable of one) when done
+            timeout: Maximum wait time in milliseconds
+            interval: Initial polling interval in milliseconds
+            backoff: Factor applied to the interval after each attempt
+            max_interval: Upper bound of the polling interval in milliseconds
+            jitter: Fraction of the interval added or removed at random
+            cancel_event: Event that stops the wait early when set
+            
+        Returns:
+            WaitResult, truthy if the condition was met
+        """
+        start = time.monotonic()
+        deadline = start + timeout / 1000
+        attempts = 0
+        for delay in _poll_delays(interval, backoff, max_interval, jitter):
+            attempts += 1
+            value = condition_func()
+            if inspect.isawaitable(value):
+                value = await value
+            if value:
+                return WaitResult(True, attempts, start, value=value)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            delay = min(delay, remaining)
+            if cancel_event is not None:
+                try:
+                    await asyncio.wait_for(cancel_event.wait(), delay)
+                    return WaitResult(False, attempts, start, cancelled=True)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(delay)
+        return WaitResult(False, attempts, start)
+
+
+def _poll_delays(interval: int, backoff: float, max_interval: int, jitter: float) -> Iterator[float]:
+    """Yield polling delays in seconds: exponential backoff with jitter, capped."""
+    current = float(interval)
+    while True:
+        spread = current * jitter
+        yield max(0.0, current + random.uniform(-spread, spread)) / 1000
+        current = min(current * backoff, float(max_interval))
+
+
+class WaitResult:
+    """Outcome of a wait, truthy if the condition was met."""
+    
+    def __init__(self, success: bool, attempts: int, start: float,
+                 value: Any = None, cancelled: bool = False):
+        """
+        Initialize the result.
+        
+        Args:
+            success: Whether the condition was met
+            attempts: Number of times the condition was evaluated
+            start: time.monotonic() when the wait began
+            value: Last truthy value returned by the condition
+            cancelled: Whether the wait was cancelled
+        """
+        self.success = success
+        self.attempts = attempts
+        self.elapsed_ms = (time.monotonic() - start) * 1000
+        self.value = value
+        self.cancelled = cancelled
+    
+    def __bool__(self) -> bool:
+        return self.success
+    
+    def __repr__(self) -> str:
+        state = "cancelled" if self.cancelled else ("met" if self.success else "timed out")
+        return f"WaitResult({state}, attempts={self.attempts}, elapsed_ms={self.elapsed_ms:.1f})"
 
 
 class EnvironmentUtils:
@@ -180,12 +305,226 @@ class EnvironmentUtils:
     def get_base_url() -> str:
         """
         Get base URL for testing.
-        
+
+        When the local stand-in server is enabled, its address takes
+        precedence over BASE_URL.
+
         Returns:
             Base URL for the application
         """
-        return EnvironmentUtils.get_env_var('BASE_URL', 'https://www.saucedemo.com')
+        if EnvironmentUtils.is_local_server_enabled():
+            return EnvironmentUtils.get_local_server_url()
+        return EnvironmentUtils.get_env_var('BASE_URL', 'https://www.saucedemo.com').rstrip('/')
+
+    @staticmethod
+    def get_worker_id() -> str:
+        """
+        Get the pytest-xdist worker id of the current process.
+
+        Returns:
+            Worker id (gw0, gw1, ...) or "master" when not running under xdist
+        """
+        return EnvironmentUtils.get_env_var('PYTEST_XDIST_WORKER', 'master')
+
+    @staticmethod
+    def is_local_server_enabled() -> bool:
+        """
+        Check if tests should run against the bundled stand-in server.
+
+        Returns:
+            True if LOCAL_SERVER is enabled, False otherwise
+        """
+        return EnvironmentUtils.get_env_var('LOCAL_SERVER', 'false').lower() == 'true'
+
+    @staticmethod
+    def get_local_server_port() -> int:
+        """
+        Get the stand-in server port for the current process.
+
+        Each xdist worker gets its own port (base port + worker index) so
+        workers never share a server.
+
+        Returns:
+            TCP port number
+        """
+        port = int(EnvironmentUtils.get_env_var('LOCAL_SERVER_PORT', '8765'))
+        worker_id = EnvironmentUtils.get_worker_id()
+        if worker_id.startswith('gw'):
+            port += int(worker_id[2:]) + 1
+        return port
+
+    @staticmethod
+    def get_local_server_url() -> str:
+        """
+        Get the stand-in server base URL for the current process.
+
+        Returns:
+            Base URL of the local server
+        """
+        return f"http://127.0.0.1:{EnvironmentUtils.get_local_server_port()}"
+
+    @staticmethod
+    def get_local_server_faults() -> Dict[str, Any]:
+        """
+        Get latency and fault injection settings for the stand-in server.
+
+        Returns:
+            Keyword arguments for the server's FaultConfig
+        """
+        get = EnvironmentUtils.get_env_var
+        return {
+            'latency_ms': int(get('LOCAL_SERVER_LATENCY_MS', '0')),
+            'jitter_ms': int(get('LOCAL_SERVER_JITTER_MS', '0')),
+            'error_rate': float(get('LOCAL_SERVER_ERROR_RATE', '0')),
+            'error_status': int(get('LOCAL_SERVER_ERROR_STATUS', '500')),
+            'paths': [p for p in get('LOCAL_SERVER_FAULT_PATHS', '').split(',') if p],
+            'glitch_delay_ms': int(get('LOCAL_SERVER_GLITCH_MS', '2500')),
+        }
     
+    @staticmethod
+    def is_context_pool_enabled() -> bool:
+        """
+        Check if tests should draw pages from the warm context pool.
+
+        Returns:
+            True if CONTEXT_POOL is enabled, False otherwise
+        """
+        return EnvironmentUtils.get_env_var('CONTEXT_POOL', 'false').lower() == 'true'
+
+    @staticmethod
+    def get_context_pool_settings() -> Dict[str, int]:
+        """
+        Get the context pool size and recycling limits.
+
+        Returns:
+            Keyword arguments for ContextPool
+        """
+        get = EnvironmentUtils.get_env_var
+        return {
+            'max_size': int(get('CONTEXT_POOL_SIZE', '2')),
+            'max_uses': int(get('CONTEXT_POOL_MAX_USES', '50')),
+            'max_heap_mb': int(get('CONTEXT_POOL_MAX_HEAP_MB', '200')),
+        }
+
+    @staticmethod
+    def get_network_profile() -> str:
+        """
+        Get the name of the resource-blocking network profile.
+
+        Returns:
+            Profile name (off, trackers, lean, stub)
+        """
+        return EnvironmentUtils.get_env_var('NETWORK_PROFILE', 'off').lower()
+
+    @staticmethod
+    def get_har_mode() -> str:
+        """
+        Get the HAR record-and-replay mode.
+
+        Returns:
+            Mode name (off, record, replay, strict, update)
+        """
+        return EnvironmentUtils.get_env_var('HAR_MODE', 'off').lower()
+
+    @staticmethod
+    def get_har_dir() -> str:
+        """
+        Get the directory holding HAR archives.
+
+        Returns:
+            Directory path
+        """
+        return EnvironmentUtils.get_env_var('HAR_DIR', 'hars')
+
+    @staticmethod
+    def is_action_timing_enabled() -> bool:
+        """
+        Check if page object actions should be timed.
+
+        Returns:
+            True if ACTION_TIMING is enabled, False otherwise
+        """
+        return EnvironmentUtils.get_env_var('ACTION_TIMING', 'false').lower() == 'true'
+
+    @staticmethod
+    def is_page_metrics_enabled() -> bool:
+        """
+        Check if page objects should collect browser performance metrics.
+
+        Returns:
+            True if PAGE_METRICS is enabled, False otherwise
+        """
+        return EnvironmentUtils.get_env_var('PAGE_METRICS', 'false').lower() == 'true'
+
+    @staticmethod
+    def is_benchmark_enabled() -> bool:
+        """
+        Check if the latency benchmark suite should run.
+
+        Returns:
+            True if BENCHMARK is enabled, False otherwise
+        """
+        return EnvironmentUtils.get_env_var('BENCHMARK', 'false').lower() == 'true'
+
+    @staticmethod
+    def get_benchmark_settings() -> Dict[str, Any]:
+        """
+        Get benchmark repetitions, regression budget and baseline location.
+
+        Returns:
+            Benchmark settings dictionary
+        """
+        get = EnvironmentUtils.get_env_var
+        return {
+            'iterations': int(get('BENCHMARK_ITERATIONS', '12')),
+            'warmup': int(get('BENCHMARK_WARMUP', '2')),
+            'budget': float(get('BENCHMARK_BUDGET', '0.2')),
+            'alpha': float(get('BENCHMARK_ALPHA', '0.05')),
+            'baseline_dir': get('BENCHMARK_BASELINE_DIR', 'benchmarks'),
+            'update_baseline': get('BENCHMARK_UPDATE_BASELINE', 'false').lower() == 'true',
+        }
+
+    @staticmethod
+    def get_screenshot_settings() -> Dict[str, Any]:
+        """
+        Get the screenshot capture settings.
+
+        Returns:
+            Settings dictionary: on_failure, image_type, quality, full_page
+        """
+        get = EnvironmentUtils.get_env_var
+        image_type = get('SCREENSHOT_TYPE', 'jpeg').lower()
+        return {
+            'on_failure': get('SCREENSHOT_ON_FAILURE', 'true').lower() == 'true',
+            'image_type': 'png' if image_type == 'png' else 'jpeg',
+            'quality': int(get('SCREENSHOT_QUALITY', '70')),
+            'full_page': get('SCREENSHOT_FULL_PAGE', 'false').lower() == 'true',
+        }
+
+    @staticmethod
+    def get_failure_capture_settings() -> Dict[str, Any]:
+        """
+        Get the trace and screencast capture settings for failing tests.
+
+        Returns:
+            Settings dictionary: trace, screencast_seconds
+        """
+        get = EnvironmentUtils.get_env_var
+        return {
+            'trace': get('FAILURE_TRACE', 'false').lower() == 'true',
+            'screencast_seconds': float(get('FAILURE_SCREENCAST_SECONDS', '0')),
+        }
+
+    @staticmethod
+    def get_log_format() -> str:
+        """
+        Get the log output format.
+
+        Returns:
+            "text", "jsonl" or "both"
+        """
+        return EnvironmentUtils.get_env_var('LOG_FORMAT', 'both').lower()
+
     @staticmethod
     def get_timeout() -> int:
         """
@@ -201,30 +540,26 @@ class ReportUtils:
     """Utility class for test reporting functionality."""
     
     @staticmethod
-    def generate_test_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate_test_summary(results: Iterable[Dict[str, Any]],
+                              include_results: bool = True) -> Dict[str, Any]:
         """
         Generate test execution summary.
         
         Args:
-            results: List of test result dictionaries
+            results: Test result dictionaries
+            include_results: Embed the raw results in the summary
             
         Returns:
             Summary dictionary with statistics
         """
-        total_tests = len(results)
-        passed_tests = len([r for r in results if r.get('status') == 'passed'])
-        failed_tests = len([r for r in results if r.get('status') == 'failed'])
-        skipped_tests = len([r for r in results if r.get('status') == 'skipped'])
-        
-        return {
-            'total_tests': total_tests,
-            'passed_tests': passed_tests,
-            'failed_tests': failed_tests,
-            'skipped_tests': skipped_tests,
-            'pass_rate': (passed_tests / total_tests * 100) if total_tests > 0 else 0,
-            'execution_time': datetime.now().isoformat(),
-            'results': results
-        }
+        results = list(results) if include_results else results
+        aggregator = ResultAggregator()
+        for result in results:
+            aggregator.add(result)
+        summary = aggregator.summary()
+        if include_results:
+            summary['results'] = results
+        return summary
     
     @staticmethod
     def create_html_report(summary: Dict[str, Any], output_path: str = "test_report.html") -> str:
@@ -272,4 +607,122 @@ class ReportUtils:
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html_template)
         
-        return output_path
\ No newline at end of file
+        return output_path
+
+
+class ResultAggregator:
+    """
+    Incremental test result aggregation in constant memory.
+    
+    Results are appended to an optional JSONL file as they finish while
+    status counters and duration statistics are updated in one pass, so a
+    summary never needs the full result list in memory.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the aggregator.
+        
+        Args:
+            path: Optional JSONL file the results are appended to
+        """
+        self.path = path
+        self._file: Optional[IO[str]] = None
+        self.total = 0
+        self.status_counts: Dict[str, int] = {}
+        self.duration_count = 0
+        self.duration_total = 0.0
+        self.duration_min: Optional[float] = None
+        self.duration_max: Optional[float] = None
+        self._duration_mean = 0.0
+        self._duration_m2 = 0.0
+    
+    def add(self, result: Dict[str, Any]) -> None:
+        """
+        Add one finished result.
+        
+        Args:
+            result: Result dictionary with 'status' and optional 'duration' (seconds)
+        """
+        if self.path:
+            if self._file is None:
+                TestUtils.create_directory(os.path.dirname(self.path) or ".")
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(json.dumps(result, separators=(',', ':'), ensure_ascii=False) + '\n')
+        
+        self.total += 1
+        status = result.get('status', 'unknown')
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        
+        duration = result.get('duration')
+        if duration is None:
+            return
+        # Welford's online mean and variance
+        self.duration_count += 1
+        self.duration_total += duration
+        delta = duration - self._duration_mean
+        self._duration_mean += delta / self.duration_count
+        self._duration_m2 += delta * (duration - self._duration_mean)
+        self.duration_min = duration if self.duration_min is None else min(self.duration_min, duration)
+        self.duration_max = duration if self.duration_max is None else max(self.duration_max, duration)
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get the summary of every result added so far.
+        
+        Returns:
+            Summary dictionary with statistics
+        """
+        passed_tests = self.status_counts.get('passed', 0)
+        # Flaky tests passed on a rerun, so they count towards the pass rate
+        flaky_tests = self.status_counts.get('flaky', 0)
+        count = self.duration_count
+        return {
+            'total_tests': self.total,
+            'passed_tests': passed_tests,
+            'failed_tests': self.status_counts.get('failed', 0),
+            'skipped_tests': self.status_counts.get('skipped', 0),
+            'flaky_tests': flaky_tests,
+            'status_counts': dict(self.status_counts),
+            'pass_rate': ((passed_tests + flaky_tests) / self.total * 100) if self.total > 0 else 0,
+            'duration': {
+                'total': round(self.duration_total, 3),
+                'mean': round(self._duration_mean, 3) if count else 0,
+                'stdev': round(math.sqrt(self._duration_m2 / (count - 1)), 3) if count > 1 else 0,
+                'min': self.duration_min,
+                'max': self.duration_max,
+            },
+            'execution_time': datetime.now().isoformat(),
+            'results_file': self.path,
+        }
+    
+    def close(self) -> None:
+        """Flush and close the results file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self) -> "ResultAggregator":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    @classmethod
+    def from_file(cls, path: str) -> "ResultAggregator":
+        """
+        Aggregate an existing JSONL results file line by line.
+        
+        Args:
+            path: JSONL results file
+            
+        Returns:
+            Aggregator holding the statistics of the file (not appending to it)
+        """
+        aggregator = cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    aggregator.add(json.loads(line))
+        aggregator.path = path
+        return aggregator